@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sequential vs concurrent boosted creature/boss fetching
+
+Starts a local stub of the TibiaData endpoints with injected latency and
+compares awaiting the two endpoints one after the other (the old behaviour)
+with TibiaAPI.get_boosted_creatures, which fetches them concurrently.
+
+Usage:
+    python benchmarks/bench_boosted_fetch.py [--latency 0.25] [--rounds 10]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from bot.tibia_api import TibiaAPI  # noqa: E402
+
+CREATURES_PAYLOAD = {
+    'creatures': {
+        'boosted': {'name': 'Demon', 'race': 'demon', 'image_url': '', 'featured': True},
+        'creature_list': []
+    },
+    'information': {'timestamp': '2025-07-18T08:00:00Z'}
+}
+
+BOSSES_PAYLOAD = {
+    'boostable_bosses': {
+        'boosted': {'name': 'Ferumbras', 'image_url': '', 'featured': True},
+        'boostable_boss_list': []
+    },
+    'information': {'timestamp': '2025-07-18T08:00:00Z'}
+}
+
+
+def make_app(latency: float) -> web.Application:
+    """Build the stub TibiaData app with a fixed per-request latency"""
+    async def creatures(request):
+        await asyncio.sleep(latency)
+        return web.json_response(CREATURES_PAYLOAD)
+
+    async def bosses(request):
+        await asyncio.sleep(latency)
+        return web.json_response(BOSSES_PAYLOAD)
+
+    app = web.Application()
+    app.router.add_get('/v4/creatures', creatures)
+    app.router.add_get('/v4/boostablebosses', bosses)
+    return app
+
+
+async def sequential(api: TibiaAPI):
+    """The previous behaviour: one endpoint after the other"""
+    await api._make_request("creatures", use_cache=False)
+    await api._make_request("boostablebosses", use_cache=False)
+
+
+async def concurrent(api: TibiaAPI):
+    await api.get_boosted_creatures(fresh=True)
+
+
+async def measure(func, api: TibiaAPI, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await func(api)
+        timings.append(time.perf_counter() - start)
+    return sum(timings) / len(timings)
+
+
+async def run(latency: float, rounds: int):
+    runner = web.AppRunner(make_app(latency))
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    api = TibiaAPI(base_url=f"http://127.0.0.1:{port}/v4")
+    try:
+        # Warm the connection pool so both variants pay the same setup cost
+        await api.get_boosted_creatures(fresh=True)
+
+        seq = await measure(sequential, api, rounds)
+        conc = await measure(concurrent, api, rounds)
+    finally:
+        await api.close()
+        await runner.cleanup()
+
+    print(f"Injected latency per endpoint: {latency * 1000:.0f} ms, rounds: {rounds}")
+    print(f"Sequential: {seq * 1000:8.1f} ms")
+    print(f"Concurrent: {conc * 1000:8.1f} ms")
+    print(f"Speed-up:   {seq / conc:8.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--latency', type=float, default=0.25, help="Injected latency per request in seconds")
+    parser.add_argument('--rounds', type=int, default=10, help="Number of measured rounds per variant")
+    args = parser.parse_args()
+    asyncio.run(run(args.latency, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
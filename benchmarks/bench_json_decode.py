@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark: JSON decoding of TibiaData responses per backend
+
+Decodes payloads shaped like the /creatures, /boostablebosses and
+/creature/<race> responses (see json_payloads.py, or pass recorded
+responses with --payload creatures=path.json ...) with every installed
+backend: stdlib json, orjson and msgspec.
+
+Usage:
+    python benchmarks/bench_json_decode.py [--rounds 200] [--payload creatures=creatures.json]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from bot.json_codec import JSONCodec, msgspec, orjson  # noqa: E402
+from json_payloads import synthetic_payloads  # noqa: E402
+
+
+def time_decode(decode, body: bytes, rounds: int) -> float:
+    """Best-of-3 mean seconds per decode"""
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            decode(body)
+        best = min(best, (time.perf_counter() - start) / rounds)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=200)
+    parser.add_argument('--payload', action='append', default=[], metavar='ENDPOINT=PATH',
+                        help="Use a recorded response body for an endpoint (creatures, boostablebosses, creature)")
+    args = parser.parse_args()
+
+    payloads = synthetic_payloads()
+    for spec in args.payload:
+        endpoint, path = spec.split('=', 1)
+        with open(path, 'rb') as f:
+            payloads[endpoint] = f.read()
+
+    backends = ['json'] + [name for name, module in (('orjson', orjson), ('msgspec', msgspec)) if module is not None]
+    codecs = {name: JSONCodec(name) for name in backends}
+
+    for endpoint, body in payloads.items():
+        print(f"\n{endpoint} ({len(body) / 1024:.0f} KB)")
+        baseline = None
+        for name, codec in codecs.items():
+            seconds = time_decode(codec.decode, body, args.rounds)
+            baseline = baseline or seconds
+            print(f"  {name:<14} {seconds * 1000:8.3f} ms  {baseline / seconds:5.2f}x")
+
+    missing = {'orjson', 'msgspec'} - set(backends)
+    if missing:
+        print(f"\nNot installed: {', '.join(sorted(missing))}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bot startup cost
+
+Measures, in fresh interpreters:
+  * import time of `main` via `python -X importtime`, with the slowest modules
+  * resident memory right after importing `main`
+  * with --gateway (needs DISCORD_TOKEN): time from process start until the
+    "has connected to Discord!" log line, and resident memory after idling
+
+Budgets (--max-import-ms, --max-connect-s, --max-rss-mb) turn it into a check:
+the script exits with status 1 if any measured value exceeds its budget.
+
+Usage:
+    python benchmarks/bench_startup.py [--rounds 5] [--top 15]
+    DISCORD_TOKEN=... python benchmarks/bench_startup.py --gateway [--idle 30]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$')
+
+CONNECTED_MARKER = 'has connected to Discord!'
+
+# Report peak RSS of the importing interpreter (KiB on Linux)
+RSS_SNIPPET = "import resource, main; print('RSS_KB', resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)"
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """Module -> (self us, cumulative us) from -X importtime output"""
+    modules = {}
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            modules[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return modules
+
+
+def measure_import() -> Tuple[Dict[str, Tuple[int, int]], int]:
+    """Import main in a fresh interpreter; returns the importtime table and peak RSS in KiB"""
+    env = dict(os.environ, METRICS_PORT='0', LOG_FILE='')
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', RSS_SNIPPET],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    rss = int(re.search(r'RSS_KB (\d+)', proc.stdout).group(1))
+    return parse_importtime(proc.stderr), rss
+
+
+def read_rss_kb(pid: int) -> Optional[int]:
+    """Current resident set size of a process in KiB (Linux /proc)"""
+    try:
+        with open(f'/proc/{pid}/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def measure_gateway(idle: float, timeout: float) -> Tuple[Optional[float], Optional[int]]:
+    """Start the bot, time until it reports the gateway connection, then sample idle RSS"""
+    env = dict(os.environ, METRICS_PORT='0', LOG_FILE='')
+    started = time.monotonic()
+    proc = subprocess.Popen(
+        [sys.executable, 'start.py'], cwd=ROOT, env=env,
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+
+    connected = threading.Event()
+
+    def watch():
+        for line in proc.stdout:
+            if CONNECTED_MARKER in line:
+                connected.set()
+
+    threading.Thread(target=watch, daemon=True).start()
+
+    try:
+        if not connected.wait(timeout):
+            return None, read_rss_kb(proc.pid)
+        connect_seconds = time.monotonic() - started
+        time.sleep(idle)
+        return connect_seconds, read_rss_kb(proc.pid)
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=5, help='fresh interpreters to import main in')
+    parser.add_argument('--top', type=int, default=15, help='slowest modules to list')
+    parser.add_argument('--gateway', action='store_true', help='also start the bot and time the gateway connection')
+    parser.add_argument('--idle', type=float, default=30, help='seconds to idle after connecting before sampling RSS')
+    parser.add_argument('--timeout', type=float, default=120, help='give up waiting for the gateway after this many seconds')
+    parser.add_argument('--max-import-ms', type=float, help='fail if the median import of main is slower')
+    parser.add_argument('--max-connect-s', type=float, help='fail if connecting to the gateway takes longer')
+    parser.add_argument('--max-rss-mb', type=float, help='fail if resident memory (after import, or idle with --gateway) is higher')
+    args = parser.parse_args()
+
+    failures: List[str] = []
+
+    totals = []
+    rss_values = []
+    runs = []
+    for _ in range(args.rounds):
+        modules, rss = measure_import()
+        runs.append(modules)
+        totals.append(modules['main'][1] / 1000)
+        rss_values.append(rss / 1024)
+
+    import_ms = statistics.median(totals)
+    rss_mb = statistics.median(rss_values)
+    print(f"import main: median {import_ms:.1f} ms (min {min(totals):.1f}, max {max(totals):.1f}) over {args.rounds} runs")
+    print(f"RSS after import: {rss_mb:.1f} MiB")
+
+    # Median cumulative time per top-level-ish module across runs
+    names = set().union(*runs)
+    cumulative = {
+        name: statistics.median(run[name][1] for run in runs if name in run) / 1000
+        for name in names if name != 'main'
+    }
+    print("\nSlowest imports (cumulative ms):")
+    for name, ms in sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {ms:8.1f}  {name}")
+
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        failures.append(f"import main took {import_ms:.1f} ms (budget {args.max_import_ms} ms)")
+
+    if args.gateway:
+        if not os.getenv('DISCORD_TOKEN'):
+            parser.error('--gateway needs DISCORD_TOKEN')
+        connect_seconds, idle_rss = measure_gateway(args.idle, args.timeout)
+        print()
+        if connect_seconds is None:
+            failures.append(f"no gateway connection within {args.timeout:.0f}s")
+        else:
+            print(f"time to gateway connect: {connect_seconds:.2f} s")
+            if args.max_connect_s is not None and connect_seconds > args.max_connect_s:
+                failures.append(f"gateway connect took {connect_seconds:.2f} s (budget {args.max_connect_s} s)")
+        if idle_rss is not None:
+            rss_mb = idle_rss / 1024
+            print(f"RSS at idle ({args.idle:.0f}s after connect): {rss_mb:.1f} MiB")
+
+    if args.max_rss_mb is not None and rss_mb > args.max_rss_mb:
+        failures.append(f"resident memory {rss_mb:.1f} MiB (budget {args.max_rss_mb} MiB)")
+
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: regex-over-full-HTML vs streaming infobox parser for TibiaWiki pages
+
+Compares the previous regex approach (full page decoded to str, then searched)
+with the streaming InfoboxParser fed in 16 KB byte chunks, on wall time per page
+and peak traced memory (tracemalloc). Uses synthetic pages by default; pass
+saved pages with --fixture.
+
+Usage:
+    python benchmarks/bench_wiki_parser.py [--rounds 20] [--fixture page.html ...]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from bot.wiki_parser import StreamingInfoboxReader  # noqa: E402
+from wiki_fixtures import make_page  # noqa: E402
+
+CHUNK_SIZE = 16384
+
+
+def legacy_regex_parse(raw: bytes, creature_name: str) -> dict:
+    """The previous TibiaAPI._parse_tibiawiki_html, including decoding the full body"""
+    html = raw.decode('utf-8')
+    hp_match = re.search(r'Hit Points.*?(\d+)', html, re.IGNORECASE)
+    exp_match = re.search(r'Experience.*?(\d+)', html, re.IGNORECASE)
+    desc_match = re.search(r'<p.*?>(.*?)</p>', html, re.DOTALL)
+
+    description = ""
+    if desc_match:
+        desc_text = re.sub(r'<[^>]+>', '', desc_match.group(1))
+        desc_text = re.sub(r'\s+', ' ', desc_text).strip()
+        if len(desc_text) > 50:
+            description = desc_text[:200] + "..." if len(desc_text) > 200 else desc_text
+
+    return {
+        'name': creature_name,
+        'hitpoints': int(hp_match.group(1)) if hp_match else 'Unknown',
+        'experience_points': int(exp_match.group(1)) if exp_match else 'Unknown',
+        'description': description or f"Information about {creature_name}",
+    }
+
+
+def streaming_parse(raw: bytes, creature_name: str) -> dict:
+    reader = StreamingInfoboxReader()
+    for start in range(0, len(raw), CHUNK_SIZE):
+        if reader.feed(raw[start:start + CHUNK_SIZE]):
+            break
+    return reader.parser.result(creature_name)
+
+
+def measure(func, pages, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for name, raw in pages:
+            func(raw, name)
+    elapsed = (time.perf_counter() - start) / (rounds * len(pages))
+
+    peak = 0
+    for name, raw in pages:
+        tracemalloc.start()
+        func(raw, name)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=20, help="Timed rounds over all pages")
+    parser.add_argument('--fixture', action='append', default=[], help="Saved TibiaWiki page (repeatable)")
+    args = parser.parse_args()
+
+    if args.fixture:
+        pages = []
+        for path in args.fixture:
+            with open(path, 'rb') as f:
+                pages.append((os.path.splitext(os.path.basename(path))[0].replace('_', ' '), f.read()))
+    else:
+        pages = [(name, make_page(name, seed).encode('utf-8'))
+                 for seed, name in enumerate(("Demon", "Dragon Lord", "Ferumbras"))]
+
+    sizes = ", ".join(f"{name}: {len(raw) / 1024:.0f} KB" for name, raw in pages)
+    print(f"Pages: {sizes}")
+
+    for name, raw in pages[:1]:
+        print(f"Regex result:     {legacy_regex_parse(raw, name)}")
+        print(f"Streaming result: {streaming_parse(raw, name)}")
+
+    regex_time, regex_peak = measure(legacy_regex_parse, pages, args.rounds)
+    stream_time, stream_peak = measure(streaming_parse, pages, args.rounds)
+
+    print(f"{'':10} {'time/page':>12} {'peak memory':>14}")
+    print(f"{'regex':10} {regex_time * 1000:9.2f} ms {regex_peak / 1024:11.0f} KB")
+    print(f"{'streaming':10} {stream_time * 1000:9.2f} ms {stream_peak / 1024:11.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Synthetic TibiaData v4 response bodies for the JSON decoding benchmark
+
+Shaped like real /creatures, /boostablebosses and /creature/<race> responses,
+including the fields the bot never reads, with list sizes matching the live API.
+"""
+
+import json
+import random
+from typing import Dict
+
+TIMESTAMP = '2025-07-18T08:00:03Z'
+
+
+def _information() -> dict:
+    return {
+        'api': {'version': 4, 'release': '4.2.1', 'commit': '0a1b2c3'},
+        'timestamp': TIMESTAMP,
+        'status': {'http_code': 200}
+    }
+
+
+def _creature(i: int) -> dict:
+    return {
+        'name': f"Creature {i}",
+        'race': f"creature{i}",
+        'image_url': f"https://static.tibia.com/images/library/creature{i}.gif",
+        'featured': False
+    }
+
+
+def synthetic_payloads(creatures: int = 750, bosses: int = 100, seed: int = 0) -> Dict[str, bytes]:
+    """Response bodies keyed by endpoint"""
+    rng = random.Random(seed)
+
+    creature_list = [_creature(i) for i in range(creatures)]
+    boss_list = [
+        {'name': f"Boss {i}", 'image_url': f"https://static.tibia.com/images/library/boss{i}.gif", 'featured': False}
+        for i in range(bosses)
+    ]
+
+    details = {
+        'name': 'Demon',
+        'race': 'demon',
+        'image_url': 'https://static.tibia.com/images/library/demon.gif',
+        'description': 'Demons are among the most feared creatures. ' * 4,
+        'behaviour': 'They attack with fire and energy and summon fire elementals. ' * 3,
+        'hitpoints': 8200,
+        'immune': ['fire', 'invisible', 'paralyze'],
+        'strong': ['earth', 'energy'],
+        'weak': ['holy', 'ice'],
+        'be_paralysed': False,
+        'be_summoned': False,
+        'summoned_mana': 0,
+        'be_convinced': False,
+        'convinced_mana': 0,
+        'see_invisible': True,
+        'experience_points': 6000,
+        'is_lootable': True,
+        'loot_list': [f"Item {rng.randint(0, 5000)}" for _ in range(40)],
+        'featured': False
+    }
+
+    return {
+        'creatures': json.dumps({
+            'creatures': {'boosted': dict(creature_list[0], featured=True), 'creature_list': creature_list},
+            'information': _information()
+        }).encode(),
+        'boostablebosses': json.dumps({
+            'boostable_bosses': {'boosted': dict(boss_list[0], featured=True), 'boostable_boss_list': boss_list},
+            'information': _information()
+        }).encode(),
+        'creature': json.dumps({'creature': details, 'information': _information()}).encode()
+    }
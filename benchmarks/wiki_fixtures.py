@@ -0,0 +1,68 @@
+"""
+Synthetic TibiaWiki (fandom) creature pages for parser benchmarks
+
+The sandbox these benchmarks were written in has no network access, so the
+pages are generated to mirror the structure of a rendered fandom page: a large
+head with inline scripts/styles, navigation that mentions "Hit Points" and
+"Experience" before the infobox, the portable infobox, article paragraphs, a
+loot table and a long footer. Pass real saved pages with --fixture to compare
+on actual data.
+"""
+
+import random
+
+HEAD = (
+    "<!DOCTYPE html><html><head><title>{name} | TibiaWiki | Fandom</title>"
+    + "<style>" + ".pi-item{{margin:0}} " * 800 + "</style>"
+    + "<script>window.__data = {{" + "\"k\": \"v\", " * 3000 + "}};</script>"
+    "</head><body>"
+)
+
+NAV = (
+    "<nav class=\"global-navigation\"><ul>"
+    + "".join(f"<li><a href=\"/wiki/Page_{i}\">Page {i}</a></li>" for i in range(400))
+    + "<li><a href=\"/wiki/Hit_Points\">Hit Points</a> guide 2024</li>"
+    + "<li><a href=\"/wiki/Experience\">Experience</a> tables 1998</li>"
+    + "</ul></nav><p>Short note.</p>"
+)
+
+INFOBOX = (
+    "<aside class=\"portable-infobox pi-background pi-theme-creature\">"
+    "<h2 class=\"pi-item pi-title\">{name}</h2>"
+    "<div class=\"pi-item pi-data\" data-source=\"hp\"><h3 class=\"pi-data-label\">Health</h3>"
+    "<div class=\"pi-data-value pi-font\">{hp:,}</div></div>"
+    "<div class=\"pi-item pi-data\" data-source=\"exp\"><h3 class=\"pi-data-label\">Experience</h3>"
+    "<div class=\"pi-data-value pi-font\">{exp:,}</div></div>"
+    "<div class=\"pi-item pi-data\" data-source=\"armor\"><h3 class=\"pi-data-label\">Armor</h3>"
+    "<div class=\"pi-data-value pi-font\">{armor}</div></div>"
+    "<div class=\"pi-item pi-data\" data-source=\"speed\"><h3 class=\"pi-data-label\">Speed</h3>"
+    "<div class=\"pi-data-value pi-font\">{speed}</div></div>"
+    "<div class=\"pi-item pi-data\" data-source=\"loot\"><h3 class=\"pi-data-label\">Loot</h3>"
+    "<div class=\"pi-data-value pi-font\">{loot}</div></div>"
+    "</aside>"
+)
+
+ARTICLE = (
+    "<div class=\"mw-parser-output\"><p>The {name} is a fearsome creature found deep in the dungeons of Tibia. "
+    "It is known for its powerful attacks and valuable loot, making it a popular hunting target.</p>"
+    + "".join(f"<p>Paragraph {i} " + "lorem ipsum dolor sit amet " * 20 + "</p>" for i in range(60))
+    + "<table class=\"loot-table\">"
+    + "".join(f"<tr><td><a href=\"/wiki/Item_{i}\">Item {i}</a></td><td>{i * 3}%</td></tr>" for i in range(150))
+    + "</table></div>"
+)
+
+FOOTER = "<footer>" + "<div class=\"fandom-community\">" + "<a href=\"/x\">Link</a> " * 4000 + "</div></footer></body></html>"
+
+
+def make_page(name: str = "Demon", seed: int = 0) -> str:
+    """Build one synthetic creature page (roughly 300-400 KB)"""
+    rng = random.Random(seed)
+    loot = ", ".join(f"<a href=\"/wiki/Item_{i}\">Item {i}</a>" for i in rng.sample(range(500), 12))
+    return (
+        HEAD.format(name=name)
+        + NAV
+        + INFOBOX.format(name=name, hp=rng.randint(100, 90000), exp=rng.randint(100, 90000),
+                         armor=rng.randint(1, 120), speed=rng.randint(100, 400), loot=loot)
+        + ARTICLE.format(name=name)
+        + FOOTER
+    )
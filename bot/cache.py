@@ -0,0 +1,140 @@
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import pytz
+
+from bot.server_save import last_server_save, next_server_save
+
+# Cache lookup states
+HIT = 'hit'
+STALE = 'stale'
+MISS = 'miss'
+
+
+class CacheEntry:
+    """A cached value with its freshness deadlines (epoch seconds)"""
+
+    __slots__ = ('value', 'stored_at', 'expires_at', 'stale_until')
+
+    def __init__(self, value: Any, stored_at: float, expires_at: float, stale_until: float):
+        self.value = value
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache whose entries expire at the next Tibia server save
+
+    Boosted and creature data only changes once a day, so instead of a fixed TTL
+    every entry is fresh until the next 10:00 Europe/Berlin server save. Entries
+    stored shortly after a server save (while TibiaData may still be serving the
+    previous day's data) only get a short TTL so they can't pin stale data for a day.
+
+    Expired entries are still served for `stale_window` seconds as STALE so callers
+    can answer immediately and revalidate in the background.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        stale_window: float = 600,
+        settle_window: float = 1800,
+        settle_ttl: float = 60,
+        clock: Callable[[], float] = time.time
+    ):
+        self.max_size = max(1, max_size)
+        self.stale_window = stale_window
+        self.settle_window = settle_window
+        self.settle_ttl = settle_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+
+        # Counters
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _expiry_for(self, now: float) -> float:
+        """Compute when an entry stored at `now` stops being fresh"""
+        now_dt = datetime.fromtimestamp(now, pytz.utc)
+        expires_at = next_server_save(now_dt).timestamp()
+
+        # Right after server save the upstream data may not have rotated yet
+        if now - last_server_save(now_dt).timestamp() < self.settle_window:
+            expires_at = min(expires_at, now + self.settle_ttl)
+
+        return expires_at
+
+    def get(self, key: Hashable) -> Tuple[Optional[Any], str]:
+        """
+        Look up a cached value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value, state) where state is HIT, STALE or MISS
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None, MISS
+
+        now = self._clock()
+        if now < entry.expires_at:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value, HIT
+
+        if now < entry.stale_until:
+            self._entries.move_to_end(key)
+            self.stale_hits += 1
+            return entry.value, STALE
+
+        # Keep the expired entry as last known good (see peek) until LRU eviction
+        self.misses += 1
+        return None, MISS
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value regardless of freshness, without touching counters"""
+        entry = self._entries.get(key)
+        return entry.value if entry else None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full"""
+        now = self._clock()
+        expires_at = self._expiry_for(now)
+        self._entries[key] = CacheEntry(value, now, expires_at, expires_at + self.stale_window)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop a single key, or everything when key is None"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters"""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': (self.hits + self.stale_hits) / lookups if lookups else 0.0
+        }
@@ -0,0 +1,315 @@
+import bisect
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from bot.server_save import last_server_save
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a creature/boss name for index lookups"""
+    return " ".join(name.replace('_', ' ').split()).lower()
+
+
+class CatalogEntry:
+    """A single creature or boss from the TibiaData lists"""
+
+    __slots__ = ('name', 'race', 'image_url', 'is_boss')
+
+    def __init__(self, name: str, race: Optional[str], image_url: Optional[str], is_boss: bool):
+        self.name = name
+        self.race = race
+        self.image_url = image_url
+        self.is_boss = is_boss
+
+    def __repr__(self) -> str:
+        return f"CatalogEntry(name={self.name!r}, race={self.race!r}, is_boss={self.is_boss})"
+
+
+def trigrams(text: str) -> Set[str]:
+    """Trigrams of a normalized name, padded so word starts and ends count too"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """
+    Prefix and trigram index over catalog names, for autocomplete and typo-tolerant lookups
+
+    Built once per catalog change. Prefix matches (of the whole name, or of any
+    word in it) are bisects into sorted key lists; anything else is ranked by
+    trigram similarity, counting only the names sharing a trigram with the query.
+    """
+
+    def __init__(self, entries: Sequence[CatalogEntry]):
+        self._entries = sorted(entries, key=lambda entry: normalize_name(entry.name))
+        self._keys = [normalize_name(entry.name) for entry in self._entries]
+        # Name from each later word start, e.g. "lord" for "dragon lord", and its entry position
+        self._word_keys: List[str] = []
+        self._word_positions: List[int] = []
+        self._trigram_counts: List[int] = []
+        # trigram -> positions of the names containing it
+        self._postings: Dict[str, List[int]] = {}
+
+        word_starts: List[Tuple[str, int]] = []
+
+        for position, key in enumerate(self._keys):
+            words = key.split(' ')
+            start = 0
+            for word in words[:-1]:
+                start += len(word) + 1
+                word_starts.append((key[start:], position))
+            grams = trigrams(key)
+            self._trigram_counts.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+        for word_key, position in sorted(word_starts):
+            self._word_keys.append(word_key)
+            self._word_positions.append(position)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _prefixed(self, keys: Sequence[str], prefix: str) -> range:
+        """Positions in sorted keys starting with prefix"""
+        start = bisect.bisect_left(keys, prefix)
+        end = bisect.bisect_left(keys, prefix + '\uffff', start)
+        return range(start, end)
+
+    def search(self, query: str, limit: int = 25, min_similarity: float = 0.4) -> List[CatalogEntry]:
+        """
+        Best matching entries for a (partial, possibly misspelled) name
+
+        Ranked as: exact name, name prefix, word prefix (shortest names first),
+        then trigram (Dice) similarity of at least `min_similarity`.
+
+        Args:
+            query: What the user typed so far
+            limit: Maximum number of entries
+            min_similarity: Lowest trigram similarity still suggested
+
+        Returns:
+            Matching entries, best first
+        """
+        key = normalize_name(query)
+        if not key:
+            return self._entries[:limit]
+
+        ranked: Dict[int, Tuple[int, float, int, str]] = {}
+
+        def consider(position: int, rank: Tuple[int, float, int, str]) -> None:
+            if position not in ranked or rank < ranked[position]:
+                ranked[position] = rank
+
+        for position in self._prefixed(self._keys, key):
+            name = self._keys[position]
+            consider(position, (0 if name == key else 1, 0.0, len(name), name))
+
+        for index in self._prefixed(self._word_keys, key):
+            position = self._word_positions[index]
+            consider(position, (2, 0.0, len(self._keys[position]), self._keys[position]))
+
+        if len(ranked) < limit:
+            grams = trigrams(key)
+            shared: Dict[int, int] = {}
+            for gram in grams:
+                for position in self._postings.get(gram, ()):
+                    shared[position] = shared.get(position, 0) + 1
+            for position, count in shared.items():
+                similarity = 2 * count / (len(grams) + self._trigram_counts[position])
+                if similarity >= min_similarity:
+                    consider(position, (3, -similarity, len(self._keys[position]), self._keys[position]))
+
+        best = sorted(ranked, key=ranked.__getitem__)[:limit]
+        return [self._entries[position] for position in best]
+
+
+class CreatureCatalog:
+    """
+    In-memory index over the full creature and boostable boss lists
+
+    Built from the /creatures and /boostablebosses payloads (the same responses the
+    daily boosted lookup already downloads) and indexed by normalized name, race
+    and image URL. The index is considered current until the next server save.
+    """
+
+    def __init__(self):
+        # One index per kind (keyed by is_boss), so a boss named like a creature never replaces it
+        self._by_name: Dict[bool, Dict[str, CatalogEntry]] = {False: {}, True: {}}
+        self._by_race: Dict[bool, Dict[str, CatalogEntry]] = {False: {}, True: {}}
+        self._by_image_url: Dict[bool, Dict[str, CatalogEntry]] = {False: {}, True: {}}
+        # Rebuilt after each ingest so searches never have to
+        self._name_index = NameIndex(())
+
+        self.boosted_creature: Optional[str] = None
+        self.boosted_boss: Optional[str] = None
+
+        # When each list was last ingested (epoch seconds)
+        self.creatures_loaded_at: Optional[float] = None
+        self.bosses_loaded_at: Optional[float] = None
+
+        # Last ingested payloads, so re-serving a cached response doesn't rebuild the index
+        self._creatures_payload: Optional[Dict[str, Any]] = None
+        self._bosses_payload: Optional[Dict[str, Any]] = None
+
+    def _add(self, entry: CatalogEntry) -> None:
+        self._by_name[entry.is_boss][normalize_name(entry.name)] = entry
+        if entry.race:
+            self._by_race[entry.is_boss][entry.race.lower()] = entry
+        if entry.image_url:
+            self._by_image_url[entry.is_boss][entry.image_url] = entry
+
+    def _remove_kind(self, is_boss: bool) -> None:
+        """Drop all entries of one kind before re-ingesting its list"""
+        for index in (self._by_name, self._by_race, self._by_image_url):
+            index[is_boss] = {}
+
+    def ingest_creatures(self, data: Dict[str, Any]) -> bool:
+        """
+        Index a /creatures payload
+
+        Args:
+            data: Full JSON response of the creatures endpoint
+
+        Returns:
+            True if the payload contained a creature list
+        """
+        if data is not None and data is self._creatures_payload:
+            return True
+
+        section = (data or {}).get('creatures') or {}
+        creature_list = section.get('creature_list')
+        if not creature_list:
+            return False
+
+        self._remove_kind(is_boss=False)
+        for creature in creature_list:
+            if creature.get('name'):
+                self._add(CatalogEntry(creature['name'], creature.get('race'), creature.get('image_url'), False))
+
+        boosted = section.get('boosted') or {}
+        if boosted.get('name'):
+            self.boosted_creature = boosted['name']
+            # The boosted entry carries the same fields; make sure it's indexed
+            if normalize_name(boosted['name']) not in self._by_name[False]:
+                self._add(CatalogEntry(boosted['name'], boosted.get('race'), boosted.get('image_url'), False))
+
+        self.creatures_loaded_at = time.time()
+        self._creatures_payload = data
+        self._name_index = NameIndex(self.entries())
+        logger.info(f"Indexed {len(creature_list)} creatures")
+        return True
+
+    def ingest_bosses(self, data: Dict[str, Any]) -> bool:
+        """
+        Index a /boostablebosses payload
+
+        Args:
+            data: Full JSON response of the boostablebosses endpoint
+
+        Returns:
+            True if the payload contained a boss list
+        """
+        if data is not None and data is self._bosses_payload:
+            return True
+
+        section = (data or {}).get('boostable_bosses') or {}
+        boss_list = section.get('boostable_boss_list')
+        if not boss_list:
+            return False
+
+        self._remove_kind(is_boss=True)
+        for boss in boss_list:
+            if boss.get('name'):
+                self._add(CatalogEntry(boss['name'], None, boss.get('image_url'), True))
+
+        boosted = section.get('boosted') or {}
+        if boosted.get('name'):
+            self.boosted_boss = boosted['name']
+            if normalize_name(boosted['name']) not in self._by_name[True]:
+                self._add(CatalogEntry(boosted['name'], None, boosted.get('image_url'), True))
+
+        self.bosses_loaded_at = time.time()
+        self._bosses_payload = data
+        self._name_index = NameIndex(self.entries())
+        logger.info(f"Indexed {len(boss_list)} boostable bosses")
+        return True
+
+    def is_current(self) -> bool:
+        """Whether both lists were loaded during the current server-save cycle"""
+        cycle_start = last_server_save().timestamp()
+        return (
+            self.creatures_loaded_at is not None and self.creatures_loaded_at >= cycle_start
+            and self.bosses_loaded_at is not None and self.bosses_loaded_at >= cycle_start
+        )
+
+    @staticmethod
+    def _find(index: Dict[bool, Dict[str, CatalogEntry]], key: str, is_boss: Optional[bool]) -> Optional[CatalogEntry]:
+        """Look key up in one kind's index, or creatures first then bosses"""
+        for kind in ((False, True) if is_boss is None else (is_boss,)):
+            entry = index[kind].get(key)
+            if entry is not None:
+                return entry
+        return None
+
+    def lookup(self, name: str, is_boss: Optional[bool] = None) -> Optional[CatalogEntry]:
+        """
+        Find an entry by (case/spacing-insensitive) name
+
+        Args:
+            name: Creature or boss name
+            is_boss: Only look among bosses (True) or creatures (False); by default
+                creatures are tried first, then bosses
+
+        Returns:
+            CatalogEntry or None if unknown
+        """
+        if not name:
+            return None
+        return self._find(self._by_name, normalize_name(name), is_boss)
+
+    def search(self, query: str, limit: int = 25) -> List[CatalogEntry]:
+        """
+        Creatures and bosses matching a partial or misspelled name, best first
+
+        Only the in-memory index is consulted, so this is cheap enough to run on
+        every autocomplete keystroke.
+
+        Args:
+            query: Partial name as typed
+            limit: Maximum number of entries
+
+        Returns:
+            Matching entries (the first one is an exact match, if there is one);
+            for an empty query, today's boosted creature and boss come first
+        """
+        if normalize_name(query):
+            return self._name_index.search(query, limit)
+
+        boosted = [
+            entry for entry in (self.lookup(self.boosted_creature, False), self.lookup(self.boosted_boss, True)) if entry
+        ]
+        rest = [entry for entry in self._name_index.search('', limit) if entry not in boosted]
+        return (boosted + rest)[:limit]
+
+    def lookup_race(self, race: str) -> Optional[CatalogEntry]:
+        """Find a creature by its TibiaData race identifier"""
+        return self._find(self._by_race, race.lower(), None) if race else None
+
+    def lookup_image_url(self, image_url: str) -> Optional[CatalogEntry]:
+        """Find an entry by its image URL"""
+        return self._find(self._by_image_url, image_url, None) if image_url else None
+
+    def image_url(self, name: str, is_boss: Optional[bool] = None) -> Optional[str]:
+        """Image URL for a creature or boss, if known"""
+        entry = self.lookup(name, is_boss)
+        return entry.image_url if entry else None
+
+    def entries(self) -> List[CatalogEntry]:
+        """All indexed creatures and bosses"""
+        return list(self._by_name[False].values()) + list(self._by_name[True].values())
+
+    def __len__(self) -> int:
+        return len(self._by_name[False]) + len(self._by_name[True])
@@ -0,0 +1,147 @@
+import logging
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from bot.ratelimit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# Statuses worth retrying: timeouts, throttling and server-side failures
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def is_retryable_status(status: int) -> bool:
+    """Whether a failed response may succeed on retry (other 4xx won't)"""
+    return status in RETRYABLE_STATUSES or status >= 500
+
+
+def parse_retry_after(headers: Mapping[str, str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Seconds to wait according to a Retry-After header
+
+    Args:
+        headers: Response headers
+        now: Current epoch time (for HTTP-date values)
+
+    Returns:
+        Non-negative delay in seconds, or None if absent/unparseable
+    """
+    value = headers.get('Retry-After') if headers else None
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - (now if now is not None else time.time()))
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker for one upstream host
+
+    After `failure_threshold` consecutive failures the breaker opens and calls
+    fail fast for `reset_timeout` seconds. It then lets `half_open_max_calls`
+    probe requests through: a success closes it again, a failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_started = 0.0
+
+        # Counters
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the reset timeout passed"""
+        if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    def retry_in(self) -> float:
+        """Seconds until an open breaker lets a probe through (0 if not open)"""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+
+    def allow(self) -> bool:
+        """Whether a request may be attempted now"""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN:
+            # A probe that never reported back (e.g. cancelled) must not wedge the breaker
+            if self._probes >= self.half_open_max_calls and self._clock() - self._probe_started >= self.reset_timeout:
+                self._probes = 0
+            if self._probes < self.half_open_max_calls:
+                self._probes += 1
+                self._probe_started = self._clock()
+                return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        if self._state != CLOSED:
+            logger.info("Circuit closed, upstream recovered")
+        self._state = CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == HALF_OPEN or (self._state == CLOSED and self._failures >= self.failure_threshold):
+            self._trip()
+
+    def _trip(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self.opened += 1
+        logger.warning(f"Circuit opened after {self._failures} failures, failing fast for {self.reset_timeout}s")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'state': self.state,
+            'consecutive_failures': self._failures,
+            'opened': self.opened,
+            'rejected': self.rejected
+        }
+
+
+class HostGuard:
+    """Rate limiter and circuit breaker shared by every request to one host"""
+
+    __slots__ = ('host', 'bucket', 'breaker')
+
+    def __init__(self, host: str, bucket: TokenBucket, breaker: CircuitBreaker):
+        self.host = host
+        self.bucket = bucket
+        self.breaker = breaker
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(self.breaker.stats(), acquired=self.bucket.acquired, throttled=self.bucket.waited)
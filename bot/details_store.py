@@ -0,0 +1,125 @@
+import json
+import logging
+import sqlite3
+import time
+from typing import Any, Dict, Optional
+
+from bot.catalog import normalize_name
+
+logger = logging.getLogger(__name__)
+
+
+class StoredDetails:
+    """Creature details as persisted on disk, with their HTTP validators"""
+
+    __slots__ = ('details', 'source', 'etag', 'last_modified', 'validated_at')
+
+    def __init__(self, details: Dict[str, Any], source: str, etag: Optional[str], last_modified: Optional[str], validated_at: float):
+        self.details = details
+        self.source = source
+        self.etag = etag
+        self.last_modified = last_modified
+        self.validated_at = validated_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers for a conditional GET revalidating this entry"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class CreatureDetailsStore:
+    """
+    Persistent SQLite store for parsed creature details
+
+    Keyed by normalized creature name, the same key the catalog and watchlists use.
+    Each row keeps the parsed details plus the ETag/Last-Modified validators of the
+    response they came from, so a warm restart can answer from disk and revalidate
+    with cheap conditional GETs.
+    """
+
+    def __init__(self, path: str = "creature_details.db"):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS creature_details (
+                name TEXT PRIMARY KEY,
+                details TEXT NOT NULL,
+                source TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                validated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, creature_name: str) -> Optional[StoredDetails]:
+        """
+        Load stored details for a creature
+
+        Args:
+            creature_name: Name of the creature
+
+        Returns:
+            StoredDetails or None if not stored
+        """
+        try:
+            row = self._conn.execute(
+                "SELECT details, source, etag, last_modified, validated_at FROM creature_details WHERE name = ?",
+                (normalize_name(creature_name),)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading stored details for {creature_name}: {e}")
+            return None
+
+        if not row:
+            return None
+
+        details, source, etag, last_modified, validated_at = row
+        return StoredDetails(json.loads(details), source, etag, last_modified, validated_at)
+
+    def put(self, creature_name: str, details: Dict[str, Any], source: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """
+        Store (or replace) details for a creature
+
+        Args:
+            creature_name: Name of the creature
+            details: Parsed creature details
+            source: Where the details came from ('TibiaData' or 'TibiaWiki')
+            etag: ETag header of the response
+            last_modified: Last-Modified header of the response
+        """
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO creature_details (name, details, source, etag, last_modified, validated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (normalize_name(creature_name), json.dumps(details), source, etag, last_modified, time.time())
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error storing details for {creature_name}: {e}")
+
+    def touch(self, creature_name: str) -> None:
+        """Mark stored details as revalidated now (after a 304 Not Modified)"""
+        try:
+            self._conn.execute(
+                "UPDATE creature_details SET validated_at = ? WHERE name = ?",
+                (time.time(), normalize_name(creature_name))
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error updating stored details for {creature_name}: {e}")
+
+    def count(self) -> int:
+        """Number of stored creatures"""
+        return self._conn.execute("SELECT COUNT(*) FROM creature_details").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self._conn.close()
@@ -1,6 +1,11 @@
 import discord
-from datetime import datetime
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from typing import Dict, Any, Optional, Sequence, Tuple
+
+from bot.forecast import Forecast
+from bot.history import BoostedStats
+from bot.models import BoostedSnapshot, CreatureDetails
 
 class EmbedBuilder:
     """Builder for Discord embeds related to Tibia creatures and bosses"""
@@ -11,20 +16,86 @@ class EmbedBuilder:
     INFO_COLOR = 0x3498db     # Blue
     ERROR_COLOR = 0xe74c3c    # Dark red
     
+    # Number of serialized creature/boss embeds kept in memory
+    EMBED_CACHE_SIZE = 64
+    
     def __init__(self):
         # Use the custom skull and sword icon provided by user
         self.bot_icon = "⚔️💀"
         # URL to the custom icon image (to be replaced with actual GitHub repo URL)
         self.custom_icon_url = "https://raw.githubusercontent.com/yourusername/tibia-discord-bot/main/attached_assets/ChatGPT%20Image%20Jul%2016%2C%202025%2C%2007_23_14%20PM_1752854691041.png"
         
-    def create_creature_embed(self, creature_name: str, creature_details: Optional[Dict[str, Any]], boosted_data: Dict[str, Any]) -> discord.Embed:
+        # Serialized embeds keyed by (creature, details, variant); details models are frozen and hashable
+        self._embed_cache: "OrderedDict[Tuple[str, Optional[CreatureDetails], str], Dict[str, Any]]" = OrderedDict()
+        self.embed_cache_hits = 0
+        self.embed_cache_misses = 0
+        
+    def _memoized_embed(self, variant: str, name: str, details: Optional[CreatureDetails], boosted_data: Optional[BoostedSnapshot], title: Optional[str]) -> discord.Embed:
+        """Build an embed once per (creature, details, variant) and hand out copies"""
+        key = (name.lower(), details, variant)
+        data = self._embed_cache.get(key)
+        
+        if data is None:
+            self.embed_cache_misses += 1
+            if variant == 'boss':
+                embed = self.create_boss_embed(name, details, boosted_data)
+            else:
+                embed = self.create_creature_embed(name, details, boosted_data)
+            data = embed.to_dict()
+            
+            self._embed_cache[key] = data
+            while len(self._embed_cache) > self.EMBED_CACHE_SIZE:
+                self._embed_cache.popitem(last=False)
+        else:
+            self.embed_cache_hits += 1
+            self._embed_cache.move_to_end(key)
+        
+        # from_dict keeps references to nested lists/dicts, so give each copy its own fields
+        copy = discord.Embed.from_dict(dict(data, fields=[dict(field) for field in data.get('fields', [])]))
+        # The cached dict keeps the first build's time; each copy is stamped when it's handed out
+        copy.timestamp = datetime.now(timezone.utc)
+        if title is not None:
+            copy.title = title
+        return copy
+    
+    def get_creature_embed(self, creature_name: str, creature_details: Optional[CreatureDetails], boosted_data: Optional[BoostedSnapshot], title: Optional[str] = None) -> discord.Embed:
+        """
+        Get the boosted creature embed, reusing a previously built one when the details are unchanged
+        
+        Args:
+            creature_name: Name of the boosted creature
+            creature_details: Normalized creature details
+            boosted_data: Boosted creature/boss snapshot
+            title: Optional title override for this copy
+            
+        Returns:
+            Discord embed object (safe to modify)
+        """
+        return self._memoized_embed('creature', creature_name, creature_details, boosted_data, title)
+    
+    def get_boss_embed(self, boss_name: str, boss_details: Optional[CreatureDetails], boosted_data: Optional[BoostedSnapshot], title: Optional[str] = None) -> discord.Embed:
+        """
+        Get the boosted boss embed, reusing a previously built one when the details are unchanged
+        
+        Args:
+            boss_name: Name of the boosted boss
+            boss_details: Normalized boss details
+            boosted_data: Boosted creature/boss snapshot
+            title: Optional title override for this copy
+            
+        Returns:
+            Discord embed object (safe to modify)
+        """
+        return self._memoized_embed('boss', boss_name, boss_details, boosted_data, title)
+        
+    def create_creature_embed(self, creature_name: str, creature_details: Optional[CreatureDetails], boosted_data: Optional[BoostedSnapshot]) -> discord.Embed:
         """
         Create embed for boosted creature announcement
         
         Args:
             creature_name: Name of the boosted creature
-            creature_details: Detailed creature info from API
-            boosted_data: Boosted creature data
+            creature_details: Normalized creature details
+            boosted_data: Boosted creature/boss snapshot
             
         Returns:
             Discord embed object
@@ -37,8 +108,8 @@ class EmbedBuilder:
         )
         
         # Add creature image if available
-        if creature_details and 'image_url' in creature_details:
-            embed.set_thumbnail(url=creature_details['image_url'])
+        if creature_details and creature_details.image_url:
+            embed.set_thumbnail(url=creature_details.image_url)
         else:
             # Try to construct image URL from TibiaWiki
             image_url = self._get_tibiawiki_image_url(creature_name)
@@ -81,14 +152,14 @@ class EmbedBuilder:
         
         return embed
     
-    def create_boss_embed(self, boss_name: str, boss_details: Optional[Dict[str, Any]], boosted_data: Dict[str, Any]) -> discord.Embed:
+    def create_boss_embed(self, boss_name: str, boss_details: Optional[CreatureDetails], boosted_data: Optional[BoostedSnapshot]) -> discord.Embed:
         """
         Create embed for boosted boss announcement
         
         Args:
             boss_name: Name of the boosted boss
-            boss_details: Detailed boss info from API
-            boosted_data: Boosted boss data
+            boss_details: Normalized boss details
+            boosted_data: Boosted creature/boss snapshot
             
         Returns:
             Discord embed object
@@ -101,8 +172,8 @@ class EmbedBuilder:
         )
         
         # Add boss image if available
-        if boss_details and 'image_url' in boss_details:
-            embed.set_thumbnail(url=boss_details['image_url'])
+        if boss_details and boss_details.image_url:
+            embed.set_thumbnail(url=boss_details.image_url)
         else:
             # Try to construct image URL from TibiaWiki
             image_url = self._get_tibiawiki_image_url(boss_name)
@@ -145,79 +216,41 @@ class EmbedBuilder:
         
         return embed
     
-    def _add_creature_stats(self, embed: discord.Embed, creature_details: Dict[str, Any], is_boss: bool = False) -> None:
+    def _add_creature_stats(self, embed: discord.Embed, creature_details: CreatureDetails, is_boss: bool = False) -> None:
         """
         Add creature/boss statistics to embed
         
         Args:
             embed: Discord embed to modify
-            creature_details: Creature data from API
+            creature_details: Normalized creature details
             is_boss: Whether this is a boss or regular creature
         """
-        try:
-            # Extract basic information
-            hp = creature_details.get('hitpoints', 'Unknown')
-            exp = creature_details.get('experience_points', 'Unknown')
-            
-            # Format HP and experience
-            if isinstance(hp, (int, float)):
-                hp_formatted = f"{int(hp):,}"
-            else:
-                hp_formatted = str(hp)
-                
-            if isinstance(exp, (int, float)):
-                exp_formatted = f"{int(exp):,}"
-            else:
-                exp_formatted = str(exp)
-            
-            # Add stats field
-            stats_value = f"❤️ **HP:** {hp_formatted}\n🌟 **Experience:** {exp_formatted}"
-            
-            # Add additional boss-specific info
-            if is_boss:
-                embed.add_field(name="📊 Boss Stats", value=stats_value, inline=True)
-            else:
-                embed.add_field(name="📊 Creature Stats", value=stats_value, inline=True)
-            
-            # Add description if available
-            description = creature_details.get('description')
-            if description and len(description.strip()) > 0:
-                # Truncate long descriptions
-                if len(description) > 200:
-                    description = description[:197] + "..."
-                embed.add_field(
-                    name="📝 Description",
-                    value=description,
-                    inline=False
-                )
-            
-            # Add loot information if available
-            featured_loot = creature_details.get('loot', [])
-            if featured_loot and isinstance(featured_loot, list):
-                # Show first few valuable loot items
-                loot_items = []
-                for item in featured_loot[:3]:  # Show max 3 items
-                    if isinstance(item, dict) and 'name' in item:
-                        loot_items.append(item['name'])
-                
-                if loot_items:
-                    loot_text = "\n".join([f"• {item}" for item in loot_items])
-                    if len(featured_loot) > 3:
-                        loot_text += f"\n• ...and {len(featured_loot) - 3} more items"
-                    
-                    embed.add_field(
-                        name="💰 Notable Loot",
-                        value=loot_text,
-                        inline=True
-                    )
-            
-        except Exception as e:
-            # If there's an error parsing creature data, add a simple info field
+        stats_value = f"❤️ **HP:** {creature_details.hitpoints_text}\n🌟 **Experience:** {creature_details.experience_text}"
+        embed.add_field(name="📊 Boss Stats" if is_boss else "📊 Creature Stats", value=stats_value, inline=True)
+        
+        # Add description if available
+        description = creature_details.description
+        if description:
+            # Truncate long descriptions
+            if len(description) > 200:
+                description = description[:197] + "..."
             embed.add_field(
-                name="ℹ️ Information",
-                value="Unable to parse creature statistics",
+                name="📝 Description",
+                value=description,
                 inline=False
             )
+        
+        # Show first few loot items
+        if creature_details.loot:
+            loot_text = "\n".join(f"• {item}" for item in creature_details.loot_names(3))
+            if len(creature_details.loot) > 3:
+                loot_text += f"\n• ...and {len(creature_details.loot) - 3} more items"
+            
+            embed.add_field(
+                name="💰 Notable Loot",
+                value=loot_text,
+                inline=True
+            )
     
     def _get_tibiawiki_image_url(self, creature_name: str) -> Optional[str]:
         """
@@ -242,6 +275,117 @@ class EmbedBuilder:
         except Exception:
             return None
     
+    def create_lookup_embed(self, name: str, details: Optional[CreatureDetails], is_boss: bool, boosted_today: bool = False, last_boosted: Optional[date] = None) -> discord.Embed:
+        """
+        Create embed with the details of any creature/boss
+        
+        Args:
+            name: Creature or boss name, as spelled in the catalog
+            details: Normalized creature details
+            is_boss: Whether this is a boss or regular creature
+            boosted_today: Whether it is today's boosted creature/boss
+            last_boosted: Last day it was boosted, if in the history
+            
+        Returns:
+            Discord embed object
+        """
+        description = f"{'Boss' if is_boss else 'Creature'} details"
+        if boosted_today:
+            description = f"⚡ Today's boosted {'boss' if is_boss else 'creature'}!"
+        embed = discord.Embed(
+            title=f"🔎 {name}",
+            description=description,
+            color=self.BOSS_COLOR if is_boss else self.CREATURE_COLOR,
+            timestamp=datetime.utcnow()
+        )
+        
+        image_url = details.image_url if details and details.image_url else self._get_tibiawiki_image_url(name)
+        if image_url:
+            embed.set_thumbnail(url=image_url)
+        
+        if details:
+            self._add_creature_stats(embed, details, is_boss)
+        else:
+            embed.add_field(name="ℹ️ Information", value="Detailed data not available", inline=False)
+        
+        if last_boosted and not boosted_today:
+            embed.add_field(name="📅 Last Boosted", value=last_boosted.strftime('%Y-%m-%d'), inline=True)
+        
+        embed.set_footer(
+            text=f"{self.bot_icon} TibiaBot | Data from TibiaData API",
+            icon_url=self.custom_icon_url
+        )
+        
+        return embed
+    
+    def create_history_embed(self, stats: BoostedStats) -> discord.Embed:
+        """
+        Create embed summarizing a creature/boss's boosted history
+        
+        Args:
+            stats: Boosted history stats for the creature/boss
+            
+        Returns:
+            Discord embed object
+        """
+        is_boss = stats.kind == 'boss'
+        embed = discord.Embed(
+            title=f"📜 {stats.name}",
+            description=f"Boosted {'boss' if is_boss else 'creature'} history",
+            color=self.BOSS_COLOR if is_boss else self.CREATURE_COLOR,
+            timestamp=datetime.utcnow()
+        )
+        
+        embed.add_field(name="📅 Last Boosted", value=stats.last.strftime('%Y-%m-%d'), inline=True)
+        embed.add_field(name="🔢 Times Boosted", value=f"{stats.count} ({stats.last_year} in the last year)", inline=True)
+        embed.add_field(name="🗓️ First Seen", value=stats.first.strftime('%Y-%m-%d'), inline=True)
+        
+        streak = f"{stats.longest_streak} day{'s' if stats.longest_streak != 1 else ''}"
+        if stats.current_streak:
+            streak += f" (current: {stats.current_streak})"
+        embed.add_field(name="🔥 Longest Streak", value=streak, inline=True)
+        
+        if stats.average_gap is not None:
+            embed.add_field(name="⏳ Average Gap", value=f"{stats.average_gap:.0f} days", inline=True)
+        
+        embed.set_footer(text=f"{self.bot_icon} TibiaBot", icon_url=self.custom_icon_url)
+        
+        return embed
+    
+    def create_forecast_embed(self, kind: str, horizon: int, forecasts: Sequence[Forecast], days_observed: int) -> discord.Embed:
+        """
+        Create embed ranking the creatures/bosses most likely to be boosted soon
+        
+        Args:
+            kind: Either 'creature' or 'boss'
+            horizon: Days ahead the probabilities are for
+            forecasts: Precomputed forecasts, most likely first
+            days_observed: Days of history the forecast is based on
+            
+        Returns:
+            Discord embed object
+        """
+        is_boss = kind == 'boss'
+        lines = [
+            f"**{index}. {forecast.name}** — {forecast.probability:.0%} "
+            f"(last {forecast.days_since}d ago, {forecast.count}× boosted)"
+            for index, forecast in enumerate(forecasts, start=1)
+        ]
+        
+        embed = discord.Embed(
+            title=f"🔮 Boosted {'Boss' if is_boss else 'Creature'} Forecast — next {horizon} day{'s' if horizon != 1 else ''}",
+            description="\n".join(lines) or "Not enough history yet",
+            color=self.BOSS_COLOR if is_boss else self.CREATURE_COLOR,
+            timestamp=datetime.utcnow()
+        )
+        
+        embed.set_footer(
+            text=f"{self.bot_icon} TibiaBot • Based on {days_observed} days of history",
+            icon_url=self.custom_icon_url
+        )
+        
+        return embed
+    
     def create_error_embed(self, title: str, description: str) -> discord.Embed:
         """
         Create error embed
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List
+
+import discord
+
+from bot.ratelimit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class FanoutResult:
+    """Outcome of sending one payload to many channels"""
+
+    __slots__ = ('messages', 'failed', 'gone', 'elapsed')
+
+    def __init__(self):
+        self.messages: Dict[int, discord.Message] = {}
+        # Channels whose send failed after all retries
+        self.failed: Dict[int, str] = {}
+        # Channels that no longer exist
+        self.gone: List[int] = []
+        self.elapsed = 0.0
+
+    @property
+    def sent(self) -> int:
+        return len(self.messages)
+
+
+class FanoutDispatcher:
+    """
+    Send the same message to many Discord channels concurrently
+
+    Concurrency is bounded by a semaphore and the overall request rate by a token
+    bucket sized to Discord's global rate limit. Each channel is its own per-route
+    bucket for message creation, so channels never queue behind each other;
+    discord.py additionally honours the per-route buckets and 429 responses it sees.
+    Server errors and rate limits are retried with backoff. Forbidden is not
+    retried, and NotFound channels are reported as gone so their subscriptions
+    can be cleaned up.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 50,
+        rate_per_second: float = 45,
+        max_retries: int = 3,
+        retry_base_delay: float = 1.0
+    ):
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self._bucket = TokenBucket(rate=rate_per_second, capacity=rate_per_second)
+
+    async def _send_one(
+        self,
+        channel_id: int,
+        send: Callable[[int], Awaitable[discord.Message]],
+        semaphore: asyncio.Semaphore,
+        result: FanoutResult
+    ) -> None:
+        async with semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self._bucket.acquire()
+                try:
+                    result.messages[channel_id] = await send(channel_id)
+                    return
+                except discord.NotFound as e:
+                    logger.warning(f"Channel {channel_id} no longer exists: {e}")
+                    result.gone.append(channel_id)
+                    return
+                except discord.Forbidden as e:
+                    logger.error(f"No permission to send messages in channel {channel_id}: {e}")
+                    result.failed[channel_id] = str(e)
+                    return
+                except discord.HTTPException as e:
+                    retryable = e.status == 429 or e.status >= 500
+                    if not retryable or attempt >= self.max_retries:
+                        result.failed[channel_id] = str(e)
+                        logger.error(f"Failed to send to channel {channel_id}: {e}")
+                        return
+                except Exception as e:
+                    if attempt >= self.max_retries:
+                        result.failed[channel_id] = str(e)
+                        logger.error(f"Failed to send to channel {channel_id}: {e}")
+                        return
+
+                await asyncio.sleep(self.retry_base_delay * 2 ** attempt)
+
+    async def send(
+        self,
+        channel_ids: Iterable[int],
+        send: Callable[[int], Awaitable[discord.Message]]
+    ) -> FanoutResult:
+        """
+        Send to every channel, at most `concurrency` at a time
+
+        Args:
+            channel_ids: Target channel IDs (duplicates are sent once)
+            send: Coroutine function sending the message to one channel ID
+
+        Returns:
+            FanoutResult with sent messages, failures and gone channels
+        """
+        result = FanoutResult()
+        start = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        targets = list(dict.fromkeys(channel_id for channel_id in channel_ids if channel_id))
+        await asyncio.gather(*(self._send_one(channel_id, send, semaphore, result) for channel_id in targets))
+
+        result.elapsed = time.perf_counter() - start
+        if targets:
+            logger.info(
+                f"Fan-out to {len(targets)} channels: {result.sent} sent, "
+                f"{len(result.failed)} failed, {len(result.gone)} gone in {result.elapsed:.2f}s"
+            )
+        return result
@@ -0,0 +1,248 @@
+import bisect
+import logging
+import math
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from bot.history import BoostedHistory
+from bot.server_save import last_server_save
+from bot.state_store import KINDS
+
+logger = logging.getLogger(__name__)
+
+# Forecast horizons (days) offered by /forecast; each is precomputed after the daily post
+HORIZONS = (1, 3, 7, 14, 30)
+
+
+@dataclass(frozen=True, slots=True)
+class Forecast:
+    """Chance of a creature/boss being boosted within the horizon, with the stats behind it"""
+
+    name: str
+    probability: float
+    count: int
+    last: date
+    days_since: int
+    mean_gap: Optional[float]
+    gap_stddev: Optional[float]
+
+
+class _NameStats:
+    """Running count and gap mean/variance (Welford) for one name"""
+
+    __slots__ = ('name', 'count', 'last', 'gaps', 'gap_mean', 'gap_m2')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.last = 0
+        self.gaps = 0
+        self.gap_mean = 0.0
+        self.gap_m2 = 0.0
+
+    def add_gap(self, gap: int) -> None:
+        self.gaps += 1
+        delta = gap - self.gap_mean
+        self.gap_mean += delta / self.gaps
+        self.gap_m2 += delta * (gap - self.gap_mean)
+
+    @property
+    def gap_stddev(self) -> Optional[float]:
+        return math.sqrt(self.gap_m2 / (self.gaps - 1)) if self.gaps > 1 else None
+
+
+class KindForecaster:
+    """
+    Incremental rotation statistics for one kind (creature or boss)
+
+    `observe` folds in one day at a time: per-name counts, last-seen day and gap
+    mean/variance, plus a pooled histogram of gaps between repeat boosts.
+    """
+
+    def __init__(self, kind: str, smoothing: float = 1.0, min_gaps: int = 30):
+        self.kind = kind
+        self.smoothing = smoothing
+        self.min_gaps = min_gaps
+        self.reset()
+
+    def reset(self) -> None:
+        self.days = 0
+        self.last_day = 0
+        self._names: Dict[str, _NameStats] = {}
+        # Pooled gap length -> occurrences, across all names
+        self._gap_counts: Dict[int, int] = {}
+        self._total_gaps = 0
+
+    def observe(self, day: date, name: str) -> bool:
+        """
+        Fold in the boosted name of a day later than any observed so far
+
+        Returns:
+            False if the day isn't newer (the caller has to rebuild instead)
+        """
+        ordinal = day.toordinal()
+        if ordinal <= self.last_day:
+            return False
+
+        self.days += 1
+        self.last_day = ordinal
+
+        stats = self._names.get(name.lower())
+        if stats is None:
+            stats = self._names[name.lower()] = _NameStats(name)
+        elif stats.count:
+            gap = ordinal - stats.last
+            stats.add_gap(gap)
+            self._gap_counts[gap] = self._gap_counts.get(gap, 0) + 1
+            self._total_gaps += 1
+
+        stats.name = name
+        stats.count += 1
+        stats.last = ordinal
+        return True
+
+    def _survival(self) -> Optional[Tuple[List[int], List[int]]]:
+        """Sorted gap lengths and how many gaps are longer than each, or None with too few gaps"""
+        if self._total_gaps < self.min_gaps:
+            return None
+        gaps = sorted(self._gap_counts)
+        longer = []
+        remaining = self._total_gaps
+        for gap in gaps:
+            remaining -= self._gap_counts[gap]
+            longer.append(remaining)
+        return gaps, longer
+
+    def _longer_than(self, survival: Tuple[List[int], List[int]], days: int) -> int:
+        gaps, longer = survival
+        index = bisect.bisect_right(gaps, days) - 1
+        return self._total_gaps if index < 0 else longer[index]
+
+    def forecast(self, horizons: Sequence[int], today: date) -> Dict[int, Tuple[Forecast, ...]]:
+        """
+        Probability of each known name being boosted within each horizon
+
+        With enough repeat boosts, the pooled gap distribution conditioned on the
+        days since the name was last boosted is used: P(gap <= s + N | gap > s).
+        Otherwise (or past the longest gap seen) it falls back to the name's
+        smoothed daily frequency, assuming independent days.
+
+        Args:
+            horizons: Days ahead to forecast for
+            today: Current server-save day
+
+        Returns:
+            Dict mapping horizon to forecasts, most likely first
+        """
+        survival = self._survival()
+        pool = max(1, len(self._names))
+        today_ordinal = today.toordinal()
+
+        tables: Dict[int, List[Forecast]] = {horizon: [] for horizon in horizons}
+        for stats in self._names.values():
+            days_since = max(0, today_ordinal - stats.last)
+            rate = (stats.count + self.smoothing) / (self.days + self.smoothing * pool)
+            alive = self._longer_than(survival, days_since) if survival else 0
+
+            for horizon in horizons:
+                if alive:
+                    probability = (alive - self._longer_than(survival, days_since + horizon)) / alive
+                else:
+                    probability = 1 - (1 - rate) ** horizon
+                tables[horizon].append(Forecast(
+                    name=stats.name,
+                    probability=probability,
+                    count=stats.count,
+                    last=date.fromordinal(stats.last),
+                    days_since=days_since,
+                    mean_gap=stats.gap_mean if stats.gaps else None,
+                    gap_stddev=stats.gap_stddev
+                ))
+
+        return {
+            horizon: tuple(sorted(rows, key=lambda row: (-row.probability, -row.days_since, row.name)))
+            for horizon, rows in tables.items()
+        }
+
+
+class RotationForecaster:
+    """
+    Boost forecasts for creatures and bosses, precomputed for every horizon
+
+    Statistics are updated one day at a time as rotations are recorded; the
+    ranked tables and per-name lookups are rebuilt right after, so /forecast only
+    does dict lookups and slices, independent of the history size.
+    """
+
+    def __init__(self, horizons: Sequence[int] = HORIZONS, smoothing: float = 1.0, min_gaps: int = 30):
+        self.horizons = tuple(horizons)
+        self._kinds = {kind: KindForecaster(kind, smoothing, min_gaps) for kind in KINDS}
+        self._tables: Dict[Tuple[str, int], Tuple[Forecast, ...]] = {}
+        self._by_name: Dict[Tuple[str, int], Dict[str, Forecast]] = {}
+        self.computed_at: Optional[float] = None
+        self.compute_seconds = 0.0
+
+    def rebuild(self, history: BoostedHistory, today: Optional[date] = None) -> None:
+        """Recompute the statistics from the whole history (startup, or after a past day changed)"""
+        for forecaster in self._kinds.values():
+            forecaster.reset()
+        for entry in history.entries():
+            for kind, forecaster in self._kinds.items():
+                name = entry.name(kind)
+                if name:
+                    forecaster.observe(entry.day, name)
+        self.precompute(today)
+
+    def update(self, history: BoostedHistory, kind: str, day: date, today: Optional[date] = None) -> None:
+        """
+        Fold in a newly recorded rotation and refresh the precomputed forecasts
+
+        Args:
+            history: History the rotation was recorded in
+            kind: Either 'creature' or 'boss'
+            day: Server-save day that was recorded
+            today: Reference day (defaults to the current cycle's)
+        """
+        entry = history.entry(day)
+        name = entry.name(kind) if entry else None
+        if not name or not self._kinds[kind].observe(day, name):
+            # A past day was changed (e.g. a corrected or backfilled post): start over
+            self.rebuild(history, today)
+            return
+        self.precompute(today)
+
+    def precompute(self, today: Optional[date] = None) -> None:
+        """Rank every known name for every horizon"""
+        started = time.perf_counter()
+        today = today or last_server_save().date()
+
+        tables = {}
+        by_name = {}
+        for kind, forecaster in self._kinds.items():
+            for horizon, rows in forecaster.forecast(self.horizons, today).items():
+                tables[(kind, horizon)] = rows
+                by_name[(kind, horizon)] = {row.name.lower(): row for row in rows}
+
+        self._tables = tables
+        self._by_name = by_name
+        self.computed_at = time.time()
+        self.compute_seconds = time.perf_counter() - started
+        logger.info(f"Precomputed boost forecasts in {self.compute_seconds * 1000:.1f}ms")
+
+    def days_observed(self, kind: str) -> int:
+        return self._kinds[kind].days
+
+    def top(self, kind: str, horizon: int, limit: int = 10) -> Tuple[Forecast, ...]:
+        """Most likely names to be boosted within horizon days"""
+        return self._tables.get((kind, horizon), ())[:limit]
+
+    def lookup(self, name: str, horizon: int) -> Optional[Tuple[str, Forecast]]:
+        """(kind, forecast) for a name, or None if it was never boosted"""
+        key = name.strip().lower()
+        for kind in KINDS:
+            row = self._by_name.get((kind, horizon), {}).get(key)
+            if row is not None:
+                return kind, row
+        return None
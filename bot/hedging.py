@@ -0,0 +1,270 @@
+import asyncio
+import bisect
+import html
+import logging
+import re
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from bot.tibia_api import TibiaAPI
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 7.5, 10.0, 15.0, 30.0, 60.0)
+
+TIBIA_COM_NEWS_URL = "https://www.tibia.com/news/?subtopic=latestnews"
+
+# The boosted creature/boss images in tibia.com's right column carry the names in their title
+_COMMUNITY_BOOSTED = {
+    kind: re.compile(r'''title=(["'])Today(?:'|&#0?39;|&apos;)s boosted %s:\s*(.+?)\1''' % kind, re.IGNORECASE)
+    for kind in ('creature', 'boss')
+}
+
+# TibiaData endpoint -> (kind, payload section)
+BOOSTED_ENDPOINTS = {
+    'creatures': ('creature', 'creatures'),
+    'boostablebosses': ('boss', 'boostable_bosses')
+}
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with approximate quantiles"""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        # One extra bucket for anything slower than the last bound
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.failures = 0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th quantile, or None without samples"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return self.buckets[index] if index < len(self.buckets) else float('inf')
+        return float('inf')
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'failures': self.failures,
+            'mean': self.total / self.count if self.count else None,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95)
+        }
+
+
+def parse_community_boosted(page: str) -> Dict[str, str]:
+    """
+    Boosted creature/boss names from a tibia.com page
+
+    Args:
+        page: HTML of a tibia.com page with the right-column boosted box
+
+    Returns:
+        Dict with 'creature' and/or 'boss' names
+    """
+    names = {}
+    for kind, pattern in _COMMUNITY_BOOSTED.items():
+        match = pattern.search(page)
+        if match:
+            names[kind] = html.unescape(match.group(2)).strip()
+    return names
+
+
+class Origin(ABC):
+    """Somewhere boosted data can be fetched from"""
+
+    name = ''
+    # Where the origin lives, for connection warm-up
+    url: Optional[str] = None
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.wins = 0
+
+    @abstractmethod
+    async def fetch(self, api: 'TibiaAPI', endpoint: str, retries: int) -> Optional[Dict[str, Any]]:
+        """Fetch a TibiaData-shaped payload for endpoint, or None"""
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(self.latency.stats(), wins=self.wins)
+
+
+class TibiaDataOrigin(Origin):
+    """TibiaData itself or a self-hosted mirror with the same API"""
+
+    def __init__(self, base_url: str, name: Optional[str] = None):
+        super().__init__()
+        self.base_url = base_url.rstrip('/')
+        self.url = self.base_url
+        self.name = name or self.base_url
+
+    async def fetch(self, api, endpoint, retries):
+        return await api._fetch_json(endpoint, retries, base_url=self.base_url)
+
+
+class TibiaComOrigin(Origin):
+    """
+    The boosted box on tibia.com's news page, shaped like a TibiaData payload
+
+    It only knows the boosted names (no creature lists), so its payloads are
+    marked `partial` and never stand in for the list endpoints or the catalog.
+    """
+
+    name = 'tibia.com'
+
+    def __init__(self, url: str = TIBIA_COM_NEWS_URL):
+        super().__init__()
+        self.url = url
+
+    async def _names(self, api: 'TibiaAPI') -> Dict[str, str]:
+        status, page, _ = await api._fetch(self.url, retries=0, as_json=False)
+        return parse_community_boosted(page) if status == 200 and page else {}
+
+    async def fetch(self, api, endpoint, retries):
+        if endpoint not in BOOSTED_ENDPOINTS:
+            return None
+
+        # Creature and boss are usually hedged at the same time; download the page once
+        names = await api.single_flight.do(f"origin:{self.url}", lambda: self._names(api))
+        kind, section = BOOSTED_ENDPOINTS[endpoint]
+        if not names.get(kind):
+            return None
+
+        return {
+            section: {'boosted': {'name': names[kind]}},
+            'information': {
+                'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'origin': self.name,
+                'partial': True
+            }
+        }
+
+
+class HedgedFetcher:
+    """
+    Fetch from the primary origin, hedging to the next one when it is slow
+
+    If the primary hasn't answered after its observed p95 latency (or
+    `default_delay` until `min_samples` answers were seen), the same request is
+    sent to the next origin as well, and the first valid answer wins. An origin
+    that fails is replaced by the next one right away. Losers are cancelled.
+    """
+
+    def __init__(
+        self,
+        origins: List[Origin],
+        default_delay: float = 2.0,
+        quantile: float = 0.95,
+        min_samples: int = 20,
+        min_delay: float = 0.2,
+        max_delay: float = 10.0
+    ):
+        self.origins = origins
+        self.default_delay = default_delay
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+
+        self.requests = 0
+        self.hedges = 0
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait on the primary before hedging"""
+        latency = self.origins[0].latency
+        if latency.count < self.min_samples:
+            return self.default_delay
+        return min(self.max_delay, max(self.min_delay, latency.quantile(self.quantile)))
+
+    async def _timed(self, origin: Origin, api: 'TibiaAPI', endpoint: str, retries: int, validate: Callable[[Any], bool]) -> Optional[Any]:
+        started = time.monotonic()
+        try:
+            data = await origin.fetch(api, endpoint, retries)
+            # A malformed answer (e.g. a JSON list from a broken mirror) fails this origin only
+            valid = data is not None and validate(data)
+        except asyncio.CancelledError:
+            # Lost the race: still record how long it was at least, or the slow tail never shows up in p95
+            origin.latency.record(time.monotonic() - started)
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching {endpoint} from {origin.name}: {e}")
+            valid = False
+
+        if valid:
+            origin.latency.record(time.monotonic() - started)
+            return data
+        origin.latency.failures += 1
+        return None
+
+    async def fetch(self, api: 'TibiaAPI', endpoint: str, validate: Callable[[Any], bool], retries: int = 3) -> Optional[Any]:
+        """
+        Fetch endpoint from the first origin that answers validly
+
+        Args:
+            api: TibiaAPI whose session and host guards to use
+            endpoint: TibiaData endpoint path
+            validate: Predicate deciding whether an answer is usable
+            retries: Retries per origin request
+
+        Returns:
+            The winning payload, or None if every origin failed
+        """
+        self.requests += 1
+        remaining = list(self.origins)
+        pending: Dict[asyncio.Task, Origin] = {}
+
+        def launch() -> None:
+            origin = remaining.pop(0)
+            pending[asyncio.create_task(self._timed(origin, api, endpoint, retries, validate))] = origin
+
+        launch()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, timeout=self.hedge_delay() if remaining else None, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    self.hedges += 1
+                    logger.info(f"{endpoint} slower than {self.hedge_delay():.1f}s, hedging to {remaining[0].name}")
+                    launch()
+                    continue
+
+                for task in done:
+                    origin = pending.pop(task)
+                    data = task.result()
+                    if data is not None:
+                        origin.wins += 1
+                        return data
+                    if remaining:
+                        logger.warning(f"{origin.name} failed for {endpoint}, trying {remaining[0].name}")
+                        launch()
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'hedges': self.hedges,
+            'hedge_delay': self.hedge_delay(),
+            'origins': {origin.name: origin.stats() for origin in self.origins}
+        }
@@ -0,0 +1,328 @@
+import bisect
+import glob
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from bot.server_save import last_server_save
+from bot.state_store import KINDS
+
+logger = logging.getLogger(__name__)
+
+# "2025-07-18 10:00:42,123 - bot.tibia_api - INFO - Fetched boosted data: creature=Demon, boss=Ferumbras"
+_TEXT_LOG_LINE = re.compile(
+    r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})[,.]\d+ - \S+ - \w+ - (Fetched boosted data: .*)$'
+)
+_FETCHED_MESSAGE = re.compile(
+    r'^Fetched boosted data: creature=(.*?), boss=(.*?)(?: \(\d+ similar messages suppressed\))?$'
+)
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryEntry:
+    """The boosted creature and boss of one server-save day"""
+
+    day: date
+    creature: Optional[str] = None
+    boss: Optional[str] = None
+    timestamp: Optional[str] = None
+
+    def name(self, kind: str) -> Optional[str]:
+        return self.creature if kind == 'creature' else self.boss
+
+    def to_json(self) -> Dict[str, Optional[str]]:
+        return {'date': self.day.isoformat(), 'creature': self.creature, 'boss': self.boss, 'timestamp': self.timestamp}
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Optional[str]]) -> 'HistoryEntry':
+        return cls(
+            day=date.fromisoformat(data['date']),
+            creature=data.get('creature') or None,
+            boss=data.get('boss') or None,
+            timestamp=data.get('timestamp') or None
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class BoostedStats:
+    """How often and when a creature/boss was boosted"""
+
+    name: str
+    kind: str
+    count: int
+    first: date
+    last: date
+    last_year: int
+    longest_streak: int
+    current_streak: int
+    average_gap: Optional[float]
+
+
+class BoostedHistory:
+    """
+    Append-only archive of every boosted rotation, indexed by day and by name
+
+    Each change is appended to a JSON Lines file as the full entry for its day;
+    when the file is loaded, later lines for a day replace earlier ones. Everything
+    is indexed in memory (day -> entry, (kind, name) -> sorted day ordinals), so
+    queries are dict lookups plus bisects and never touch the file or the network.
+    """
+
+    def __init__(self, path: str = "boosted_history.jsonl"):
+        self.path = path
+        self._by_day: Dict[int, HistoryEntry] = {}
+        self._days: List[int] = []
+        self._by_name: Dict[Tuple[str, str], List[int]] = {}
+        # Lower-cased name -> name as last recorded
+        self._display: Dict[str, str] = {}
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._by_day)
+
+    def load(self) -> None:
+        """Rebuild the indexes from the history file"""
+        self._by_day.clear()
+        self._days.clear()
+        self._by_name.clear()
+        self._display.clear()
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.error(f"Could not read boosted history from {self.path}: {e}")
+            return
+
+        skipped = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                self._index(HistoryEntry.from_json(json.loads(line)))
+            except (ValueError, KeyError, TypeError):
+                skipped += 1
+
+        if skipped:
+            logger.error(f"Skipped {skipped} unreadable lines in {self.path}")
+        logger.info(f"Loaded boosted history: {len(self._by_day)} days")
+
+    def _index(self, entry: HistoryEntry) -> None:
+        """Put entry in the indexes, replacing whatever was recorded for its day"""
+        ordinal = entry.day.toordinal()
+        previous = self._by_day.get(ordinal)
+        if previous is None:
+            bisect.insort(self._days, ordinal)
+
+        for kind in KINDS:
+            old, new = previous.name(kind) if previous else None, entry.name(kind)
+            if old and (not new or old.lower() != new.lower()):
+                days = self._by_name.get((kind, old.lower()), [])
+                index = bisect.bisect_left(days, ordinal)
+                if index < len(days) and days[index] == ordinal:
+                    days.pop(index)
+            if new:
+                days = self._by_name.setdefault((kind, new.lower()), [])
+                index = bisect.bisect_left(days, ordinal)
+                if index == len(days) or days[index] != ordinal:
+                    days.insert(index, ordinal)
+                self._display[new.lower()] = new
+
+        self._by_day[ordinal] = entry
+
+    def _append(self, entry: HistoryEntry) -> None:
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry.to_json(), ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            logger.error(f"Could not append to boosted history {self.path}: {e}")
+
+    def record(self, kind: str, name: str, day: Optional[date] = None, timestamp: Optional[str] = None) -> bool:
+        """
+        Record the boosted creature or boss of a day
+
+        Args:
+            kind: Either 'creature' or 'boss'
+            name: Boosted name
+            day: Server-save day (defaults to the current cycle's)
+            timestamp: API timestamp the name came from
+
+        Returns:
+            True if the history changed
+        """
+        day = day or last_server_save().date()
+        entry = self._by_day.get(day.toordinal()) or HistoryEntry(day)
+        if entry.name(kind) == name:
+            return False
+
+        changes = {kind: name}
+        if timestamp and (kind == 'creature' or not entry.timestamp):
+            changes['timestamp'] = timestamp
+        entry = replace(entry, **changes)
+
+        self._index(entry)
+        self._append(entry)
+        return True
+
+    def entry(self, day: date) -> Optional[HistoryEntry]:
+        """What was boosted on a server-save day"""
+        return self._by_day.get(day.toordinal())
+
+    def entries(self) -> Iterator[HistoryEntry]:
+        """All entries, oldest day first"""
+        return (self._by_day[ordinal] for ordinal in self._days)
+
+    def latest(self) -> Optional[HistoryEntry]:
+        return self._by_day[self._days[-1]] if self._days else None
+
+    def names(self, kind: Optional[str] = None) -> List[str]:
+        """Every name in the history (of one kind, if given)"""
+        keys = (name for key_kind, name in self._by_name if kind is None or key_kind == kind)
+        return sorted({self._display[name] for name in keys})
+
+    def _days_for(self, name: str, kind: Optional[str]) -> Tuple[Optional[str], List[int]]:
+        """(kind, sorted day ordinals) of a name; without kind, the kind it was boosted as"""
+        key = name.strip().lower()
+        for candidate in ((kind,) if kind else KINDS):
+            days = self._by_name.get((candidate, key))
+            if days:
+                return candidate, days
+        return kind, []
+
+    def last_boosted(self, name: str, kind: Optional[str] = None) -> Optional[date]:
+        """The most recent day name was boosted"""
+        _, days = self._days_for(name, kind)
+        return date.fromordinal(days[-1]) if days else None
+
+    def times_boosted(self, name: str, kind: Optional[str] = None, since: Optional[date] = None) -> int:
+        """How many days name was boosted (on or after `since`, if given)"""
+        _, days = self._days_for(name, kind)
+        if since is None:
+            return len(days)
+        return len(days) - bisect.bisect_left(days, since.toordinal())
+
+    @staticmethod
+    def _streaks(days: List[int], latest: Optional[int]) -> Tuple[int, int]:
+        """(longest, current) runs of consecutive days; current counts only if it reaches `latest`"""
+        longest = run = 0
+        previous = None
+        for ordinal in days:
+            run = run + 1 if previous is not None and ordinal == previous + 1 else 1
+            longest = max(longest, run)
+            previous = ordinal
+        current = run if days and days[-1] == latest else 0
+        return longest, current
+
+    def stats(self, name: str, kind: Optional[str] = None, today: Optional[date] = None) -> Optional[BoostedStats]:
+        """
+        When, how often and how many days in a row name was boosted
+
+        Args:
+            name: Creature or boss name (case-insensitive)
+            kind: 'creature' or 'boss'; without it, whichever the name was boosted as
+            today: Reference day for the last-year count (defaults to the current cycle's)
+
+        Returns:
+            BoostedStats, or None if name was never recorded
+        """
+        kind, days = self._days_for(name, kind)
+        if not days:
+            return None
+
+        today = today or last_server_save().date()
+        longest, current = self._streaks(days, self._days[-1] if self._days else None)
+        return BoostedStats(
+            name=self._display.get(name.strip().lower(), name),
+            kind=kind,
+            count=len(days),
+            first=date.fromordinal(days[0]),
+            last=date.fromordinal(days[-1]),
+            last_year=len(days) - bisect.bisect_left(days, today.toordinal() - 364),
+            longest_streak=longest,
+            current_streak=current,
+            average_gap=(days[-1] - days[0]) / (len(days) - 1) if len(days) > 1 else None
+        )
+
+    def backfill_from_logs(self, patterns: Iterable[str]) -> int:
+        """
+        Fill in days missing from the history using "Fetched boosted data" log lines
+
+        Both the plain text and the JSON log formats are understood. For each
+        server-save day the last logged fetch wins (earlier ones may predate the
+        rotation); halves already in the history are never overwritten.
+
+        Args:
+            patterns: Log file paths or glob patterns (e.g. 'bot.log*')
+
+        Returns:
+            Number of creature/boss halves added
+        """
+        seen: Dict[date, Tuple[datetime, Dict[str, str]]] = {}
+        for pattern in patterns:
+            for path in sorted(glob.glob(pattern)):
+                try:
+                    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                        for line in f:
+                            parsed = self._parse_log_line(line)
+                            if parsed is None:
+                                continue
+                            logged_at, names = parsed
+                            day = last_server_save(logged_at).date()
+                            if day not in seen or logged_at >= seen[day][0]:
+                                seen[day] = (logged_at, names)
+                except OSError as e:
+                    logger.error(f"Could not read log file {path} for backfill: {e}")
+
+        added = 0
+        for day in sorted(seen):
+            entry = self.entry(day)
+            for kind, name in seen[day][1].items():
+                if not (entry and entry.name(kind)) and self.record(kind, name, day):
+                    added += 1
+                    entry = self.entry(day)
+
+        if added:
+            logger.info(f"Backfilled {added} boosted creature/boss records from logs")
+        return added
+
+    @staticmethod
+    def _parse_log_line(line: str) -> Optional[Tuple[datetime, Dict[str, str]]]:
+        """(aware log time, {kind: name}) from a text or JSON 'Fetched boosted data' line"""
+        if 'Fetched boosted data' not in line:
+            return None
+
+        line = line.strip()
+        if line.startswith('{'):
+            try:
+                record = json.loads(line)
+                logged_at = datetime.fromisoformat(record['time'])
+                message = record['message']
+            except (ValueError, KeyError, TypeError):
+                return None
+            if logged_at.tzinfo is None:
+                logged_at = logged_at.replace(tzinfo=timezone.utc)
+        else:
+            match = _TEXT_LOG_LINE.match(line)
+            if not match:
+                return None
+            # Plain text logs use the host's local time
+            logged_at = datetime.strptime(match.group(1), '%Y-%m-%d %H:%M:%S').astimezone()
+            message = match.group(2)
+
+        match = _FETCHED_MESSAGE.match(message)
+        if not match:
+            return None
+        names = {
+            kind: value.strip()
+            for kind, value in zip(KINDS, match.groups())
+            if value.strip() and value.strip() != 'None'
+        }
+        return (logged_at, names) if names else None
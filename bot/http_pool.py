@@ -0,0 +1,117 @@
+import time
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+
+class PoolSettings:
+    """
+    Connection pool settings for the aiohttp connector
+
+    The defaults keep connections and DNS answers around long enough for a
+    warm-up a few minutes before server save to still be useful when polling
+    starts (aiohttp's own defaults are 15s keepalive and 10s DNS cache).
+    """
+
+    __slots__ = ('limit', 'limit_per_host', 'keepalive_timeout', 'ttl_dns_cache', 'use_dns_cache')
+
+    def __init__(
+        self,
+        limit: int = 10,
+        limit_per_host: int = 5,
+        keepalive_timeout: float = 300,
+        ttl_dns_cache: Optional[int] = 600,
+        use_dns_cache: bool = True
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.use_dns_cache = use_dns_cache
+
+    def connector(self) -> aiohttp.TCPConnector:
+        """Create a connector with these settings"""
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=self.use_dns_cache
+        )
+
+
+class PoolStats:
+    """
+    Connection reuse and DNS cache counters, collected through an aiohttp TraceConfig
+
+    `snapshot(connector)` adds the connector's current open/idle/in-use counts.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.created = 0
+        self.reused = 0
+        self.dns_hits = 0
+        self.dns_misses = 0
+        self.connect_seconds = 0.0
+        self._connect_started: Dict[int, float] = {}
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """TraceConfig feeding these counters (pass to ClientSession(trace_configs=[...]))"""
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(self._on_request_start)
+        trace.on_connection_create_start.append(self._on_create_start)
+        trace.on_connection_create_end.append(self._on_create_end)
+        trace.on_connection_reuseconn.append(self._on_reuse)
+        trace.on_dns_cache_hit.append(self._on_dns_hit)
+        trace.on_dns_cache_miss.append(self._on_dns_miss)
+        return trace
+
+    async def _on_request_start(self, session, context, params) -> None:
+        self.requests += 1
+
+    async def _on_create_start(self, session, context, params) -> None:
+        self._connect_started[id(context)] = time.monotonic()
+
+    async def _on_create_end(self, session, context, params) -> None:
+        self.created += 1
+        started = self._connect_started.pop(id(context), None)
+        if started is not None:
+            self.connect_seconds += time.monotonic() - started
+
+    async def _on_reuse(self, session, context, params) -> None:
+        self.reused += 1
+
+    async def _on_dns_hit(self, session, context, params) -> None:
+        self.dns_hits += 1
+
+    async def _on_dns_miss(self, session, context, params) -> None:
+        self.dns_misses += 1
+
+    @property
+    def reuse_rate(self) -> Optional[float]:
+        """Share of connection acquisitions served from the pool"""
+        total = self.created + self.reused
+        return self.reused / total if total else None
+
+    def snapshot(self, connector: Optional[aiohttp.BaseConnector] = None) -> Dict[str, Any]:
+        """Counters plus the connector's current pool state"""
+        stats: Dict[str, Any] = {
+            'requests': self.requests,
+            'created': self.created,
+            'reused': self.reused,
+            'reuse_rate': self.reuse_rate,
+            'dns_hits': self.dns_hits,
+            'dns_misses': self.dns_misses,
+            'avg_connect_seconds': self.connect_seconds / self.created if self.created else None,
+            'open': 0,
+            'idle': 0,
+            'in_use': 0
+        }
+
+        if connector is not None and not connector.closed:
+            # aiohttp has no public API for this; read the pool defensively
+            idle = sum(len(conns) for conns in getattr(connector, '_conns', {}).values())
+            in_use = len(getattr(connector, '_acquired', ()))
+            stats.update(open=idle + in_use, idle=idle, in_use=in_use)
+        return stats
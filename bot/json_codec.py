@@ -0,0 +1,79 @@
+import json
+import logging
+from typing import Any, Callable, Optional
+
+try:
+    import msgspec
+except ImportError:  # optional
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # optional
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('msgspec', 'orjson', 'json')
+
+
+class JSONCodec:
+    """Decode JSON bodies with msgspec, orjson or the stdlib, whichever is selected"""
+
+    def __init__(self, backend: Optional[str] = None):
+        self.backend = self._resolve(backend)
+
+        self._decode: Callable[[bytes], Any]
+
+        if self.backend == 'msgspec':
+            self._decode = msgspec.json.Decoder().decode
+        elif self.backend == 'orjson':
+            self._decode = orjson.loads
+        else:
+            self._decode = json.loads
+
+    @staticmethod
+    def _resolve(backend: Optional[str]) -> str:
+        """Pick the requested backend if installed, else the fastest available"""
+        available = {'msgspec': msgspec is not None, 'orjson': orjson is not None, 'json': True}
+        backend = (backend or 'auto').lower()
+
+        if backend != 'auto':
+            if available.get(backend):
+                return backend
+            logger.warning(f"JSON backend '{backend}' is not available, picking automatically")
+
+        return next(name for name in BACKENDS if available[name])
+
+    def decode(self, body: bytes) -> Any:
+        """
+        Decode a JSON body
+
+        Args:
+            body: Raw response body
+
+        Returns:
+            Decoded data (dicts/lists)
+        """
+        return self._decode(body)
+
+
+_codec = JSONCodec()
+
+
+def set_backend(backend: Optional[str]) -> JSONCodec:
+    """Select the module-wide decoder ('auto', 'msgspec', 'orjson' or 'json')"""
+    global _codec
+    _codec = JSONCodec(backend)
+    logger.info(f"Using {_codec.backend} for JSON decoding")
+    return _codec
+
+
+def get_codec() -> JSONCodec:
+    """The module-wide decoder"""
+    return _codec
+
+
+def decode(body: bytes) -> Any:
+    """Decode a JSON body with the module-wide decoder (picklable for process pools)"""
+    return _codec.decode(body)
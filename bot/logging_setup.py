@@ -0,0 +1,155 @@
+import atexit
+import json
+import logging
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+from typing import Dict, Optional, Sequence, Tuple
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Loggers whose per-request chatter (retries, failed attempts, source fallbacks) gets sampled
+NOISY_LOGGERS = ('bot.tibia_api', 'bot.sources', 'bot.hedging', 'bot.circuit')
+
+# Pass as `extra=` to keep a record out of sampling, e.g. lines other code parses back out of the log
+UNSAMPLED = {'_unsampled': True}
+
+# Attributes every LogRecord has; anything else was passed via `extra=`
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with any `extra=` fields included"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Rate-limit repetitive records per call site
+
+    Records at or below `max_level` from `loggers` are let through `burst` times
+    per `window` seconds for each source line; the rest are dropped and counted.
+    The next record that passes from that line mentions how many were dropped.
+    Errors, records logged with `extra=UNSAMPLED` and anything from other
+    loggers always pass.
+    """
+
+    def __init__(
+        self,
+        loggers: Sequence[str] = NOISY_LOGGERS,
+        max_level: int = logging.WARNING,
+        burst: int = 5,
+        window: float = 60
+    ):
+        super().__init__()
+        self.loggers = tuple(loggers)
+        self.max_level = max_level
+        self.burst = burst
+        self.window = window
+        # (pathname, lineno) -> [window start, passed in window, suppressed since last pass]
+        self._sites: Dict[Tuple[str, int], list] = {}
+        self._lock = threading.Lock()
+        self.suppressed = 0
+
+    def _sampled(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or getattr(record, '_unsampled', False):
+            return False
+        return any(record.name == name or record.name.startswith(name + '.') for name in self.loggers)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.burst <= 0 or not self._sampled(record):
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            site = self._sites.setdefault((record.pathname, record.lineno), [now, 0, 0])
+            if now - site[0] >= self.window:
+                site[0], site[1] = now, 0
+
+            if site[1] >= self.burst:
+                site[2] += 1
+                self.suppressed += 1
+                return False
+
+            site[1] += 1
+            dropped, site[2] = site[2], 0
+
+        if dropped:
+            record.msg = f"{record.getMessage()} ({dropped} similar messages suppressed)"
+            record.args = None
+        return True
+
+
+def setup_logging(
+    level: str = 'INFO',
+    path: Optional[str] = 'bot.log',
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5,
+    rotate_when: Optional[str] = None,
+    json_format: bool = False,
+    sample_burst: int = 5,
+    sample_window: float = 60
+) -> QueueListener:
+    """
+    Route all logging through a queue so the event loop never waits on disk or console I/O
+
+    The root logger only gets a QueueHandler; a background QueueListener thread
+    writes to the console and a rotating log file. It is stopped (and the queue
+    flushed) at interpreter exit.
+
+    Args:
+        level: Root log level name
+        path: Log file path (None/empty for console only)
+        max_bytes: Rotate the file once it reaches this size (size-based rotation)
+        backup_count: Rotated files to keep
+        rotate_when: TimedRotatingFileHandler interval (e.g. 'midnight'); overrides size-based rotation
+        json_format: Write JSON lines instead of plain text
+        sample_burst: Noisy records let through per call site per window (0 disables sampling)
+        sample_window: Sampling window in seconds
+
+    Returns:
+        The running QueueListener
+    """
+    formatter = JsonFormatter() if json_format else logging.Formatter(LOG_FORMAT)
+
+    handlers = [logging.StreamHandler()]
+    if path:
+        if rotate_when:
+            handlers.append(TimedRotatingFileHandler(path, when=rotate_when, backupCount=backup_count, encoding='utf-8'))
+        else:
+            handlers.append(RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Unbounded, so logging from the event loop never blocks on a full queue
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    # Dropped records are never formatted or enqueued
+    queue_handler.addFilter(SamplingFilter(burst=sample_burst, window=sample_window))
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(queue_handler)
+    root.setLevel(getattr(logging, str(level).upper(), logging.INFO))
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
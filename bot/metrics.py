@@ -0,0 +1,299 @@
+import bisect
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from bot.hedging import LATENCY_BUCKETS
+
+if TYPE_CHECKING:
+    from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Seconds from server save until a post went out
+POST_DELAY_BUCKETS = (30, 60, 120, 180, 300, 450, 600, 900, 1200, 1800, 2700, 3600)
+
+# (labels, value) pairs of one metric family
+Samples = List[Tuple[Dict[str, str], float]]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if value == math.inf:
+        return '+Inf'
+    if value == -math.inf:
+        return '-Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric(ABC):
+    """A metric family with a fixed set of label names"""
+
+    type = ''
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        lines.extend(self._render_samples())
+        return lines
+
+    @abstractmethod
+    def _render_samples(self) -> List[str]:
+        """Sample lines of the family, without the HELP/TYPE header"""
+
+
+class Counter(Metric):
+    """Monotonically increasing count"""
+
+    type = 'counter'
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _render_samples(self) -> List[str]:
+        return [f"{self.name}{_format_labels(self._labels(key))} {_format_value(value)}" for key, value in self._values.items()]
+
+
+class Histogram(Metric):
+    """Cumulative-bucket histogram of observed values"""
+
+    type = 'histogram'
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [per-bucket counts (+Inf last), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """Observe how long the block took (also when it raises)"""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(time.monotonic() - started, **labels)
+
+    def count(self, **labels: Any) -> int:
+        series = self._series.get(self._key(labels))
+        return series[2] if series else 0
+
+    def _render_samples(self) -> List[str]:
+        lines = []
+        for key, (counts, total, count) in self._series.items():
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_format_labels(dict(labels, le=_format_value(bound)))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+
+class Gauge(Metric):
+    """Point-in-time values, read from a callback at scrape time"""
+
+    type = 'gauge'
+
+    def __init__(self, name: str, help: str, collect: Callable[[], Samples]):
+        super().__init__(name, help)
+        self.collect = collect
+
+    def _render_samples(self) -> List[str]:
+        try:
+            samples = self.collect()
+        except Exception as e:
+            logger.error(f"Error collecting metric {self.name}: {e}")
+            return []
+        return [
+            f"{self.name}{_format_labels(labels)} {_format_value(value)}"
+            for labels, value in samples if value is not None
+        ]
+
+
+class MetricsRegistry:
+    """Named metric families, rendered in the Prometheus text format"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def _register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def gauge(self, name: str, help: str, collect: Callable[[], Samples]) -> Gauge:
+        """Register (or replace) a callback gauge, e.g. one exporting an existing stats() dict"""
+        self._metrics.pop(name, None)
+        return self._register(Gauge(name, help, collect))
+
+    def get(self, name: str) -> Optional[Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+# Process-wide registry the bot's modules record into
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUESTS = REGISTRY.counter(
+    'tibia_http_requests_total', 'Upstream HTTP attempts by host and outcome (status code, timeout, error, circuit_open)', ('host', 'outcome')
+)
+HTTP_SECONDS = REGISTRY.histogram('tibia_http_request_seconds', 'Upstream HTTP attempt latency', ('host',))
+HTTP_RETRIES = REGISTRY.counter('tibia_http_retries_total', 'Upstream HTTP retries by host', ('host',))
+API_REQUESTS = REGISTRY.counter(
+    'tibia_api_requests_total', 'TibiaData API calls (cache included) by endpoint and result', ('endpoint', 'result')
+)
+API_SECONDS = REGISTRY.histogram('tibia_api_request_seconds', 'TibiaData API call latency, cache included', ('endpoint',))
+DETAILS_REQUESTS = REGISTRY.counter('creature_details_total', 'Creature details lookups by resulting source', ('source',))
+DETAILS_SECONDS = REGISTRY.histogram('creature_details_seconds', 'Creature details lookup latency', ('source',))
+BOOSTED_CHECKS = REGISTRY.counter('boosted_checks_total', 'post_boosted_updates runs by result', ('result',))
+BOOSTED_CHECK_SECONDS = REGISTRY.histogram('boosted_check_seconds', 'post_boosted_updates duration')
+POSTS = REGISTRY.counter('boosted_posts_total', 'Boosted creature/boss posts by kind', ('kind',))
+POST_SECONDS = REGISTRY.histogram('boosted_post_seconds', 'Time to post one boosted update to all channels', ('kind',))
+POST_DELAY_SECONDS = REGISTRY.histogram(
+    'boosted_post_delay_seconds', 'Seconds from server save until the boosted update was posted', ('kind',), POST_DELAY_BUCKETS
+)
+DISCORD_SENDS = REGISTRY.counter('discord_sends_total', 'Discord channel sends by kind and result (sent, failed, gone)', ('kind', 'result'))
+WATCH_NOTIFICATIONS = REGISTRY.counter(
+    'watch_notifications_total', 'Watchlist notifications by delivery (channel mention, dm) and result', ('delivery', 'result')
+)
+SCHEDULER_JOBS = REGISTRY.counter('scheduler_job_runs_total', 'Scheduler job runs by job and result', ('job', 'result'))
+SCHEDULER_JOB_SECONDS = REGISTRY.histogram(
+    'scheduler_job_seconds', 'Scheduler job duration', ('job',), LATENCY_BUCKETS + (120.0, 300.0, 600.0, 1200.0, 2400.0)
+)
+
+
+def endpoint_label(endpoint: str) -> str:
+    """Low-cardinality label for an API endpoint ('creature/demon' -> 'creature')"""
+    return endpoint.strip('/').split('/', 1)[0] or 'root'
+
+
+def register_stats_gauges(
+    registry: MetricsRegistry,
+    prefix: str,
+    stats: Callable[[], Dict[str, Any]],
+    fields: Sequence[str],
+    help: str,
+    label: Optional[str] = None
+) -> None:
+    """
+    Export numeric fields of an existing stats() dict as gauges
+
+    Args:
+        registry: Registry to add the gauges to
+        prefix: Metric name prefix (each field becomes `<prefix>_<field>`)
+        stats: Callable returning the stats dict; with `label`, a dict of such dicts
+        fields: Fields to export (missing or non-numeric values are skipped)
+        help: Help text prefix
+        label: Label name for the outer keys of a nested stats dict (e.g. 'host')
+    """
+    def number(value: Any) -> Optional[float]:
+        if isinstance(value, bool):
+            return float(value)
+        return float(value) if isinstance(value, (int, float)) else None
+
+    def collector(field: str) -> Callable[[], Samples]:
+        def collect() -> Samples:
+            snapshot = stats()
+            rows = snapshot.items() if label else [(None, snapshot)]
+            return [
+                ({label: outer} if label else {}, number(row.get(field)))
+                for outer, row in rows
+                if number(row.get(field)) is not None
+            ]
+        return collect
+
+    for field in fields:
+        registry.gauge(f"{prefix}_{field}", f"{help}: {field}", collector(field))
+
+
+class MetricsServer:
+    """Serve a registry at /metrics from the bot's own event loop"""
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY, host: str = '127.0.0.1', port: int = 9108):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._runner: Optional['web.AppRunner'] = None
+
+    async def _handle_metrics(self, request: 'web.Request') -> 'web.Response':
+        from aiohttp import web
+
+        return web.Response(body=self.registry.render().encode('utf-8'), headers={'Content-Type': CONTENT_TYPE})
+
+    async def start(self) -> None:
+        if self._runner is not None:
+            return
+
+        # aiohttp.web costs ~50ms to import and is only needed once the endpoint is enabled
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_get('/metrics', self._handle_metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info(f"Metrics available at http://{self.host}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -0,0 +1,138 @@
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Tuple
+
+from bot.wiki_parser import parse_number
+
+
+def to_int(value: Any) -> Optional[int]:
+    """Normalize a numeric API/wiki value (8200, 8200.0, "8,200", "Unknown") to int or None"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        return parse_number(value)
+    return None
+
+
+def format_number(value: Optional[int]) -> str:
+    """Format a normalized number for display ("8,200" or "Unknown")"""
+    return f"{value:,}" if value is not None else "Unknown"
+
+
+@dataclass(frozen=True, slots=True)
+class LootItem:
+    """A single loot drop"""
+
+    name: str
+
+    @classmethod
+    def parse_all(cls, raw: Any) -> Tuple['LootItem', ...]:
+        """Loot items from a TibiaData `loot_list` or TibiaWiki `loot` value (dicts or names)"""
+        if not isinstance(raw, list):
+            return ()
+
+        items = []
+        for item in raw:
+            name = item.get('name') if isinstance(item, dict) else item
+            if isinstance(name, str) and name.strip():
+                items.append(cls(name.strip()))
+        return tuple(items)
+
+
+@dataclass(frozen=True, slots=True)
+class CreatureDetails:
+    """
+    Creature/boss details, normalized once when they are loaded
+
+    Numbers are ints or None (never 'Unknown' strings), loot is a tuple of
+    LootItem, so the model is hashable and can key the embed cache directly.
+    """
+
+    name: str
+    hitpoints: Optional[int] = None
+    experience_points: Optional[int] = None
+    description: Optional[str] = None
+    image_url: Optional[str] = None
+    loot: Tuple[LootItem, ...] = ()
+    armor: Optional[int] = None
+    speed: Optional[int] = None
+    race: Optional[str] = None
+    source: str = 'Unknown'
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], name: Optional[str] = None) -> 'CreatureDetails':
+        """
+        Normalize a raw details dict (TibiaData, TibiaWiki or fallback)
+
+        Args:
+            data: Raw details as returned by a source or the details store
+            name: Name to use if the dict doesn't carry one
+
+        Returns:
+            CreatureDetails
+        """
+        description = data.get('description')
+        return cls(
+            name=data.get('name') or name or 'Unknown',
+            hitpoints=to_int(data.get('hitpoints')),
+            experience_points=to_int(data.get('experience_points')),
+            description=description.strip() if isinstance(description, str) and description.strip() else None,
+            image_url=data.get('image_url') or None,
+            loot=LootItem.parse_all(data.get('loot') or data.get('loot_list')),
+            armor=to_int(data.get('armor')),
+            speed=to_int(data.get('speed')),
+            race=data.get('race') or None,
+            source=data.get('source') or 'TibiaData'
+        )
+
+    @property
+    def is_fallback(self) -> bool:
+        """Whether this is placeholder info because every source failed"""
+        return self.source == 'Fallback'
+
+    @property
+    def hitpoints_text(self) -> str:
+        return format_number(self.hitpoints)
+
+    @property
+    def experience_text(self) -> str:
+        return format_number(self.experience_points)
+
+    def with_image_url(self, image_url: Optional[str]) -> 'CreatureDetails':
+        """Copy with image_url filled in, if it isn't set yet"""
+        if self.image_url or not image_url:
+            return self
+        return replace(self, image_url=image_url)
+
+    def loot_names(self, limit: Optional[int] = None) -> List[str]:
+        """Names of the first `limit` loot items (all if None)"""
+        return [item.name for item in self.loot[:limit]]
+
+
+@dataclass(frozen=True, slots=True)
+class BoostedSnapshot:
+    """The boosted creature and boss as seen in one (partial) fetch"""
+
+    creature: Optional[str] = None
+    boss: Optional[str] = None
+    timestamp: Optional[str] = None
+
+    def name(self, kind: str) -> Optional[str]:
+        """Boosted name for 'creature' or 'boss'"""
+        return self.creature if kind == 'creature' else self.boss
+
+    def with_kind(self, kind: str, name: Optional[str], timestamp: Optional[str]) -> 'BoostedSnapshot':
+        """
+        Copy with one half filled in
+
+        The creature endpoint's timestamp wins; the boss one is used until it arrives.
+        """
+        changes: Dict[str, Any] = {kind: name}
+        if kind == 'creature' or not self.timestamp:
+            changes['timestamp'] = timestamp
+        return replace(self, **changes)
+
+    @property
+    def empty(self) -> bool:
+        return not self.creature and not self.boss
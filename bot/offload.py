@@ -0,0 +1,175 @@
+import asyncio
+import heapq
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+MODES = ('thread', 'process', 'off')
+
+
+class Offloader:
+    """
+    Run CPU-heavy decode/parse work off the event loop when the input is large
+
+    Small inputs are handled inline; thread or process pool hand-off costs more
+    than parsing a few KB. Work on inputs of at least `threshold` bytes goes to the
+    executor selected by `mode`:
+
+    - 'thread': a thread pool. Pure-Python parsing (HTMLParser) still holds the
+      GIL, but the interpreter switches threads every few ms, so the gateway
+      heartbeat keeps running. C-level json.loads does not release the GIL, so
+      this barely helps with very large JSON bodies.
+    - 'process': a process pool for picklable one-shot calls (e.g. json.loads),
+      which roughly halves the loop stall for multi-MB JSON (the result still has
+      to be unpickled). Stateful calls (feeding a streaming parser) always use
+      the thread pool.
+    - 'off': everything inline, as before.
+    """
+
+    def __init__(self, mode: str = 'thread', max_workers: Optional[int] = None, threshold: int = 256 * 1024):
+        if mode not in MODES:
+            logger.error(f"Unknown offload mode '{mode}', using 'thread'")
+            mode = 'thread'
+        self.mode = mode
+        self.max_workers = max_workers
+        self.threshold = threshold
+
+        self._threads: Optional['ThreadPoolExecutor'] = None
+        self._processes: Optional['ProcessPoolExecutor'] = None
+
+        self.inline_calls = 0
+        self.offloaded_calls = 0
+
+    def _executor(self, stateful: bool) -> 'Executor':
+        """Get (lazily creating) the executor for a call"""
+        if self.mode == 'process' and not stateful:
+            if self._processes is None:
+                # Imported here so thread/off modes never load multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+                self._processes = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._processes
+
+        if self._threads is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._threads = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='offload')
+        return self._threads
+
+    def should_offload(self, size: Optional[int]) -> bool:
+        """Whether work on an input of `size` bytes goes to the executor"""
+        return self.mode != 'off' and size is not None and size >= self.threshold
+
+    async def run(self, func: Callable[..., Any], *args: Any, size: Optional[int] = None, stateful: bool = False) -> Any:
+        """
+        Call func(*args), in the executor if the input is large enough
+
+        Args:
+            func: Function to call
+            *args: Positional arguments (must be picklable in process mode)
+            size: Input size in bytes; unknown sizes run inline
+            stateful: The call mutates shared objects, so it must stay in this process
+
+        Returns:
+            The function's return value
+        """
+        if not self.should_offload(size):
+            self.inline_calls += 1
+            return func(*args)
+
+        self.offloaded_calls += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor(stateful), func, *args)
+
+    def shutdown(self) -> None:
+        """Shut down the executors (pending work is cancelled)"""
+        for executor in (self._threads, self._processes):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        self._threads = None
+        self._processes = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'mode': self.mode,
+            'threshold': self.threshold,
+            'inline': self.inline_calls,
+            'offloaded': self.offloaded_calls
+        }
+
+
+class LoopLagMonitor:
+    """
+    Measure how late the event loop wakes up from a short sleep
+
+    Anything blocking the loop (parsing, sync I/O) shows up as lag; discord.py's
+    gateway heartbeat and interaction acks are delayed by the same amount. Stalls
+    above `threshold` seconds are logged, and the `keep` worst ones are kept.
+    """
+
+    def __init__(self, interval: float = 0.25, threshold: float = 0.1, keep: int = 10):
+        self.interval = interval
+        self.threshold = threshold
+        self.keep = keep
+
+        self.samples = 0
+        self.stalls = 0
+        self.max_lag = 0.0
+        self.last_lag = 0.0
+        # Min-heap of (lag seconds, wall clock time) for the worst stalls
+        self._worst: List[Tuple[float, float]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start monitoring on the running loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop monitoring"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def record(self, lag: float) -> None:
+        """Record one lag sample (seconds)"""
+        self.samples += 1
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        if lag < self.threshold:
+            return
+
+        self.stalls += 1
+        logger.warning(f"Event loop stalled for {lag * 1000:.0f}ms")
+        entry = (lag, time.time())
+        if len(self._worst) < self.keep:
+            heapq.heappush(self._worst, entry)
+        else:
+            heapq.heappushpop(self._worst, entry)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, loop.time() - started - self.interval))
+
+    def worst(self) -> List[Tuple[float, float]]:
+        """Worst stalls as (lag seconds, wall clock time), worst first"""
+        return sorted(self._worst, reverse=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'samples': self.samples,
+            'stalls': self.stalls,
+            'max_lag': self.max_lag,
+            'last_lag': self.last_lag,
+            'worst': self.worst()
+        }
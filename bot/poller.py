@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from bot.models import BoostedSnapshot
+from bot.server_save import last_server_save, parse_api_timestamp
+
+logger = logging.getLogger(__name__)
+
+KINDS = ('creature', 'boss')
+
+
+class ChangeDetectionPoller:
+    """
+    Poll the boosted endpoints after server save until both creature and boss change
+
+    Intervals grow exponentially with jitter while nothing changes and reset after a
+    detection. A response only counts once its `information.timestamp` is from after
+    server save, so a cached pre-save copy is never mistaken for "no change yet"
+    evidence or for the new rotation.
+
+    Each run records time-to-detection (seconds after server save) and the number
+    of requests it needed, so intervals can be tuned for latency vs request volume.
+    """
+
+    def __init__(
+        self,
+        tibia_api,
+        initial_interval: float = 15,
+        max_interval: float = 120,
+        multiplier: float = 2.0,
+        jitter: float = 0.25,
+        window: float = 40 * 60,
+        history: int = 30
+    ):
+        self.tibia_api = tibia_api
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.window = window
+
+        # Summaries of recent runs, newest last
+        self.runs: Deque[Dict[str, Any]] = deque(maxlen=history)
+
+    def _next_interval(self, interval: float) -> float:
+        """Grow the interval exponentially up to max_interval"""
+        return min(interval * self.multiplier, self.max_interval)
+
+    def _jittered(self, interval: float) -> float:
+        """Spread the interval by +/- jitter so many bots don't poll in lockstep"""
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    async def run(
+        self,
+        baseline: Dict[str, Optional[str]],
+        on_change: Callable[[str, str, BoostedSnapshot], Awaitable[None]]
+    ) -> Dict[str, Any]:
+        """
+        Poll until both kinds changed or the window expires
+
+        Args:
+            baseline: Last known names, keyed by 'creature' and 'boss'
+            on_change: Called as on_change(kind, name, snapshot) on each detection
+
+        Returns:
+            Summary of the run (detections, requests, pending kinds)
+        """
+        save_time = last_server_save().timestamp()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.window
+        interval = self.initial_interval
+
+        pending = set(KINDS)
+        summary: Dict[str, Any] = {
+            'server_save': save_time,
+            'started_at': time.time(),
+            'requests': 0,
+            'detections': {},
+            'pending': []
+        }
+        snapshot = BoostedSnapshot()
+
+        while pending and loop.time() < deadline:
+            summary['requests'] += 1
+            detected = False
+            handlers = []
+
+            async for kind, name, timestamp in self.tibia_api.iter_boosted_creatures(fresh=True):
+                snapshot = snapshot.with_kind(kind, name, timestamp)
+
+                if kind not in pending or not name:
+                    continue
+
+                # Ignore responses generated before server save (stale upstream cache)
+                api_time = parse_api_timestamp(timestamp)
+                if api_time is not None and api_time < save_time:
+                    continue
+
+                if name != baseline.get(kind):
+                    detected = True
+                    pending.discard(kind)
+                    latency = time.time() - save_time
+                    summary['detections'][kind] = {
+                        'name': name,
+                        'seconds_after_save': latency,
+                        'requests': summary['requests']
+                    }
+                    logger.info(f"Detected new boosted {kind} {name} {latency:.0f}s after server save ({summary['requests']} polls)")
+
+                    # Handle each half without holding back the other endpoint
+                    handlers.append(asyncio.create_task(on_change(kind, name, snapshot)))
+
+            for kind_result in await asyncio.gather(*handlers, return_exceptions=True):
+                if isinstance(kind_result, Exception):
+                    logger.error(f"Error handling boosted change: {kind_result}")
+
+            if not pending:
+                break
+
+            # Poll quickly right after a detection, back off while nothing happens
+            interval = self.initial_interval if detected else self._next_interval(interval)
+            await asyncio.sleep(min(self._jittered(interval), max(0.0, deadline - loop.time())))
+
+        summary['pending'] = sorted(pending)
+        summary['finished_at'] = time.time()
+        self.runs.append(summary)
+
+        if pending:
+            logger.warning(f"Poll window ended without detecting: {', '.join(summary['pending'])}")
+        return summary
+
+    def stats(self) -> Dict[str, Any]:
+        """Aggregate time-to-detection and request volume over recent runs"""
+        latencies = [
+            detection['seconds_after_save']
+            for run in self.runs
+            for detection in run['detections'].values()
+        ]
+        requests = [run['requests'] for run in self.runs]
+        latencies.sort()
+
+        return {
+            'runs': len(self.runs),
+            'missed': sum(1 for run in self.runs if run['pending']),
+            'avg_requests': sum(requests) / len(requests) if requests else 0.0,
+            'detection_p50': latencies[len(latencies) // 2] if latencies else None,
+            'detection_max': latencies[-1] if latencies else None,
+            'last_run': self.runs[-1] if self.runs else None
+        }
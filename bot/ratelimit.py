@@ -0,0 +1,46 @@
+import asyncio
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter
+    
+    Allows bursts of up to `capacity` operations and refills at `rate` tokens per
+    second. `acquire()` waits until a token is available.
+    """
+    
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._clock = clock
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+        
+        # Counters
+        self.acquired = 0
+        self.waited = 0
+    
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """Take tokens without waiting; returns False if not enough are available"""
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            self.acquired += 1
+            return True
+        return False
+    
+    async def acquire(self, tokens: float = 1) -> None:
+        """Wait until tokens are available and take them"""
+        # The lock keeps waiters in FIFO order instead of racing for each refill
+        async with self._lock:
+            while not self.try_acquire(tokens):
+                self.waited += 1
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
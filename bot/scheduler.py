@@ -1,20 +1,47 @@
 import asyncio
 import logging
-from datetime import datetime, time
-from typing import Optional
+from datetime import datetime, time, timedelta
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
 
 import pytz
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
+
+from bot.metrics import SCHEDULER_JOB_SECONDS, SCHEDULER_JOBS
+from bot.models import BoostedSnapshot
+from bot.poller import ChangeDetectionPoller
+
+if TYPE_CHECKING:
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 logger = logging.getLogger(__name__)
 
 class TibiaScheduler:
     """Scheduler for Tibia bot tasks with CEST/CET timezone awareness"""
     
-    def __init__(self, bot):
+    # 'poll': adaptive change-detection poller started at server save
+    # 'cron': fixed checks at 10:06 and 10:36
+    MODES = ('poll', 'cron')
+    
+    # When the first boosted fetch of the day runs in each mode
+    FIRST_CHECK = {'poll': time(10, 0, 30), 'cron': time(10, 6, 0)}
+    
+    def __init__(
+        self,
+        bot,
+        mode: str = 'poll',
+        poller: Optional[ChangeDetectionPoller] = None,
+        warmup_lead: Optional[float] = 120
+    ):
         self.bot = bot
-        self.scheduler: Optional[AsyncIOScheduler] = None
+        self.scheduler: Optional['AsyncIOScheduler'] = None
+        
+        if mode not in self.MODES:
+            logger.warning(f"Unknown scheduler mode '{mode}', falling back to 'poll'")
+            mode = 'poll'
+        self.mode = mode
+        self.poller = poller or ChangeDetectionPoller(bot.tibia_api)
+        
+        # Seconds before the first check to open upstream connections (None/0 disables)
+        self.warmup_lead = warmup_lead
         
         # Central European timezone (handles CET/CEST automatically)
         self.timezone = pytz.timezone('Europe/Berlin')
@@ -26,48 +53,29 @@ class TibiaScheduler:
             return
         
         try:
+            # apscheduler is imported on start, keeping it off the import path of main
+            from apscheduler.schedulers.asyncio import AsyncIOScheduler
+            
             # Initialize scheduler
             self.scheduler = AsyncIOScheduler(timezone=self.timezone)
             
-            # Schedule boosted creature check at 10:06 CEST/CET daily
-            # This is 4 minutes after server boot (10:02) and 6 minutes after server save (10:00)
-            self.scheduler.add_job(
-                func=self._check_boosted_changes,
-                trigger=CronTrigger(
-                    hour=10,
-                    minute=6,
-                    second=0,
-                    timezone=self.timezone
-                ),
-                id='daily_boosted_check',
-                name='Daily Boosted Creature/Boss Check',
-                misfire_grace_time=300,  # 5 minutes grace time
-                coalesce=True,  # Don't run multiple times if delayed
-                max_instances=1  # Only one instance at a time
-            )
+            if self.mode == 'poll':
+                self._add_poll_jobs()
+            else:
+                self._add_cron_jobs()
             
-            # Add a secondary check 30 minutes later as backup
-            self.scheduler.add_job(
-                func=self._backup_check,
-                trigger=CronTrigger(
-                    hour=10,
-                    minute=36,
-                    second=0,
-                    timezone=self.timezone
-                ),
-                id='backup_boosted_check',
-                name='Backup Boosted Check',
-                misfire_grace_time=300,
-                coalesce=True,
-                max_instances=1
-            )
+            if self.warmup_lead:
+                self._add_warmup_job()
             
             # Start the scheduler
             self.scheduler.start()
             
-            logger.info("Scheduler started successfully")
-            logger.info("Daily boosted check scheduled for 10:06 CEST/CET")
-            logger.info("Backup check scheduled for 10:36 CEST/CET")
+            logger.info(f"Scheduler started successfully ({self.mode} mode)")
+            if self.mode == 'poll':
+                logger.info("Change-detection polling scheduled from 10:00 CEST/CET")
+            else:
+                logger.info("Daily boosted check scheduled for 10:06 CEST/CET")
+                logger.info("Backup check scheduled for 10:36 CEST/CET")
             
             # Log next scheduled run
             jobs = self.scheduler.get_jobs()
@@ -80,6 +88,96 @@ class TibiaScheduler:
             logger.error(f"Failed to start scheduler: {e}")
             raise
     
+    def _instrumented(self, job_id: str, func: Callable[[], Awaitable[None]]) -> Callable[[], Awaitable[None]]:
+        """Wrap a job so its runs and duration show up in the metrics"""
+        async def run():
+            try:
+                with SCHEDULER_JOB_SECONDS.time(job=job_id):
+                    await func()
+            except Exception:
+                SCHEDULER_JOBS.inc(job=job_id, result='error')
+                raise
+            SCHEDULER_JOBS.inc(job=job_id, result='ok')
+        return run
+    
+    def _add_poll_jobs(self):
+        """Start the change-detection poller right after server save"""
+        from apscheduler.triggers.cron import CronTrigger
+        
+        self.scheduler.add_job(
+            func=self._instrumented('boosted_poller', self._poll_for_rotation),
+            trigger=CronTrigger(
+                hour=10,
+                minute=0,
+                second=30,
+                timezone=self.timezone
+            ),
+            id='boosted_poller',
+            name='Boosted Creature/Boss Change Poller',
+            misfire_grace_time=300,
+            coalesce=True,
+            max_instances=1
+        )
+    
+    def _add_cron_jobs(self):
+        """Fixed daily checks at 10:06 and 10:36"""
+        from apscheduler.triggers.cron import CronTrigger
+        
+        # Schedule boosted creature check at 10:06 CEST/CET daily
+        # This is 4 minutes after server boot (10:02) and 6 minutes after server save (10:00)
+        self.scheduler.add_job(
+            func=self._instrumented('daily_boosted_check', self._check_boosted_changes),
+            trigger=CronTrigger(
+                hour=10,
+                minute=6,
+                second=0,
+                timezone=self.timezone
+            ),
+            id='daily_boosted_check',
+            name='Daily Boosted Creature/Boss Check',
+            misfire_grace_time=300,  # 5 minutes grace time
+            coalesce=True,  # Don't run multiple times if delayed
+            max_instances=1  # Only one instance at a time
+        )
+        
+        # Add a secondary check 30 minutes later as backup
+        self.scheduler.add_job(
+            func=self._instrumented('backup_boosted_check', self._backup_check),
+            trigger=CronTrigger(
+                hour=10,
+                minute=36,
+                second=0,
+                timezone=self.timezone
+            ),
+            id='backup_boosted_check',
+            name='Backup Boosted Check',
+            misfire_grace_time=300,
+            coalesce=True,
+            max_instances=1
+        )
+    
+    def _add_warmup_job(self):
+        """Warm up upstream connections shortly before the first check of the day"""
+        from apscheduler.triggers.cron import CronTrigger
+        
+        first_check = datetime.combine(datetime.min, self.FIRST_CHECK[self.mode])
+        warmup_at = (first_check - timedelta(seconds=self.warmup_lead)).time()
+        
+        self.scheduler.add_job(
+            func=self._instrumented('connection_warmup', self._warm_up_connections),
+            trigger=CronTrigger(
+                hour=warmup_at.hour,
+                minute=warmup_at.minute,
+                second=warmup_at.second,
+                timezone=self.timezone
+            ),
+            id='connection_warmup',
+            name='Upstream Connection Warm-up',
+            misfire_grace_time=60,
+            coalesce=True,
+            max_instances=1
+        )
+    
     async def stop(self):
         """Stop the scheduler"""
         if self.scheduler and self.scheduler.running:
@@ -112,6 +210,53 @@ class TibiaScheduler:
         except Exception as e:
             logger.error(f"Error in scheduled boosted check: {e}")
     
+    async def _poll_for_rotation(self):
+        """
+        Poll for the new rotation after server save, then publish each half
+        
+        Each half is published (details fetched, embed built and sent) the moment
+        the poller detects it, without waiting for the other half, so the post goes
+        out as soon as TibiaData reflects the rotation.
+        """
+        try:
+            logger.info("Running boosted creature/boss change poller")
+            
+            if not self.bot.is_ready():
+                logger.warning("Bot not ready, skipping change poller")
+                return
+            
+            # Rebuild the catalog for the new cycle before details are needed
+            try:
+                await self.bot.tibia_api.refresh_catalog(force=True)
+            except Exception as e:
+                logger.warning(f"Catalog refresh before polling failed: {e}")
+            
+            async def on_change(kind: str, name: str, snapshot: BoostedSnapshot):
+                result = await self.bot.publish_boosted(kind, name, snapshot)
+                for error in result['errors']:
+                    logger.error(f"Change poller publish error: {error}")
+            
+            baseline = {
+                'creature': self.bot.last_posted_creature,
+                'boss': self.bot.last_posted_boss
+            }
+            summary = await self.poller.run(baseline, on_change)
+            
+            logger.info(
+                f"Change poller finished after {summary['requests']} polls - "
+                f"detected: {', '.join(sorted(summary['detections'])) or 'nothing'}"
+            )
+            
+        except Exception as e:
+            logger.error(f"Error in boosted change poller: {e}")
+    
+    async def _warm_up_connections(self):
+        """Open pooled connections to TibiaData, mirrors and the wiki before server save"""
+        try:
+            await self.bot.tibia_api.warm_up()
+        except Exception as e:
+            logger.error(f"Error warming up connections: {e}")
+    
     async def _backup_check(self):
         """Backup check in case the main check failed or missed changes"""
         try:
@@ -140,7 +285,7 @@ class TibiaScheduler:
         if not self.scheduler:
             return None
         
-        job = self.scheduler.get_job('daily_boosted_check')
+        job = self.scheduler.get_job('boosted_poller' if self.mode == 'poll' else 'daily_boosted_check')
         if job:
             return job.next_run_time
         
@@ -172,13 +317,15 @@ class TibiaScheduler:
         next_run = None
         
         if jobs:
-            next_runs = [job.next_run_time for job in jobs if job.next_run_time]
+            next_runs = [job.next_run_time for job in jobs if job.next_run_time and job.id != 'connection_warmup']
             if next_runs:
                 next_run = min(next_runs)
         
         return {
             'running': self.scheduler.running,
+            'mode': self.mode,
             'jobs': len(jobs),
             'next_run': next_run,
-            'timezone': self.get_timezone_info()
+            'timezone': self.get_timezone_info(),
+            'poller': self.poller.stats() if self.mode == 'poll' else None
         }
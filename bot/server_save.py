@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+import pytz
+
+# Tibia server save happens daily at 10:00 Central European time (CET/CEST)
+SERVER_SAVE_TIMEZONE = pytz.timezone('Europe/Berlin')
+SERVER_SAVE_HOUR = 10
+
+
+def _save_on(day: datetime) -> datetime:
+    """Server save moment on the calendar day of the given (timezone-aware) datetime"""
+    naive = datetime(day.year, day.month, day.day, SERVER_SAVE_HOUR, 0, 0)
+    return SERVER_SAVE_TIMEZONE.localize(naive)
+
+
+def last_server_save(now: Optional[datetime] = None) -> datetime:
+    """
+    Get the most recent server save at or before now
+    
+    Args:
+        now: Reference time (defaults to the current time)
+        
+    Returns:
+        Timezone-aware datetime in Europe/Berlin
+    """
+    now = (now or datetime.now(pytz.utc)).astimezone(SERVER_SAVE_TIMEZONE)
+    save = _save_on(now)
+    if now < save:
+        save = _save_on(now - timedelta(days=1))
+    return save
+
+
+def next_server_save(now: Optional[datetime] = None) -> datetime:
+    """
+    Get the next server save strictly after now
+    
+    Args:
+        now: Reference time (defaults to the current time)
+        
+    Returns:
+        Timezone-aware datetime in Europe/Berlin
+    """
+    now = (now or datetime.now(pytz.utc)).astimezone(SERVER_SAVE_TIMEZONE)
+    save = _save_on(now)
+    if now >= save:
+        save = _save_on(now + timedelta(days=1))
+    return save
+
+
+def parse_api_timestamp(value: Optional[str]) -> Optional[float]:
+    """Parse a TibiaData `information.timestamp` (ISO 8601) into epoch seconds"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
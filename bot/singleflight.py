@@ -0,0 +1,61 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls into one
+    
+    While a call for a key is in flight, further callers for the same key await
+    the same future instead of starting their own request.
+    """
+    
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        
+        # Counters
+        self.calls = 0
+        self.deduplicated = 0
+    
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run factory() for key, or join the call already in flight
+        
+        Args:
+            key: Identity of the call (e.g. the API endpoint)
+            factory: Coroutine factory performing the actual work
+            
+        Returns:
+            Result of the (shared) call
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.deduplicated += 1
+            return await asyncio.shield(future)
+        
+        self.calls += 1
+        future = asyncio.ensure_future(factory())
+        self._inflight[key] = future
+        future.add_done_callback(lambda done: self._forget(key, done))
+        
+        # Shield so a cancelled caller doesn't cancel the call for everyone else
+        return await asyncio.shield(future)
+    
+    def _forget(self, key: Hashable, future: asyncio.Future):
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # Retrieve the exception so an abandoned failed call isn't reported as never retrieved
+        if not future.cancelled():
+            future.exception()
+    
+    def in_flight(self) -> int:
+        """Number of calls currently in flight"""
+        return len(self._inflight)
+    
+    def stats(self) -> Dict[str, int]:
+        """Get coalescing counters"""
+        return {
+            'calls': self.calls,
+            'deduplicated': self.deduplicated,
+            'in_flight': len(self._inflight)
+        }
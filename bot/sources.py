@@ -0,0 +1,237 @@
+import logging
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence
+from urllib.parse import urlencode
+
+from bot.details_store import StoredDetails
+from bot.wiki_parser import StreamingInfoboxReader, parse_infobox_wikitext
+
+if TYPE_CHECKING:
+    from bot.tibia_api import TibiaAPI
+
+logger = logging.getLogger(__name__)
+
+WIKI_BASE_URL = "https://tibia.fandom.com"
+
+# Order in which creature details sources are tried
+DEFAULT_SOURCES = ('tibiadata', 'wiki-raw', 'wiki-html')
+
+
+class DetailsSource(ABC):
+    """
+    A place creature details can be loaded from
+
+    Sources are tried in order by TibiaAPI; `fetch` returns None when the source has
+    nothing usable so the next one gets a chance. `store_source` is the label the
+    details are persisted under, so a source only revalidates what it stored itself.
+    """
+
+    name = ''
+    store_source = ''
+
+    @abstractmethod
+    async def fetch(
+        self,
+        api: 'TibiaAPI',
+        creature_name: str,
+        race: Optional[str] = None,
+        stored: Optional[StoredDetails] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load details for one creature
+
+        Args:
+            api: TibiaAPI whose session, store and settings to use
+            creature_name: Name of the creature
+            race: TibiaData race identifier from the catalog, if known
+            stored: Previously stored details from this source, to revalidate
+
+        Returns:
+            Creature details dict or None if not available
+        """
+
+    async def fetch_many(self, api: 'TibiaAPI', creature_names: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Load details for several creatures
+
+        Args:
+            api: TibiaAPI whose session, store and settings to use
+            creature_names: Names of the creatures
+
+        Returns:
+            Dict of requested name to details, for the names that were found
+        """
+        results = {}
+        for creature_name in creature_names:
+            details = await self.fetch(api, creature_name)
+            if details:
+                results[creature_name] = details
+        return results
+
+
+class TibiaDataSource(DetailsSource):
+    """The TibiaData /creature endpoint"""
+
+    name = 'tibiadata'
+    store_source = 'TibiaData'
+
+    async def fetch(self, api, creature_name, race=None, stored=None):
+        return await api._fetch_tibiadata_details(creature_name, stored, race)
+
+
+class WikiHTMLSource(DetailsSource):
+    """The rendered TibiaWiki article, streamed into the infobox parser"""
+
+    name = 'wiki-html'
+    store_source = 'TibiaWiki'
+
+    async def fetch(self, api, creature_name, race=None, stored=None):
+        url = f"{api.wiki_base_url}/wiki/{creature_name.replace(' ', '_')}"
+        headers = stored.conditional_headers() if stored else None
+        reader = StreamingInfoboxReader()
+        status, _, response_headers = await api._fetch(url, retries=0, headers=headers or None, stream_into=reader)
+
+        if status == 304 and stored:
+            api.details_store.touch(creature_name)
+            logger.info(f"TibiaWiki page not modified, using stored copy: {creature_name}")
+            return stored.details
+
+        if status != 200:
+            logger.warning(f"TibiaWiki request failed for: {creature_name}")
+            return None
+
+        # Only as much of the page as the infobox parser needed was read
+        creature_info = reader.parser.result(creature_name)
+        logger.debug(f"Parsed TibiaWiki page for {creature_name} after {reader.bytes_read} bytes")
+        if not creature_info:
+            logger.warning(f"Could not parse TibiaWiki data for: {creature_name}")
+            return None
+
+        if api.details_store is not None:
+            api.details_store.put(
+                creature_name, creature_info, self.store_source,
+                response_headers.get('ETag'), response_headers.get('Last-Modified')
+            )
+        logger.info(f"Scraped creature info from TibiaWiki: {creature_name}")
+        return creature_info
+
+
+class WikiRawSource(DetailsSource):
+    """
+    Raw wikitext from the TibiaWiki MediaWiki API
+
+    A few KB of JSON per creature instead of a full rendered fandom page, and up to
+    MAX_TITLES creatures per request. The {{Infobox Creature}} parameters are parsed
+    directly, so there is no HTML to tokenize.
+    """
+
+    name = 'wiki-raw'
+    store_source = 'TibiaWikiRaw'
+
+    # MediaWiki's per-request limit for titles= on anonymous requests
+    MAX_TITLES = 50
+
+    def _query_url(self, api: 'TibiaAPI', titles: Iterable[str]) -> str:
+        params = {
+            'action': 'query',
+            'prop': 'revisions',
+            'rvprop': 'content',
+            'rvslots': 'main',
+            'redirects': '1',
+            'format': 'json',
+            'formatversion': '2',
+            'titles': '|'.join(titles)
+        }
+        return f"{api.wiki_base_url}/api.php?{urlencode(params)}"
+
+    @staticmethod
+    def _page_contents(data: Dict[str, Any]) -> Dict[str, str]:
+        """Map requested title -> wikitext, following title normalization and redirects"""
+        query = (data or {}).get('query') or {}
+
+        contents = {}
+        for page in query.get('pages') or []:
+            revisions = page.get('revisions')
+            if page.get('missing') or not revisions:
+                continue
+            revision = revisions[0]
+            content = ((revision.get('slots') or {}).get('main') or {}).get('content', revision.get('content'))
+            if content:
+                contents[page['title']] = content
+
+        # Requested title -> final title; MediaWiki normalizes first, then follows redirects
+        aliases = {}
+        for mapping in (query.get('normalized') or []) + (query.get('redirects') or []):
+            aliases[mapping['from']] = mapping['to']
+
+        def resolve(title: str) -> str:
+            seen = set()
+            while title in aliases and title not in seen:
+                seen.add(title)
+                title = aliases[title]
+            return title
+
+        return {title: contents[resolve(title)] for title in list(contents) + list(aliases) if resolve(title) in contents}
+
+    async def fetch_many(self, api, creature_names):
+        results: Dict[str, Dict[str, Any]] = {}
+        titles = {creature_name: creature_name.replace('_', ' ').strip() for creature_name in creature_names}
+        unique_titles: List[str] = list(dict.fromkeys(titles.values()))
+
+        for start in range(0, len(unique_titles), self.MAX_TITLES):
+            batch = unique_titles[start:start + self.MAX_TITLES]
+            status, data, _ = await api._fetch(self._query_url(api, batch), retries=1)
+            if status != 200:
+                logger.warning(f"TibiaWiki API request failed for: {', '.join(batch)}")
+                continue
+
+            contents = self._page_contents(data)
+            for creature_name, title in titles.items():
+                if title not in batch or title not in contents:
+                    continue
+                wikitext = contents[title]
+                creature_info = await api.offloader.run(parse_infobox_wikitext, wikitext, creature_name, size=len(wikitext))
+                if not creature_info:
+                    logger.warning(f"No creature infobox in TibiaWiki wikitext for: {creature_name}")
+                    continue
+
+                if api.details_store is not None:
+                    api.details_store.put(creature_name, creature_info, self.store_source)
+                results[creature_name] = creature_info
+
+        if results:
+            logger.info(f"Fetched TibiaWiki wikitext for {len(results)}/{len(titles)} creatures")
+        return results
+
+    async def fetch(self, api, creature_name, race=None, stored=None):
+        results = await self.fetch_many(api, [creature_name])
+        return results.get(creature_name)
+
+
+SOURCES = {source.name: source for source in (TibiaDataSource, WikiRawSource, WikiHTMLSource)}
+
+
+def build_sources(names: Optional[Iterable[str]] = None) -> List[DetailsSource]:
+    """
+    Instantiate details sources by name, in the given order
+
+    Args:
+        names: Source names ('tibiadata', 'wiki-raw', 'wiki-html'); DEFAULT_SOURCES if empty
+
+    Returns:
+        List of sources (unknown names are logged and skipped)
+    """
+    sources = []
+    for name in names or DEFAULT_SOURCES:
+        name = name.strip().lower()
+        if not name:
+            continue
+        if name not in SOURCES:
+            logger.error(f"Unknown creature details source: {name}")
+            continue
+        sources.append(SOURCES[name]())
+
+    if not sources:
+        logger.warning("No valid creature details sources configured, using defaults")
+        return build_sources(DEFAULT_SOURCES)
+    return sources
@@ -0,0 +1,133 @@
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import IO, Any, Callable, Dict, List, Optional
+
+from bot.server_save import last_server_save, parse_api_timestamp
+
+logger = logging.getLogger(__name__)
+
+KINDS = ('creature', 'boss')
+
+
+def write_atomic(path: str, write: Callable[[IO[str]], None]) -> None:
+    """
+    Write a text file so readers only ever see the old or the new file
+
+    Calls write(f) on a temp file in the same directory, fsyncs it and renames it
+    over path. On any error the temp file is removed and the error re-raised.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """Write JSON atomically (see write_atomic)"""
+    write_atomic(path, lambda f: json.dump(data, f, indent=2))
+
+
+class BotStateStore:
+    """
+    Small durable store for what the bot last posted
+
+    Holds the last posted creature/boss names, the API timestamp they came from,
+    when they were posted and the Discord message IDs. The file is rewritten
+    atomically (temp file + fsync + rename) so a crash or redeploy mid-write never
+    leaves a corrupt state behind.
+    """
+
+    def __init__(self, path: str = "bot_state.json"):
+        self.path = path
+        self._state: Dict[str, Dict[str, Any]] = {kind: self._empty() for kind in KINDS}
+        self.load()
+
+    @staticmethod
+    def _empty() -> Dict[str, Any]:
+        return {
+            'name': None,
+            'api_timestamp': None,
+            'posted_at': None,
+            'message_ids': []
+        }
+
+    def load(self) -> None:
+        """Load state from disk, keeping defaults if the file is missing or unreadable"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            logger.info(f"No saved bot state at {self.path}, starting fresh")
+            return
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not read bot state from {self.path}: {e}")
+            return
+
+        for kind in KINDS:
+            saved = data.get(kind) or {}
+            self._state[kind].update({key: saved[key] for key in self._empty() if key in saved})
+
+        logger.info(f"Loaded bot state: creature={self.get_name('creature')}, boss={self.get_name('boss')}")
+
+    def save(self) -> None:
+        """Atomically write the state to disk"""
+        try:
+            write_json_atomic(self.path, self._state)
+        except OSError as e:
+            logger.error(f"Could not save bot state to {self.path}: {e}")
+
+    def get_name(self, kind: str) -> Optional[str]:
+        """Last posted name for 'creature' or 'boss'"""
+        return self._state[kind]['name']
+
+    def set_name(self, kind: str, name: Optional[str]) -> None:
+        """Set the last posted name without recording a post"""
+        self._state[kind]['name'] = name
+        self.save()
+
+    def get_message_ids(self, kind: str) -> List[int]:
+        """Discord message IDs of the last post"""
+        return list(self._state[kind]['message_ids'])
+
+    def record_post(self, kind: str, name: str, api_timestamp: Optional[str], message_ids: List[int]) -> None:
+        """
+        Record a successful post and persist it
+
+        Args:
+            kind: Either 'creature' or 'boss'
+            name: Posted creature/boss name
+            api_timestamp: TibiaData information.timestamp of the posted data
+            message_ids: IDs of the sent Discord messages
+        """
+        self._state[kind] = {
+            'name': name,
+            'api_timestamp': api_timestamp,
+            'posted_at': time.time(),
+            'message_ids': list(message_ids)
+        }
+        self.save()
+
+    def is_current(self, kind: str) -> bool:
+        """
+        Whether the data last posted for kind is from the current server-save cycle
+
+        Judged by the API timestamp of the posted data, not by when it was posted:
+        a post made just after server save from a response generated before the
+        rotation (e.g. a forced /update or a restart) doesn't count as current.
+        """
+        api_time = parse_api_timestamp(self._state[kind]['api_timestamp'])
+        return api_time is not None and api_time >= last_server_save().timestamp()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Copy of the full state"""
+        return json.loads(json.dumps(self._state))
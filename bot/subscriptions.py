@@ -0,0 +1,106 @@
+import json
+import logging
+from typing import Dict, List, Optional
+
+from bot.state_store import KINDS, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class SubscriptionStore:
+    """
+    Per-guild channel subscriptions for boosted creature/boss posts
+
+    Persisted as JSON ({guild_id: {'creature': channel_id, 'boss': channel_id}}).
+    The flat per-kind channel lists used by the fan-out are cached and only rebuilt
+    when a subscription changes.
+    """
+
+    def __init__(self, path: str = "subscriptions.json"):
+        self.path = path
+        self._guilds: Dict[int, Dict[str, int]] = {}
+        self._channels: Optional[Dict[str, List[int]]] = None
+        self.load()
+
+    def load(self) -> None:
+        """Load subscriptions from disk"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not read subscriptions from {self.path}: {e}")
+            return
+
+        self._guilds = {
+            int(guild_id): {kind: int(channel_id) for kind, channel_id in channels.items() if kind in KINDS and channel_id}
+            for guild_id, channels in data.items()
+        }
+        self._channels = None
+        logger.info(f"Loaded channel subscriptions for {len(self._guilds)} guilds")
+
+    def save(self) -> None:
+        """Atomically write subscriptions to disk"""
+        try:
+            write_json_atomic(self.path, {str(guild_id): channels for guild_id, channels in self._guilds.items()})
+        except OSError as e:
+            logger.error(f"Could not save subscriptions to {self.path}: {e}")
+
+    def set_channel(self, guild_id: int, kind: str, channel_id: Optional[int]) -> None:
+        """
+        Subscribe a guild channel to a kind of post (or unsubscribe with None)
+
+        Args:
+            guild_id: Discord guild ID
+            kind: Either 'creature' or 'boss'
+            channel_id: Channel to post in, or None to unsubscribe
+        """
+        channels = self._guilds.setdefault(guild_id, {})
+        if channel_id:
+            channels[kind] = channel_id
+        else:
+            channels.pop(kind, None)
+        if not channels:
+            del self._guilds[guild_id]
+
+        self._channels = None
+        self.save()
+
+    def remove_guild(self, guild_id: int) -> None:
+        """Drop all subscriptions of a guild (e.g. when the bot is removed from it)"""
+        if self._guilds.pop(guild_id, None) is not None:
+            self._channels = None
+            self.save()
+
+    def remove_channel(self, channel_id: int) -> None:
+        """Drop a channel from every subscription (e.g. after it was deleted)"""
+        changed = False
+        for guild_id in list(self._guilds):
+            channels = self._guilds[guild_id]
+            for kind in [kind for kind, subscribed in channels.items() if subscribed == channel_id]:
+                del channels[kind]
+                changed = True
+            if not channels:
+                del self._guilds[guild_id]
+
+        if changed:
+            self._channels = None
+            self.save()
+
+    def get_guild(self, guild_id: int) -> Dict[str, int]:
+        """Subscriptions of one guild"""
+        return dict(self._guilds.get(guild_id, {}))
+
+    def channels_for(self, kind: str) -> List[int]:
+        """All channel IDs subscribed to a kind of post"""
+        if self._channels is None:
+            self._channels = {
+                subscribed_kind: [channels[subscribed_kind] for channels in self._guilds.values() if subscribed_kind in channels]
+                for subscribed_kind in KINDS
+            }
+        return self._channels[kind]
+
+    def guild_count(self) -> int:
+        """Number of guilds with at least one subscription"""
+        return len(self._guilds)
@@ -1,10 +1,31 @@
 import asyncio
 import logging
-from typing import Dict, Optional, Any
+import random
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Any, Sequence, Tuple
+from urllib.parse import urlsplit
 import aiohttp
-import re
 import json
 
+from bot.cache import ResponseCache, HIT, STALE
+from bot.catalog import CatalogEntry, CreatureCatalog
+from bot.circuit import CLOSED, OPEN, CircuitBreaker, HostGuard, is_retryable_status, parse_retry_after
+from bot.details_store import CreatureDetailsStore, StoredDetails
+from bot.hedging import TIBIA_COM_NEWS_URL, HedgedFetcher, Origin, TibiaComOrigin, TibiaDataOrigin
+from bot.http_pool import PoolSettings, PoolStats
+from bot.json_codec import decode
+from bot.logging_setup import UNSAMPLED
+from bot.metrics import (
+    API_REQUESTS, API_SECONDS, DETAILS_REQUESTS, DETAILS_SECONDS, HTTP_REQUESTS, HTTP_RETRIES, HTTP_SECONDS, endpoint_label
+)
+from bot.models import BoostedSnapshot, CreatureDetails, format_number, to_int
+from bot.offload import Offloader
+from bot.ratelimit import TokenBucket
+from bot.server_save import last_server_save
+from bot.singleflight import SingleFlight
+from bot.sources import WIKI_BASE_URL, DetailsSource, build_sources
+from bot.wiki_parser import StreamingInfoboxReader, parse_infobox_html
+
 logger = logging.getLogger(__name__)
 
 class TibiaAPI:
@@ -12,17 +33,82 @@ class TibiaAPI:
     
     BASE_URL = "https://api.tibiadata.com/v4"
     
-    def __init__(self):
+    # Overall deadline (seconds) for fetching both boosted endpoints
+    BOOSTED_DEADLINE = 60
+    
+    # Chunk size (bytes) when streaming TibiaWiki pages into the infobox parser
+    STREAM_CHUNK_SIZE = 16384
+    
+    # Longest Retry-After (seconds) we are willing to wait out before giving up
+    MAX_RETRY_AFTER = 30
+    
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        boosted_deadline: Optional[float] = None,
+        cache_size: int = 256,
+        stale_window: float = 600,
+        details_store: Optional[CreatureDetailsStore] = None,
+        sources: Optional[Sequence[str]] = None,
+        wiki_base_url: Optional[str] = None,
+        offloader: Optional[Offloader] = None,
+        host_rate: float = 5,
+        host_burst: float = 10,
+        breaker_threshold: int = 5,
+        breaker_reset: float = 30,
+        mirror_urls: Optional[Sequence[str]] = None,
+        community_url: Optional[str] = TIBIA_COM_NEWS_URL,
+        hedge_delay: float = 2.0,
+        pool_settings: Optional[PoolSettings] = None
+    ):
         self.session: Optional[aiohttp.ClientSession] = None
+        self.pool_settings = pool_settings or PoolSettings()
+        self._pool_stats = PoolStats()
         self.timeout = aiohttp.ClientTimeout(total=30)
+        self.base_url = (base_url or self.BASE_URL).rstrip('/')
+        self.boosted_deadline = boosted_deadline or self.BOOSTED_DEADLINE
+        
+        # Responses only change at server save, so cache them until then
+        self.cache = ResponseCache(max_size=cache_size, stale_window=stale_window)
+        self._revalidations: Dict[str, asyncio.Task] = {}
+        
+        # Concurrent identical loads share a single upstream request
+        self.single_flight = SingleFlight()
+        
+        # Optional persistent store for parsed creature details
+        self.details_store = details_store
+        
+        # Creature details sources, tried in order (see bot.sources)
+        self.sources: List[DetailsSource] = build_sources(sources)
+        self.wiki_base_url = (wiki_base_url or WIKI_BASE_URL).rstrip('/')
+        
+        # Large JSON bodies and wiki pages are decoded/parsed off the event loop
+        self.offloader = offloader or Offloader()
+        
+        # Per-host request budget and circuit breaker, shared by every caller
+        self.host_rate = host_rate
+        self.host_burst = host_burst
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset = breaker_reset
+        self._hosts: Dict[str, HostGuard] = {}
+        
+        # Boosted data origins, in hedging/failover order
+        origins: List[Origin] = [TibiaDataOrigin(self.base_url, 'tibiadata')]
+        origins.extend(TibiaDataOrigin(url) for url in (mirror_urls or []) if url)
+        if community_url:
+            origins.append(TibiaComOrigin(community_url))
+        self.hedger = HedgedFetcher(origins, default_delay=hedge_delay)
+        
+        # Index over the full creature and boss lists, rebuilt once per server-save cycle
+        self.catalog = CreatureCatalog()
         
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session"""
         if self.session is None or self.session.closed:
-            connector = aiohttp.TCPConnector(limit=10, limit_per_host=5)
             self.session = aiohttp.ClientSession(
-                connector=connector,
+                connector=self.pool_settings.connector(),
                 timeout=self.timeout,
+                trace_configs=[self._pool_stats.trace_config()],
                 headers={
                     'User-Agent': 'TibiaDiscordBot/1.0',
                     'Accept': 'application/json'
@@ -30,87 +116,396 @@ class TibiaAPI:
             )
         return self.session
     
+    def pool_stats(self) -> Dict[str, Any]:
+        """Connection reuse, DNS cache and current pool counts"""
+        connector = self.session.connector if self.session and not self.session.closed else None
+        return self._pool_stats.snapshot(connector)
+    
+    def warm_up_urls(self) -> List[str]:
+        """One URL per upstream origin worth keeping a connection open to"""
+        urls = [origin.url for origin in self.hedger.origins if origin.url]
+        if any(source.store_source.startswith('TibiaWiki') for source in self.sources):
+            urls.append(self.wiki_base_url)
+        
+        seen = set()
+        unique = []
+        for url in urls:
+            parts = urlsplit(url)
+            origin = (parts.scheme, parts.netloc)
+            if origin not in seen:
+                seen.add(origin)
+                unique.append(url)
+        return unique
+    
+    async def warm_up(self, connections_per_host: int = 2) -> Dict[str, bool]:
+        """
+        Open pooled connections to every upstream ahead of server save
+        
+        Sends cheap HEAD requests so DNS, TCP and TLS are done before the
+        boosted fetch needs them. The answers' statuses don't matter and
+        failures are only logged; circuit breakers are left alone.
+        
+        Args:
+            connections_per_host: Concurrent requests per host (the boosted
+                creature and boss are fetched in parallel)
+        
+        Returns:
+            Dict mapping each warmed URL to whether it answered
+        """
+        session = await self._get_session()
+        
+        async def head(url: str) -> bool:
+            await self._host_guard(url).bucket.acquire()
+            try:
+                async with session.head(url, allow_redirects=False) as response:
+                    await response.read()
+                return True
+            except Exception as e:
+                logger.warning(f"Connection warm-up to {url} failed: {e}")
+                return False
+        
+        urls = self.warm_up_urls()
+        per_host = max(1, connections_per_host)
+        results = await asyncio.gather(*(head(url) for url in urls for _ in range(per_host)))
+        warmed = {url: any(results[i * per_host:(i + 1) * per_host]) for i, url in enumerate(urls)}
+        
+        stats = self.pool_stats()
+        logger.info(f"Warmed up {sum(warmed.values())}/{len(urls)} upstream hosts ({stats['idle']} idle connections)")
+        return warmed
+    
     async def close(self):
         """Close the aiohttp session"""
+        for task in self._revalidations.values():
+            task.cancel()
+        self._revalidations.clear()
+        
         if self.session and not self.session.closed:
             await self.session.close()
+        
+        if self.details_store is not None:
+            self.details_store.close()
+            self.details_store = None
+        
+        self.offloader.shutdown()
+    
+    async def _make_request(self, endpoint: str, retries: int = 3, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Make HTTP request to TibiaData API, served from the response cache when possible
+        
+        Args:
+            endpoint: API endpoint path
+            retries: Number of retry attempts
+            use_cache: If False, always hits the API (the response is still cached)
+            
+        Returns:
+            JSON response data or None if failed
+        """
+        key = endpoint.strip('/')
+        label = endpoint_label(key)
+        with API_SECONDS.time(endpoint=label):
+            data = await self._cached(key, lambda: self._fetch_json(key, retries), use_cache)
+        API_REQUESTS.inc(endpoint=label, result='ok' if data is not None else 'failed')
+        return data
+    
+    async def _cached(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[Any]]],
+        use_cache: bool = True,
+        should_store: Callable[[Any], bool] = lambda value: value is not None
+    ) -> Optional[Any]:
+        """
+        Serve a value from the response cache, loading it on a miss
+        
+        Stale entries are returned immediately while a background task refreshes them.
+        Concurrent loads of the same key are coalesced into a single call. If the load
+        fails (e.g. the host's circuit is open), the last known good value is served.
+        
+        Args:
+            key: Cache key
+            loader: Coroutine factory that fetches the value
+            use_cache: If False, always calls the loader (the result is still cached)
+            should_store: Predicate deciding whether a loaded value may be cached
+            
+        Returns:
+            Cached or freshly loaded value
+        """
+        if use_cache:
+            value, state = self.cache.get(key)
+            if state == HIT:
+                return value
+            if state == STALE:
+                self._schedule_revalidation(key, loader, should_store)
+                return value
+        
+        value = await self.single_flight.do(key, loader)
+        if should_store(value):
+            self.cache.set(key, value)
+        elif use_cache:
+            last_good = self.cache.peek(key)
+            if last_good is not None:
+                logger.warning(f"Serving last known good response for {key}")
+                return last_good
+        return value
+    
+    def _schedule_revalidation(self, key: str, loader: Callable[[], Awaitable[Optional[Any]]], should_store: Callable[[Any], bool]):
+        """Refresh a stale cache entry in the background (at most once per key)"""
+        if key in self._revalidations:
+            return
+        
+        async def revalidate():
+            try:
+                value = await self.single_flight.do(key, loader)
+                if should_store(value):
+                    self.cache.set(key, value)
+            except Exception as e:
+                logger.error(f"Background revalidation failed for {key}: {e}")
+            finally:
+                self._revalidations.pop(key, None)
+        
+        self._revalidations[key] = asyncio.create_task(revalidate())
     
-    async def _make_request(self, endpoint: str, retries: int = 3) -> Optional[Dict[str, Any]]:
+    async def _fetch_json(self, endpoint: str, retries: int = 3, base_url: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
-        Make HTTP request to TibiaData API
+        Fetch JSON from TibiaData API, bypassing the cache
         
         Args:
             endpoint: API endpoint path
             retries: Number of retry attempts
+            base_url: API root to use instead of base_url (e.g. a mirror)
             
         Returns:
             JSON response data or None if failed
         """
-        url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
+        url = f"{(base_url or self.base_url)}/{endpoint.lstrip('/')}"
+        status, data, _ = await self._fetch(url, retries)
+        return data if status == 200 else None
+    
+    async def _fetch(
+        self,
+        url: str,
+        retries: int = 3,
+        headers: Optional[Dict[str, str]] = None,
+        as_json: bool = True,
+        stream_into: Optional[StreamingInfoboxReader] = None
+    ) -> Tuple[Optional[int], Any, Mapping[str, str]]:
+        """
+        GET a URL with retries, supporting conditional requests
+        
+        A 304 Not Modified answer is returned immediately without reading the body.
+        Only timeouts, connection errors, 408/425/429 and 5xx are retried (honoring
+        Retry-After); other statuses are returned as-is. Every attempt goes through
+        the host's token bucket and circuit breaker.
+        
+        Args:
+            url: Absolute URL
+            retries: Number of retry attempts
+            headers: Extra request headers (e.g. If-None-Match)
+            as_json: Decode the body as JSON, otherwise return it as text
+            stream_into: Feed the body chunk by chunk into this reader instead, stopping
+                as soon as it needs no more input (the reader is returned as the body)
+            
+        Returns:
+            Tuple of (status or None if failed, decoded body, response headers)
+        """
+        guard = self._host_guard(url)
         
         for attempt in range(retries + 1):
+            # Fail fast while the host is known to be down instead of piling on retries
+            if not guard.breaker.allow():
+                logger.warning(f"Circuit open for {guard.host}, not requesting {url} (retry in {guard.breaker.retry_in():.0f}s)")
+                HTTP_REQUESTS.inc(host=guard.host, outcome='circuit_open')
+                return None, None, {}
+            
+            # Shared request budget per host across all callers
+            await guard.bucket.acquire()
+            
+            retry_after = None
+            outcome = 'error'
+            started = time.monotonic()
             try:
                 session = await self._get_session()
-                async with session.get(url) as response:
+                async with session.get(url, headers=headers) as response:
+                    outcome = str(response.status)
                     if response.status == 200:
-                        data = await response.json()
-                        return data
-                    elif response.status == 429:  # Rate limited
-                        wait_time = 2 ** attempt
-                        logger.warning(f"Rate limited. Waiting {wait_time}s before retry {attempt + 1}")
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        logger.error(f"API request failed with status {response.status}: {url}")
+                        if stream_into is not None:
+                            # Large pages are parsed chunk by chunk in the offload thread pool
+                            async for chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+                                if await self.offloader.run(stream_into.feed, chunk, size=response.content_length, stateful=True):
+                                    break
+                            guard.breaker.record_success()
+                            return response.status, stream_into, response.headers.copy()
+                        
+                        if as_json:
+                            body = await response.read()
+                            data = await self.offloader.run(decode, body, size=len(body)) if body else None
+                        else:
+                            data = await response.text()
+                        guard.breaker.record_success()
+                        return response.status, data, response.headers.copy()
+                    elif response.status == 304:  # Not modified, nothing to parse
+                        guard.breaker.record_success()
+                        return response.status, None, response.headers.copy()
+                    elif not is_retryable_status(response.status):
+                        # 404 and friends won't change on retry, and the host is clearly up
+                        guard.breaker.record_success()
+                        logger.warning(f"API request failed with status {response.status}: {url}")
+                        return response.status, None, response.headers.copy()
+                    
+                    guard.breaker.record_failure()
+                    retry_after = parse_retry_after(response.headers)
+                    logger.warning(f"API request failed with status {response.status}: {url} (attempt {attempt + 1})")
                         
             except asyncio.TimeoutError:
-                logger.error(f"Request timeout for {url} (attempt {attempt + 1})")
+                outcome = 'timeout'
+                guard.breaker.record_failure()
+                logger.warning(f"Request timeout for {url} (attempt {attempt + 1})")
             except aiohttp.ClientError as e:
-                logger.error(f"Client error for {url}: {e} (attempt {attempt + 1})")
+                guard.breaker.record_failure()
+                logger.warning(f"Client error for {url}: {e} (attempt {attempt + 1})")
             except Exception as e:
-                logger.error(f"Unexpected error for {url}: {e} (attempt {attempt + 1})")
+                logger.warning(f"Unexpected error for {url}: {e} (attempt {attempt + 1})")
+            finally:
+                HTTP_REQUESTS.inc(host=guard.host, outcome=outcome)
+                HTTP_SECONDS.observe(time.monotonic() - started, host=guard.host)
             
             if attempt < retries:
-                wait_time = 2 ** attempt
+                if guard.breaker.state == OPEN:
+                    # This (or a concurrent) request just tripped the breaker; stop here
+                    break
+                if retry_after is not None and retry_after > self.MAX_RETRY_AFTER:
+                    logger.warning(f"Retry-After of {retry_after:.0f}s for {url} exceeds {self.MAX_RETRY_AFTER}s, giving up")
+                    break
+                # Honor Retry-After, otherwise back off exponentially with jitter
+                wait_time = retry_after if retry_after is not None else (2 ** attempt) * random.uniform(0.5, 1.5)
+                HTTP_RETRIES.inc(host=guard.host)
                 await asyncio.sleep(wait_time)
         
-        logger.error(f"Failed to fetch data from {url} after {retries + 1} attempts")
-        return None
+        # Only the final outcome is an error; per-attempt warnings above may be sampled away
+        logger.error(f"Failed to fetch data from {url} after {attempt + 1} attempts")
+        return None, None, {}
+    
+    def _host_guard(self, url: str) -> HostGuard:
+        """Get (creating on first use) the rate limiter and circuit breaker for a URL's host"""
+        host = urlsplit(url).netloc
+        guard = self._hosts.get(host)
+        if guard is None:
+            guard = HostGuard(
+                host,
+                TokenBucket(rate=self.host_rate, capacity=self.host_burst),
+                CircuitBreaker(failure_threshold=self.breaker_threshold, reset_timeout=self.breaker_reset)
+            )
+            self._hosts[host] = guard
+        return guard
     
-    async def get_boosted_creatures(self) -> Optional[Dict[str, str]]:
+    def host_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Rate limiter and circuit breaker state per upstream host"""
+        return {host: guard.stats() for host, guard in self._hosts.items()}
+    
+    def is_degraded(self) -> bool:
+        """Whether any upstream host's circuit is currently not closed"""
+        return any(guard.breaker.state != CLOSED for guard in self._hosts.values())
+    
+    async def _fetch_boosted(self, kind: str, fresh: bool = False) -> Tuple[str, Optional[str], Optional[str]]:
         """
-        Get current boosted creature and boss
+        Fetch one half of the boosted data
         
+        Args:
+            kind: Either 'creature' or 'boss'
+            fresh: If True, bypass the response cache
+            
         Returns:
-            Dict with 'boosted_creature' and 'boosted_boss' keys, or None if failed
+            Tuple of (kind, boosted name, API timestamp)
         """
-        try:
-            # Get boosted creatures data
-            creatures_data = await self._make_request("creatures")
+        endpoint, section = ("creatures", "creatures") if kind == 'creature' else ("boostablebosses", "boostable_bosses")
+        data = await self._cached(
+            f"boosted/{endpoint}", lambda: self._fetch_boosted_payload(endpoint, section), use_cache=not fresh
+        )
+        
+        # The same payload feeds the catalog, so no separate list request is needed
+        # (answers from tibia.com carry no lists and are ignored by the catalog)
+        if kind == 'creature':
+            self.catalog.ingest_creatures(data)
+        else:
+            self.catalog.ingest_bosses(data)
+        
+        name = None
+        if data and section in data:
+            info = data[section]
+            if 'boosted' in info and info['boosted']:
+                name = info['boosted']['name']
+        
+        timestamp = data.get('information', {}).get('timestamp') if data else None
+        return kind, name, timestamp
+    
+    async def _fetch_boosted_payload(self, endpoint: str, section: str) -> Optional[Dict[str, Any]]:
+        """Fetch a boosted endpoint from the fastest origin, hedging when the primary is slow"""
+        data = await self.hedger.fetch(
+            self, endpoint, validate=lambda payload: bool(((payload.get(section) or {}).get('boosted') or {}).get('name'))
+        )
+        
+        # Full TibiaData payloads (primary or mirror) also serve the list endpoint
+        if data is not None and not data.get('information', {}).get('partial'):
+            self.cache.set(endpoint, data)
+        return data
+    
+    async def iter_boosted_creatures(self, deadline: Optional[float] = None, fresh: bool = False) -> AsyncIterator[Tuple[str, Optional[str], Optional[str]]]:
+        """
+        Fetch the boosted creature and boss concurrently, yielding each half as soon as it is ready
+        
+        Both endpoints share a single overall deadline; whatever has not answered
+        by then is cancelled and never yielded.
+        
+        Args:
+            deadline: Overall deadline in seconds (defaults to boosted_deadline)
+            fresh: If True, bypass the response cache (used by change detection)
             
-            boosted_creature = None
-            if creatures_data and 'creatures' in creatures_data:
-                creatures_info = creatures_data['creatures']
-                if 'boosted' in creatures_info and creatures_info['boosted']:
-                    boosted_creature = creatures_info['boosted']['name']
+        Yields:
+            Tuples of (kind, boosted name, API timestamp) where kind is 'creature' or 'boss'
+        """
+        deadline = deadline or self.boosted_deadline
+        tasks = [
+            asyncio.create_task(self._fetch_boosted('creature', fresh)),
+            asyncio.create_task(self._fetch_boosted('boss', fresh)),
+        ]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks, timeout=deadline):
+                try:
+                    half = await next_done
+                except asyncio.TimeoutError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Error fetching boosted data: {e}")
+                    continue
+                yield half
+        except asyncio.TimeoutError:
+            logger.error(f"Boosted data fetch exceeded deadline of {deadline}s")
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    async def get_boosted_creatures(self, fresh: bool = False) -> Optional[BoostedSnapshot]:
+        """
+        Get current boosted creature and boss
+        
+        Args:
+            fresh: If True, bypass the response cache
             
-            # Get boostable bosses data
-            bosses_data = await self._make_request("boostablebosses")
+        Returns:
+            BoostedSnapshot with the creature and boss names, or None if failed
+        """
+        try:
+            snapshot = BoostedSnapshot()
             
-            boosted_boss = None
-            if bosses_data and 'boostable_bosses' in bosses_data:
-                bosses_info = bosses_data['boostable_bosses']
-                if 'boosted' in bosses_info and bosses_info['boosted']:
-                    boosted_boss = bosses_info['boosted']['name']
+            async for kind, name, timestamp in self.iter_boosted_creatures(fresh=fresh):
+                snapshot = snapshot.with_kind(kind, name, timestamp)
             
-            if boosted_creature or boosted_boss:
-                result = {
-                    'boosted_creature': boosted_creature,
-                    'boosted_boss': boosted_boss,
-                    'timestamp': creatures_data.get('information', {}).get('timestamp') if creatures_data else None
-                }
-                logger.info(f"Fetched boosted data: creature={boosted_creature}, boss={boosted_boss}")
-                return result
+            if not snapshot.empty:
+                # Parsed back by BoostedHistory.backfill_from_logs, so never sampled away
+                logger.info(f"Fetched boosted data: creature={snapshot.creature}, boss={snapshot.boss}", extra=UNSAMPLED)
+                return snapshot
             else:
                 logger.warning("No boosted creature or boss found in API response")
                 return None
@@ -119,74 +514,190 @@ class TibiaAPI:
             logger.error(f"Error fetching boosted creatures: {e}")
             return None
     
-    async def get_creature_details(self, creature_name: str) -> Optional[Dict[str, Any]]:
+    async def get_creature_details(self, creature_name: str) -> Optional[CreatureDetails]:
         """
         Get detailed information about a specific creature
         First tries TibiaData API, then falls back to TibiaWiki scraping
         
+        Results are cached until the next server save; placeholder fallback info is not cached.
+        
         Args:
             creature_name: Name of the creature
             
         Returns:
-            Creature details dict or None if not found
+            Normalized CreatureDetails or None if not found
         """
         if not creature_name:
             return None
+        
+        started = time.monotonic()
+        details = await self._cached(
+            f"details/{creature_name.strip().lower()}",
+            lambda: self._load_indexed_creature_details(creature_name),
+            should_store=lambda details: details is not None and not details.is_fallback
+        )
+        
+        source = details.source if details else 'none'
+        DETAILS_REQUESTS.inc(source=source)
+        DETAILS_SECONDS.observe(time.monotonic() - started, source=source)
+        return details
+
+    def last_known_creature_details(self, creature_name: str) -> Optional[CreatureDetails]:
+        """
+        Creature details already at hand, without any network call
+
+        Used when a fetch cannot finish in time: the cached details (even if
+        stale), else the on-disk store, else placeholder info with the catalog image.
+
+        Args:
+            creature_name: Name of the creature
+
+        Returns:
+            CreatureDetails or None if no name was given
+        """
+        if not creature_name:
+            return None
+
+        cached = self.cache.peek(f"details/{creature_name.strip().lower()}")
+        if cached is not None:
+            return cached
+
+        stored = self.details_store.get(creature_name) if self.details_store is not None else None
+        raw = stored.details if stored else self._create_fallback_creature_info(creature_name)
+        return CreatureDetails.from_dict(raw, creature_name).with_image_url(self.catalog.image_url(creature_name))
+
+    def last_known_boosted(self) -> Optional[BoostedSnapshot]:
+        """
+        The boosted creature and boss as last seen, without any network call
+
+        Returns:
+            BoostedSnapshot from the catalog's last ingested lists, or None if nothing was seen yet
+        """
+        if not self.catalog.boosted_creature and not self.catalog.boosted_boss:
+            return None
+
+        data = self.cache.peek("boosted/creatures") or self.cache.peek("boosted/boostablebosses")
+        timestamp = data.get('information', {}).get('timestamp') if data else None
+        return BoostedSnapshot(creature=self.catalog.boosted_creature, boss=self.catalog.boosted_boss, timestamp=timestamp)
+
+    async def _load_indexed_creature_details(self, creature_name: str) -> Optional[CreatureDetails]:
+        """Load creature details using the catalog's race and image URL when indexed"""
+        entry = await self.lookup_creature(creature_name)
+        raw = await self._load_creature_details(creature_name, entry.race if entry else None)
+        if not raw:
+            return None
+        
+        # Normalize once here; everything downstream (cache, embeds) uses the model.
+        # Prefer the catalog's image over guessing a TibiaWiki file name in the embed
+        return CreatureDetails.from_dict(raw, creature_name).with_image_url(entry.image_url if entry else None)
+    
+    async def _load_creature_details(self, creature_name: str, race: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Load creature details from the on-disk store or the configured sources
+        
+        Stored details already revalidated since the last server save are returned
+        without any network call. Otherwise each source is tried in order; a source
+        revalidates details it stored itself with a conditional GET where it can.
+        """
+        stored = self.details_store.get(creature_name) if self.details_store is not None else None
+        if stored and stored.validated_at >= last_server_save().timestamp():
+            return stored.details
+        
+        for source in self.sources:
+            try:
+                creature_info = await source.fetch(
+                    self, creature_name, race, stored if stored and stored.source == source.store_source else None
+                )
+                if creature_info:
+                    return creature_info
+                logger.info(f"No details from {source.name} for {creature_name}, trying next source")
+            except Exception as e:
+                logger.error(f"Error fetching creature details from {source.name} for {creature_name}: {e}")
+        
+        if stored:
+            logger.info(f"Using stored details for: {creature_name}")
+            return stored.details
+        return self._create_fallback_creature_info(creature_name)
+    
+    async def prefetch_creature_details(self, creature_names: Sequence[str]) -> Dict[str, CreatureDetails]:
+        """
+        Load details for several creatures, batching requests where a source supports it
+        
+        Names already cached are skipped; the rest are handed to each source's
+        fetch_many in order until all are found. Results are cached like
+        get_creature_details results.
+        
+        Args:
+            creature_names: Names of the creatures
             
-        try:
-            # First try TibiaData API
-            formatted_name = creature_name.replace(' ', '_').lower()
-            data = await self._make_request(f"creature/{formatted_name}")
-            
-            if data and 'creature' in data:
-                creature_info = data['creature']
-                logger.info(f"Fetched details for creature from TibiaData: {creature_name}")
-                return creature_info
-            else:
-                # Fallback to TibiaWiki scraping
-                logger.info(f"TibiaData failed, trying TibiaWiki for: {creature_name}")
-                return await self._scrape_tibiawiki_creature(creature_name)
-                
-        except Exception as e:
-            logger.error(f"Error fetching creature details for {creature_name}: {e}")
-            return await self._scrape_tibiawiki_creature(creature_name)
+        Returns:
+            Dict of name to details for the names that were found
+        """
+        results: Dict[str, CreatureDetails] = {}
+        remaining = []
+        for creature_name in creature_names:
+            cached, state = self.cache.get(f"details/{creature_name.strip().lower()}")
+            if state == HIT and cached:
+                results[creature_name] = cached
+            elif creature_name:
+                remaining.append(creature_name)
+        
+        for source in self.sources:
+            if not remaining:
+                break
+            try:
+                found = await source.fetch_many(self, remaining)
+            except Exception as e:
+                logger.error(f"Error prefetching creature details from {source.name}: {e}")
+                continue
+            for creature_name, creature_info in found.items():
+                details = CreatureDetails.from_dict(creature_info, creature_name)
+                details = details.with_image_url(self.catalog.image_url(creature_name))
+                self.cache.set(f"details/{creature_name.strip().lower()}", details)
+                results[creature_name] = details
+            remaining = [creature_name for creature_name in remaining if creature_name not in found]
+        
+        return results
     
-    async def _scrape_tibiawiki_creature(self, creature_name: str) -> Optional[Dict[str, Any]]:
+    async def _fetch_tibiadata_details(
+        self,
+        creature_name: str,
+        stored: Optional[StoredDetails] = None,
+        race: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """
-        Scrape creature information from TibiaWiki as fallback
+        Fetch creature details from TibiaData, revalidating stored details if given
         
         Args:
             creature_name: Name of the creature
+            stored: Previously stored TibiaData details to revalidate
+            race: TibiaData race identifier from the catalog (guessed from the name if not given)
             
         Returns:
-            Creature details dict or None if not found
+            Creature details dict or None if not available
         """
-        try:
-            # Format creature name for TibiaWiki URL
-            wiki_name = creature_name.replace(' ', '_')
-            wiki_url = f"https://tibia.fandom.com/wiki/{wiki_name}"
-            
-            session = await self._get_session()
-            async with session.get(wiki_url) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    
-                    # Parse basic creature info from TibiaWiki
-                    creature_info = self._parse_tibiawiki_html(html, creature_name)
-                    
-                    if creature_info:
-                        logger.info(f"Scraped creature info from TibiaWiki: {creature_name}")
-                        return creature_info
-                    else:
-                        logger.warning(f"Could not parse TibiaWiki data for: {creature_name}")
-                        return self._create_fallback_creature_info(creature_name)
-                else:
-                    logger.warning(f"TibiaWiki returned status {response.status} for: {creature_name}")
-                    return self._create_fallback_creature_info(creature_name)
-                    
-        except Exception as e:
-            logger.error(f"Error scraping TibiaWiki for {creature_name}: {e}")
-            return self._create_fallback_creature_info(creature_name)
+        formatted_name = race or creature_name.replace(' ', '_').lower()
+        url = f"{self.base_url}/creature/{formatted_name}"
+        headers = stored.conditional_headers() if stored else None
+        
+        status, data, response_headers = await self._fetch(url, headers=headers or None)
+        
+        if status == 304 and stored:
+            self.details_store.touch(creature_name)
+            logger.info(f"Creature details not modified, using stored copy: {creature_name}")
+            return stored.details
+        
+        if status == 200 and data and 'creature' in data:
+            creature_info = data['creature']
+            if self.details_store is not None:
+                self.details_store.put(
+                    creature_name, creature_info, 'TibiaData',
+                    response_headers.get('ETag'), response_headers.get('Last-Modified')
+                )
+            logger.info(f"Fetched details for creature from TibiaData: {creature_name}")
+            return creature_info
+        
+        return None
     
     def _parse_tibiawiki_html(self, html: str, creature_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -200,34 +711,7 @@ class TibiaAPI:
             Parsed creature information
         """
         try:
-            # Extract basic stats using regex patterns
-            hp_match = re.search(r'Hit Points.*?(\d+)', html, re.IGNORECASE)
-            exp_match = re.search(r'Experience.*?(\d+)', html, re.IGNORECASE)
-            
-            # Extract description from the first paragraph
-            desc_match = re.search(r'<p.*?>(.*?)</p>', html, re.DOTALL)
-            
-            # Clean up description
-            description = ""
-            if desc_match:
-                desc_text = desc_match.group(1)
-                # Remove HTML tags
-                desc_text = re.sub(r'<[^>]+>', '', desc_text)
-                # Clean up whitespace
-                desc_text = re.sub(r'\s+', ' ', desc_text).strip()
-                if len(desc_text) > 50:  # Only use if it's substantial
-                    description = desc_text[:200] + "..." if len(desc_text) > 200 else desc_text
-            
-            creature_info = {
-                'name': creature_name,
-                'hitpoints': int(hp_match.group(1)) if hp_match else 'Unknown',
-                'experience_points': int(exp_match.group(1)) if exp_match else 'Unknown',
-                'description': description or f"Information about {creature_name}",
-                'source': 'TibiaWiki'
-            }
-            
-            return creature_info
-            
+            return parse_infobox_html(html, creature_name)
         except Exception as e:
             logger.error(f"Error parsing TibiaWiki HTML for {creature_name}: {e}")
             return None
@@ -250,6 +734,41 @@ class TibiaAPI:
             'source': 'Fallback'
         }
     
+    async def refresh_catalog(self, force: bool = False) -> CreatureCatalog:
+        """
+        Make sure the creature/boss catalog is built for the current server-save cycle
+        
+        Args:
+            force: If True, re-download both lists even if the catalog is current
+            
+        Returns:
+            The catalog (possibly partially filled if a request failed)
+        """
+        if force or not self.catalog.is_current():
+            creatures_data, bosses_data = await asyncio.gather(
+                self._make_request("creatures", use_cache=not force),
+                self._make_request("boostablebosses", use_cache=not force)
+            )
+            self.catalog.ingest_creatures(creatures_data)
+            self.catalog.ingest_bosses(bosses_data)
+        return self.catalog
+    
+    async def lookup_creature(self, creature_name: str) -> Optional[CatalogEntry]:
+        """
+        Look up a creature or boss in the catalog
+        
+        Args:
+            creature_name: Name of the creature or boss
+            
+        Returns:
+            CatalogEntry or None if unknown
+        """
+        try:
+            await self.refresh_catalog()
+        except Exception as e:
+            logger.error(f"Error refreshing creature catalog: {e}")
+        return self.catalog.lookup(creature_name)
+    
     async def get_all_creatures(self) -> Optional[Dict[str, Any]]:
         """
         Get list of all creatures (for reference/debugging)
@@ -261,6 +780,7 @@ class TibiaAPI:
             data = await self._make_request("creatures")
             
             if data and 'creatures' in data:
+                self.catalog.ingest_creatures(data)
                 logger.info("Fetched all creatures list")
                 return data['creatures']
             else:
@@ -273,25 +793,15 @@ class TibiaAPI:
     
     def format_hp(self, hp_value: Any) -> str:
         """Format HP value for display"""
-        if isinstance(hp_value, (int, float)):
-            return f"{int(hp_value):,}"
-        elif isinstance(hp_value, str) and hp_value.isdigit():
-            return f"{int(hp_value):,}"
-        else:
-            return str(hp_value) if hp_value else "Unknown"
+        return format_number(to_int(hp_value))
     
     def format_experience(self, exp_value: Any) -> str:
         """Format experience value for display"""
-        if isinstance(exp_value, (int, float)):
-            return f"{int(exp_value):,}"
-        elif isinstance(exp_value, str) and exp_value.isdigit():
-            return f"{int(exp_value):,}"
-        else:
-            return str(exp_value) if exp_value else "Unknown"
+        return format_number(to_int(exp_value))
     
     def get_creature_image_url(self, creature_name: str) -> str:
         """
-        Get creature image URL from TibiaWiki
+        Get creature image URL, from the catalog when indexed, otherwise TibiaWiki
         
         Args:
             creature_name: Name of the creature
@@ -302,6 +812,10 @@ class TibiaAPI:
         if not creature_name:
             return ""
         
+        image_url = self.catalog.image_url(creature_name)
+        if image_url:
+            return image_url
+        
         # Format name for TibiaWiki (replace spaces with underscores)
         formatted_name = creature_name.replace(' ', '_')
         
@@ -0,0 +1,240 @@
+import json
+import logging
+from typing import IO, Dict, Iterable, List, Optional, Set, Tuple
+
+from bot.catalog import normalize_name
+from bot.state_store import write_atomic
+
+logger = logging.getLogger(__name__)
+
+# Where a watcher is notified: a channel ID (mentioned there) or None (direct message)
+Target = Optional[int]
+
+
+class WatchlistStore:
+    """
+    Per-user watchlists of creature/boss names, with an inverted index by name
+
+    In memory, watches are indexed by name (for notifying), by user (for
+    /watchlist) and by channel (to drop watches of deleted channels). Finding who
+    to notify is one dict lookup plus iterating the matches, however many
+    watches there are in total.
+
+    Changes are appended to a JSON Lines log of add/remove operations, so a
+    /watch never rewrites the whole file. The log is replayed on load and
+    compacted once it has grown well past the number of live watches.
+    """
+
+    MAX_PER_USER = 25
+
+    def __init__(self, path: str = "watchlist.jsonl", max_per_user: Optional[int] = None):
+        self.path = path
+        self.max_per_user = max_per_user or self.MAX_PER_USER
+        # normalized name -> {(user_id, target)}
+        self._by_name: Dict[str, Set[Tuple[int, Target]]] = {}
+        # user_id -> {(name, target)}
+        self._by_user: Dict[int, Set[Tuple[str, Target]]] = {}
+        # channel_id -> {(user_id, name)}
+        self._by_channel: Dict[int, Set[Tuple[int, str]]] = {}
+        # normalized name -> display name
+        self._display: Dict[str, str] = {}
+        self._count = 0
+        self._ops = 0
+        self.load()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def load(self) -> None:
+        """Replay the operation log, compacting it if it has grown too long"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.error(f"Could not read watchlist from {self.path}: {e}")
+            return
+
+        skipped = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                op = json.loads(line)
+                args = (int(op['user']), op['name'], int(op['channel']) if op.get('channel') else None)
+                if op['op'] == 'add':
+                    self._add(*args)
+                else:
+                    self._remove(*args)
+                self._ops += 1
+            except (ValueError, KeyError, TypeError):
+                skipped += 1
+
+        if skipped:
+            logger.error(f"Skipped {skipped} unreadable lines in {self.path}")
+        logger.info(f"Loaded {len(self)} watches for {len(self._by_user)} users")
+        self._maybe_compact()
+
+    def _add(self, user_id: int, name: str, target: Target) -> bool:
+        key = normalize_name(name)
+        watches = self._by_name.setdefault(key, set())
+        if (user_id, target) in watches:
+            return False
+        watches.add((user_id, target))
+        self._by_user.setdefault(user_id, set()).add((key, target))
+        if target is not None:
+            self._by_channel.setdefault(target, set()).add((user_id, key))
+        self._display[key] = ' '.join(name.split())
+        self._count += 1
+        return True
+
+    def _remove(self, user_id: int, name: str, target: Target) -> bool:
+        key = normalize_name(name)
+        watches = self._by_name.get(key)
+        if not watches or (user_id, target) not in watches:
+            return False
+
+        watches.discard((user_id, target))
+        if not watches:
+            del self._by_name[key]
+            self._display.pop(key, None)
+
+        user_watches = self._by_user[user_id]
+        user_watches.discard((key, target))
+        if not user_watches:
+            del self._by_user[user_id]
+
+        if target is not None:
+            channel_watches = self._by_channel[target]
+            channel_watches.discard((user_id, key))
+            if not channel_watches:
+                del self._by_channel[target]
+        self._count -= 1
+        return True
+
+    def _log(self, op: str, user_id: int, name: str, target: Target) -> None:
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'op': op, 'user': user_id, 'name': name, 'channel': target}, ensure_ascii=False) + '\n')
+        except OSError as e:
+            logger.error(f"Could not write watchlist change to {self.path}: {e}")
+            return
+        self._ops += 1
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        """Rewrite the log as one add per live watch once it is mostly dead operations"""
+        live = len(self)
+        if self._ops <= 2 * live + 1000:
+            return
+
+        def write_live(f: IO[str]) -> None:
+            for user_id, watches in self._by_user.items():
+                for key, target in watches:
+                    f.write(json.dumps(
+                        {'op': 'add', 'user': user_id, 'name': self._display[key], 'channel': target}, ensure_ascii=False
+                    ) + '\n')
+
+        try:
+            write_atomic(self.path, write_live)
+        except OSError as e:
+            logger.error(f"Could not compact watchlist {self.path}: {e}")
+            return
+
+        logger.info(f"Compacted watchlist log from {self._ops} to {live} entries")
+        self._ops = live
+
+    def add(self, user_id: int, name: str, target: Target) -> bool:
+        """
+        Watch a creature/boss name
+
+        Args:
+            user_id: Discord user ID
+            name: Creature or boss name
+            target: Channel to be mentioned in, or None for a direct message
+
+        Returns:
+            True if added, False if the user already watches it there
+
+        Raises:
+            ValueError: If the user already has `max_per_user` watches
+        """
+        if (normalize_name(name), target) in self._by_user.get(user_id, ()):
+            return False
+        if len(self._by_user.get(user_id, ())) >= self.max_per_user:
+            raise ValueError(f"You can watch at most {self.max_per_user} creatures/bosses")
+
+        self._add(user_id, name, target)
+        self._log('add', user_id, ' '.join(name.split()), target)
+        return True
+
+    def remove(self, user_id: int, name: str) -> int:
+        """Stop watching a name everywhere; returns how many watches were removed"""
+        key = normalize_name(name)
+        targets = [target for watched, target in self._by_user.get(user_id, ()) if watched == key]
+        for target in targets:
+            self._remove(user_id, key, target)
+            self._log('remove', user_id, key, target)
+        return len(targets)
+
+    def remove_channel(self, channel_id: int) -> int:
+        """Drop every watch notifying in a channel (e.g. after it was deleted)"""
+        watches = list(self._by_channel.get(channel_id, ()))
+        for user_id, key in watches:
+            self._remove(user_id, key, channel_id)
+            self._log('remove', user_id, key, channel_id)
+        return len(watches)
+
+    def watches_of(self, user_id: int) -> List[Tuple[str, Target]]:
+        """(display name, target) of a user's watches, sorted by name"""
+        return sorted(
+            ((self._display.get(key, key), target) for key, target in self._by_user.get(user_id, ())),
+            key=lambda watch: watch[0].lower()
+        )
+
+    def matches(self, names: Iterable[str]) -> Dict[Target, Dict[int, List[str]]]:
+        """
+        Who to notify about boosted names, grouped by where
+
+        Args:
+            names: Newly boosted creature/boss names
+
+        Returns:
+            Dict mapping target (channel ID, or None for DMs) to {user_id: [names]}
+        """
+        grouped: Dict[Target, Dict[int, List[str]]] = {}
+        for name in names:
+            for user_id, target in self._by_name.get(normalize_name(name), ()):
+                grouped.setdefault(target, {}).setdefault(user_id, []).append(name)
+        return grouped
+
+    def watched_names(self) -> int:
+        """Number of distinct names being watched"""
+        return len(self._by_name)
+
+
+def mention_batches(name: str, kind: str, user_ids: Iterable[int], limit: int = 2000) -> List[str]:
+    """
+    Channel messages mentioning every watcher of a name, each within Discord's length limit
+
+    Args:
+        name: Boosted creature/boss name
+        kind: Either 'creature' or 'boss'
+        user_ids: Users to mention
+        limit: Maximum message length
+
+    Returns:
+        Message contents
+    """
+    header = f"🔔 **{name}** is today's boosted {kind}!"
+    messages = []
+    current = header
+    for user_id in sorted(user_ids):
+        mention = f" <@{user_id}>"
+        if len(current) + len(mention) > limit:
+            messages.append(current)
+            current = header + " (cont.)"
+        current += mention
+    messages.append(current)
+    return messages
@@ -0,0 +1,385 @@
+import codecs
+import re
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional
+
+# Infobox `data-source` keys we extract, mapped to our field names
+INFOBOX_FIELDS = {
+    'hp': 'hitpoints',
+    'exp': 'experience_points',
+    'armor': 'armor',
+    'speed': 'speed',
+    'loot': 'loot'
+}
+
+# Paragraphs shorter than this are usually disambiguation notes or empty stubs
+MIN_DESCRIPTION_LENGTH = 50
+
+_NUMBER = re.compile(r'\d[\d,.]*')
+
+
+def parse_number(text: str) -> Optional[int]:
+    """Parse the first integer in an infobox value ("1,900", "2.500 (+/-)") or None"""
+    match = _NUMBER.search(text or '')
+    if not match:
+        return None
+    digits = match.group(0).replace(',', '').replace('.', '')
+    return int(digits) if digits else None
+
+
+class InfoboxParser(HTMLParser):
+    """
+    Incremental parser for TibiaWiki (fandom) creature pages
+
+    Feed it the page in chunks; it picks the HP, experience, armor, speed and loot
+    values out of the portable infobox plus the first real paragraph, and sets
+    `done` as soon as the infobox has closed and a description was found, so the
+    caller can stop reading the rest of the (large) page.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.values: Dict[str, str] = {}
+        self.loot: List[str] = []
+        self.description: Optional[str] = None
+
+        self.infobox_seen = False
+        self._in_infobox = False
+        self._infobox_depth = 0
+
+        self._field: Optional[str] = None
+        self._field_depth = 0
+        self._field_text: List[str] = []
+        self._in_label = False
+        self._in_link = False
+        self._link_text: List[str] = []
+
+        self._in_paragraph = False
+        self._paragraph_text: List[str] = []
+        self._skip_depth = 0
+
+    @property
+    def done(self) -> bool:
+        """Whether everything we need has been found"""
+        infobox_finished = self.infobox_seen and not self._in_infobox
+        return infobox_finished and self.description is not None
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        attributes = dict(attrs)
+        classes = attributes.get('class') or ''
+
+        if tag in ('script', 'style'):
+            self._skip_depth += 1
+            return
+
+        if self._in_infobox:
+            if tag == 'aside':
+                self._infobox_depth += 1
+            if self._field is not None:
+                if tag == 'div':
+                    self._field_depth += 1
+                elif tag == 'h3':
+                    self._in_label = True
+                elif tag == 'a' and self._field == 'loot':
+                    self._in_link = True
+                    self._link_text = []
+                elif tag == 'br':
+                    self._field_text.append(' ')
+            elif tag == 'div' and attributes.get('data-source') in INFOBOX_FIELDS:
+                self._field = INFOBOX_FIELDS[attributes['data-source']]
+                self._field_depth = 1
+                self._field_text = []
+            return
+
+        if tag == 'aside' and 'portable-infobox' in classes:
+            self.infobox_seen = True
+            self._in_infobox = True
+            self._infobox_depth = 1
+        elif tag == 'p' and self.description is None:
+            self._in_paragraph = True
+            self._paragraph_text = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in ('script', 'style'):
+            self._skip_depth = max(0, self._skip_depth - 1)
+            return
+
+        if self._in_infobox:
+            if self._field is not None:
+                if tag == 'h3':
+                    self._in_label = False
+                elif tag == 'a' and self._in_link:
+                    self._in_link = False
+                    item = " ".join("".join(self._link_text).split())
+                    if item:
+                        self.loot.append(item)
+                elif tag == 'div':
+                    self._field_depth -= 1
+                    if self._field_depth == 0:
+                        self.values[self._field] = " ".join("".join(self._field_text).split())
+                        self._field = None
+            if tag == 'aside':
+                self._infobox_depth -= 1
+                if self._infobox_depth == 0:
+                    self._in_infobox = False
+            return
+
+        if tag == 'p' and self._in_paragraph:
+            self._in_paragraph = False
+            text = " ".join("".join(self._paragraph_text).split())
+            if len(text) > MIN_DESCRIPTION_LENGTH:
+                self.description = text
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        if self._field is not None and not self._in_label:
+            self._field_text.append(data)
+            if self._in_link:
+                self._link_text.append(data)
+        elif self._in_paragraph:
+            self._paragraph_text.append(data)
+
+    def result(self, creature_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Structured creature info from what was parsed
+
+        Args:
+            creature_name: Name of the creature
+
+        Returns:
+            Creature info dict, or None if neither infobox nor description was found
+        """
+        if not self.values and not self.description:
+            return None
+
+        hitpoints = parse_number(self.values.get('hitpoints', ''))
+        experience = parse_number(self.values.get('experience_points', ''))
+        description = self.description or ""
+        if len(description) > 200:
+            description = description[:200] + "..."
+
+        return {
+            'name': creature_name,
+            'hitpoints': hitpoints if hitpoints is not None else 'Unknown',
+            'experience_points': experience if experience is not None else 'Unknown',
+            'armor': parse_number(self.values.get('armor', '')),
+            'speed': parse_number(self.values.get('speed', '')),
+            'loot': [{'name': item} for item in self.loot],
+            'description': description or f"Information about {creature_name}",
+            'source': 'TibiaWiki'
+        }
+
+
+class StreamingInfoboxReader:
+    """
+    Feed raw byte chunks (any split, any encoding boundary) into an InfoboxParser
+
+    Everything before the infobox (head, inline scripts/styles, navigation) is
+    skipped with a plain byte search instead of being tokenized, which is where
+    most of a fandom page's bytes are. Pages without an infobox yield no result.
+    """
+
+    INFOBOX_START = re.compile(rb'<aside[^>]*portable-infobox')
+    SCRIPT_START = re.compile(rb'<script\b', re.IGNORECASE)
+    SCRIPT_END = re.compile(rb'</script', re.IGNORECASE)
+
+    def __init__(self, encoding: str = 'utf-8'):
+        self.parser = InfoboxParser()
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        self._pending = b''
+        self._seeking = True
+        # Inline scripts may mention the infobox markup in strings, so they're skipped whole
+        self._in_script = False
+        self.bytes_read = 0
+
+    @property
+    def done(self) -> bool:
+        return self.parser.done
+
+    def _skip_to_infobox(self, chunk: bytes) -> bytes:
+        """Return the part of the stream from the infobox's <aside on, or b'' while still seeking"""
+        data = self._pending + chunk
+        position = 0
+        while True:
+            if self._in_script:
+                end = self.SCRIPT_END.search(data, position)
+                if end is None:
+                    break
+                self._in_script = False
+                position = end.end()
+
+            match = self.INFOBOX_START.search(data, position)
+            script = self.SCRIPT_START.search(data, position)
+            if script is not None and (match is None or script.start() < match.start()):
+                self._in_script = True
+                position = script.end()
+                continue
+
+            if match is None:
+                break
+            self._seeking = False
+            self._pending = b''
+            return data[match.start():]
+
+        # Keep just enough of the tail to catch a tag split across chunks
+        self._pending = data[max(position, len(data) - 512):]
+        return b''
+
+    def feed(self, chunk: bytes) -> bool:
+        """Feed a chunk; returns True once no more input is needed"""
+        self.bytes_read += len(chunk)
+        if self._seeking:
+            chunk = self._skip_to_infobox(chunk)
+            if not chunk:
+                return False
+        self.parser.feed(self._decoder.decode(chunk))
+        return self.parser.done
+
+    def close(self) -> None:
+        """Flush any buffered input"""
+        self.parser.feed(self._decoder.decode(b'', final=True))
+        self.parser.close()
+
+
+def parse_infobox_html(html: str, creature_name: str) -> Optional[Dict[str, Any]]:
+    """Parse an already downloaded page (stops scanning once everything is found)"""
+    reader = StreamingInfoboxReader()
+    raw = html.encode('utf-8')
+    step = 16384
+    for start in range(0, len(raw), step):
+        if reader.feed(raw[start:start + step]):
+            break
+    return reader.parser.result(creature_name)
+
+
+# Wikitext (action=raw / MediaWiki API) parsing
+
+_WIKI_LINK = re.compile(r'\[\[(?:[^\]|]*\|)?([^\]]*)\]\]')
+_WIKI_TEMPLATE = re.compile(r'\{\{[^{}]*\}\}')
+_WIKI_REF = re.compile(r'<ref[^>]*?(?:/>|>.*?</ref>)', re.DOTALL)
+_HTML_TAG = re.compile(r'<[^>]+>')
+_LOOT_ITEM = re.compile(r'\{\{\s*Loot Item\s*\|([^{}]*)\}\}', re.IGNORECASE)
+_LOOT_AMOUNT = re.compile(r'^\d+(?:-\d+)?$')
+_LOOT_RARITIES = {'always', 'common', 'uncommon', 'semi-rare', 'rare', 'very rare'}
+
+
+def _split_template(wikitext: str, start: int) -> Optional[List[str]]:
+    """Split the template starting at `start` ("{{...}}") into its top-level parts"""
+    parts: List[str] = []
+    current: List[str] = []
+    depth = 0
+    i = start
+    length = len(wikitext)
+
+    while i < length:
+        pair = wikitext[i:i + 2]
+        if pair in ('{{', '[['):
+            depth += 1
+            if depth > 1:
+                current.append(pair)
+            i += 2
+            continue
+        if pair in ('}}', ']]'):
+            depth -= 1
+            if depth == 0:
+                parts.append("".join(current))
+                return parts
+            current.append(pair)
+            i += 2
+            continue
+        char = wikitext[i]
+        if char == '|' and depth == 1:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+        i += 1
+
+    return None
+
+
+def strip_wiki_markup(text: str) -> str:
+    """Reduce a wikitext value to plain text"""
+    text = _WIKI_REF.sub('', text)
+    text = _WIKI_LINK.sub(r'\1', text)
+    # Strip templates from the inside out
+    previous = None
+    while previous != text:
+        previous = text
+        text = _WIKI_TEMPLATE.sub('', text)
+    text = _HTML_TAG.sub('', text).replace("'''", '').replace("''", '')
+    return " ".join(text.split())
+
+
+def parse_infobox_params(wikitext: str, template: str = 'Infobox Creature') -> Dict[str, str]:
+    """
+    Extract the named parameters of an infobox template from wikitext
+
+    Args:
+        wikitext: Raw page wikitext
+        template: Template name to look for
+
+    Returns:
+        Dict of lower-cased parameter name to raw value (empty if not found)
+    """
+    match = re.search(r'\{\{\s*' + re.escape(template).replace(r'\ ', r'[ _]'), wikitext, re.IGNORECASE)
+    if not match:
+        return {}
+
+    parts = _split_template(wikitext, match.start())
+    if not parts:
+        return {}
+
+    params = {}
+    for part in parts[1:]:
+        if '=' in part:
+            key, value = part.split('=', 1)
+            params[key.strip().lower()] = value.strip()
+    return params
+
+
+def parse_loot_items(wikitext: str) -> List[str]:
+    """Item names from {{Loot Item|amount|Name|rarity}} templates, in page order"""
+    items = []
+    for match in _LOOT_ITEM.finditer(wikitext):
+        for arg in match.group(1).split('|'):
+            arg = arg.strip()
+            if not arg or '=' in arg or _LOOT_AMOUNT.match(arg) or arg.lower() in _LOOT_RARITIES:
+                continue
+            items.append(arg)
+            break
+    return items
+
+
+def parse_infobox_wikitext(wikitext: str, creature_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Structured creature info from a page's raw wikitext
+
+    Args:
+        wikitext: Raw page wikitext
+        creature_name: Name of the creature
+
+    Returns:
+        Creature info dict (same shape as the HTML parser's), or None without an infobox
+    """
+    params = parse_infobox_params(wikitext)
+    if not params:
+        return None
+
+    hitpoints = parse_number(params.get('hp', ''))
+    experience = parse_number(params.get('exp', ''))
+    description = strip_wiki_markup(params.get('notes', '') or params.get('behaviour', ''))
+    if len(description) > 200:
+        description = description[:200] + "..."
+
+    return {
+        'name': strip_wiki_markup(params.get('name', '')) or creature_name,
+        'hitpoints': hitpoints if hitpoints is not None else 'Unknown',
+        'experience_points': experience if experience is not None else 'Unknown',
+        'armor': parse_number(params.get('armor', '')),
+        'speed': parse_number(params.get('speed', '')),
+        'loot': [{'name': item} for item in parse_loot_items(wikitext)],
+        'description': description or f"Information about {creature_name}",
+        'source': 'TibiaWiki'
+    }
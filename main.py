@@ -1,31 +1,45 @@
 import asyncio
 import logging
 import os
-from datetime import datetime
-from typing import Optional
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, List, Optional, TypeVar
 
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 
 from bot.tibia_api import TibiaAPI
+from bot.catalog import normalize_name
+from bot.hedging import TIBIA_COM_NEWS_URL
+from bot.http_pool import PoolSettings
+from bot.details_store import CreatureDetailsStore
 from bot.embed_builder import EmbedBuilder
+from bot.forecast import HORIZONS as FORECAST_HORIZONS, RotationForecaster
+from bot.history import BoostedHistory
+from bot.watchlist import WatchlistStore, mention_batches
 from bot.scheduler import TibiaScheduler
+from bot.poller import ChangeDetectionPoller
+from bot.state_store import BotStateStore
+from bot.subscriptions import SubscriptionStore
+from bot.fanout import FanoutDispatcher
+from bot.offload import LoopLagMonitor, Offloader
+from bot.json_codec import set_backend as set_json_backend
+from bot.logging_setup import setup_logging
+from bot.metrics import (
+    BOOSTED_CHECK_SECONDS, BOOSTED_CHECKS, DISCORD_SENDS, POST_DELAY_SECONDS, POST_SECONDS, POSTS, REGISTRY,
+    WATCH_NOTIFICATIONS, MetricsServer, register_stats_gauges
+)
+from bot.server_save import last_server_save, next_server_save, parse_api_timestamp
+from bot.models import BoostedSnapshot
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('bot.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 class TibiaBot(commands.Bot):
     def __init__(self):
         # Configure bot intents
@@ -39,20 +53,139 @@ class TibiaBot(commands.Bot):
         )
         
         # Initialize components
-        self.tibia_api = TibiaAPI()
+        set_json_backend(os.getenv('JSON_DECODER', 'auto'))
+        # Durable stores default to one directory; on Railway mount a volume there, or
+        # every redeploy starts from an empty filesystem and re-posts both embeds
+        data_dir = os.getenv('DATA_DIR', '.')
+        os.makedirs(data_dir, exist_ok=True)
+        details_store_path = os.getenv('DETAILS_STORE_PATH', os.path.join(data_dir, 'creature_details.db'))
+        self.tibia_api = TibiaAPI(
+            boosted_deadline=float(os.getenv('BOOSTED_DEADLINE', str(TibiaAPI.BOOSTED_DEADLINE))),
+            cache_size=int(os.getenv('API_CACHE_SIZE', '256')),
+            stale_window=float(os.getenv('API_CACHE_STALE_SECONDS', '600')),
+            details_store=CreatureDetailsStore(details_store_path) if details_store_path else None,
+            sources=os.getenv('CREATURE_SOURCES', 'tibiadata,wiki-raw,wiki-html').split(','),
+            wiki_base_url=os.getenv('WIKI_BASE_URL') or None,
+            offloader=Offloader(
+                mode=os.getenv('OFFLOAD_MODE', 'thread'),
+                max_workers=int(os.getenv('OFFLOAD_WORKERS', '0')) or None,
+                threshold=int(os.getenv('OFFLOAD_THRESHOLD_BYTES', str(256 * 1024)))
+            ),
+            host_rate=float(os.getenv('API_RATE_PER_SECOND', '5')),
+            host_burst=float(os.getenv('API_RATE_BURST', '10')),
+            breaker_threshold=int(os.getenv('API_BREAKER_FAILURES', '5')),
+            breaker_reset=float(os.getenv('API_BREAKER_RESET_SECONDS', '30')),
+            mirror_urls=[url.strip() for url in os.getenv('TIBIADATA_MIRRORS', '').split(',') if url.strip()],
+            community_url=os.getenv('TIBIA_COM_URL', TIBIA_COM_NEWS_URL) or None,
+            hedge_delay=float(os.getenv('HEDGE_DELAY_SECONDS', '2')),
+            pool_settings=PoolSettings(
+                limit=int(os.getenv('HTTP_POOL_LIMIT', '10')),
+                limit_per_host=int(os.getenv('HTTP_POOL_LIMIT_PER_HOST', '5')),
+                keepalive_timeout=float(os.getenv('HTTP_KEEPALIVE_SECONDS', '300')),
+                ttl_dns_cache=int(os.getenv('HTTP_DNS_TTL_SECONDS', '600'))
+            )
+        )
         self.embed_builder = EmbedBuilder()
-        self.scheduler = TibiaScheduler(self)
+        self.scheduler = TibiaScheduler(
+            self,
+            mode=os.getenv('SCHEDULER_MODE', 'poll'),
+            poller=ChangeDetectionPoller(
+                self.tibia_api,
+                initial_interval=float(os.getenv('POLL_INITIAL_INTERVAL', '15')),
+                max_interval=float(os.getenv('POLL_MAX_INTERVAL', '120')),
+                window=float(os.getenv('POLL_WINDOW', str(40 * 60)))
+            ),
+            warmup_lead=float(os.getenv('WARMUP_LEAD_SECONDS', '120'))
+        )
         
         # Configuration from environment
         self.creature_channel_id = int(os.getenv('CREATURE_CHANNEL_ID', '0'))
         self.boss_channel_id = int(os.getenv('BOSS_CHANNEL_ID', '0'))
         
-        # Track last posted creatures/bosses to avoid duplicates
-        self.last_posted_creature = None
-        self.last_posted_boss = None
+        # Per-guild channel subscriptions, posted to concurrently with bounded fan-out
+        self.subscriptions = SubscriptionStore(os.getenv('SUBSCRIPTIONS_PATH', os.path.join(data_dir, 'subscriptions.json')))
+        self.fanout = FanoutDispatcher(
+            concurrency=int(os.getenv('FANOUT_CONCURRENCY', '50')),
+            rate_per_second=float(os.getenv('FANOUT_RATE_PER_SECOND', '45'))
+        )
+        
+        # Track last posted creatures/bosses to avoid duplicates (persisted across restarts)
+        self.state = BotStateStore(os.getenv('BOT_STATE_PATH', os.path.join(data_dir, 'bot_state.json')))
+        
+        # Every posted rotation, for /history (optionally backfilled from old log files)
+        self.history = BoostedHistory(os.getenv('HISTORY_PATH', os.path.join(data_dir, 'boosted_history.jsonl')))
+        backfill_logs = [pattern.strip() for pattern in os.getenv('HISTORY_BACKFILL_LOGS', '').split(',') if pattern.strip()]
+        if backfill_logs:
+            self.history.backfill_from_logs(backfill_logs)
+        
+        # Boost forecasts, updated incrementally and precomputed after each daily post
+        self.forecaster = RotationForecaster()
+        self.forecaster.rebuild(self.history)
+        
+        # Users pinged (in a channel or by DM) when a creature/boss they watch gets boosted
+        self.watchlist = WatchlistStore(
+            os.getenv('WATCHLIST_PATH', os.path.join(data_dir, 'watchlist.jsonl')),
+            max_per_user=int(os.getenv('WATCHLIST_MAX_PER_USER', '25'))
+        )
+        self._notify_tasks = set()
+        
+        # Slash commands answer with last known data once this many seconds pass after defer;
+        # the fetch itself keeps running in the background so its result still gets cached
+        self.command_deadline = float(os.getenv('COMMAND_DEADLINE_SECONDS', '8'))
+        self._command_fetches = set()
+        
+        # Background creature/boss list download, so autocomplete never waits on the network
+        self._catalog_task: Optional[asyncio.Task] = None
+        
+        self._post_locks = {'creature': asyncio.Lock(), 'boss': asyncio.Lock()}
+        
+        # Reports event loop stalls that would delay gateway heartbeats and interaction acks
+        self.loop_monitor = LoopLagMonitor(threshold=float(os.getenv('LOOP_LAG_THRESHOLD_MS', '100')) / 1000)
+        
+        # Prometheus text endpoint on this event loop (METRICS_PORT=0 disables it)
+        metrics_port = int(os.getenv('METRICS_PORT', '9108'))
+        self.metrics_server = MetricsServer(host=os.getenv('METRICS_HOST', '127.0.0.1'), port=metrics_port) if metrics_port else None
+        self._register_metrics()
         
         logger.info("TibiaBot initialized")
 
+    def _register_metrics(self):
+        """Export the stats the API client, scheduler and loop monitor already keep as gauges"""
+        api = self.tibia_api
+        register_stats_gauges(REGISTRY, 'tibia_cache', api.cache.stats, ('size', 'hits', 'stale_hits', 'misses', 'evictions', 'hit_rate'), "Response cache")
+        register_stats_gauges(REGISTRY, 'tibia_single_flight', api.single_flight.stats, ('calls', 'deduplicated', 'in_flight'), "Coalesced API loads")
+        register_stats_gauges(REGISTRY, 'tibia_host', api.host_stats, ('consecutive_failures', 'opened', 'rejected', 'acquired', 'throttled'), "Per-host guard", label='host')
+        REGISTRY.gauge(
+            'tibia_host_circuit_open', "Whether a host's circuit breaker is not closed",
+            lambda: [({'host': host}, stats['state'] != 'closed') for host, stats in api.host_stats().items()]
+        )
+        register_stats_gauges(REGISTRY, 'tibia_pool', api.pool_stats, ('created', 'reused', 'reuse_rate', 'dns_hits', 'dns_misses', 'open', 'idle', 'in_use'), "HTTP connection pool")
+        register_stats_gauges(REGISTRY, 'tibia_hedge', api.hedger.stats, ('requests', 'hedges', 'hedge_delay'), "Boosted data hedging")
+        register_stats_gauges(
+            REGISTRY, 'tibia_origin', lambda: api.hedger.stats()['origins'], ('count', 'failures', 'wins', 'mean', 'p50', 'p95'), "Boosted data origin", label='origin'
+        )
+        register_stats_gauges(REGISTRY, 'tibia_offload', api.offloader.stats, ('inline', 'offloaded'), "Decode/parse offloading")
+        register_stats_gauges(REGISTRY, 'event_loop', self.loop_monitor.stats, ('samples', 'stalls', 'max_lag', 'last_lag'), "Event loop lag monitor")
+        register_stats_gauges(
+            REGISTRY, 'poller', self.scheduler.poller.stats, ('runs', 'missed', 'avg_requests', 'detection_p50', 'detection_max'), "Change-detection poller"
+        )
+
+    @property
+    def last_posted_creature(self) -> Optional[str]:
+        return self.state.get_name('creature')
+
+    @last_posted_creature.setter
+    def last_posted_creature(self, name: Optional[str]):
+        self.state.set_name('creature', name)
+
+    @property
+    def last_posted_boss(self) -> Optional[str]:
+        return self.state.get_name('boss')
+
+    @last_posted_boss.setter
+    def last_posted_boss(self, name: Optional[str]):
+        self.state.set_name('boss', name)
+
     async def setup_hook(self):
         """Called when the bot is starting up"""
         try:
@@ -64,6 +197,14 @@ class TibiaBot(commands.Bot):
             await self.scheduler.start()
             logger.info("Scheduler started successfully")
             
+            self.loop_monitor.start()
+            
+            # Build the name index for /lookup autocomplete before anyone types
+            self.refresh_catalog_soon()
+            
+            if self.metrics_server:
+                await self.metrics_server.start()
+            
         except Exception as e:
             logger.error(f"Error in setup_hook: {e}")
 
@@ -79,6 +220,20 @@ class TibiaBot(commands.Bot):
         )
         await self.change_presence(activity=activity)
 
+    async def close(self):
+        """Shut down the scheduler and API client before disconnecting"""
+        await self.scheduler.stop()
+        await self.loop_monitor.stop()
+        if self.metrics_server:
+            await self.metrics_server.stop()
+        await self.tibia_api.close()
+        await super().close()
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        """Drop subscriptions of guilds the bot was removed from"""
+        self.subscriptions.remove_guild(guild.id)
+        logger.info(f"Removed subscriptions for guild {guild.id}")
+
     async def on_command_error(self, ctx, error):
         """Global error handler"""
         if isinstance(error, commands.CommandNotFound):
@@ -103,85 +258,257 @@ class TibiaBot(commands.Bot):
             'errors': []
         }
         
+        # Both already posted this server-save cycle: nothing can have changed, skip the network
+        if not force_update and self.state.is_current('creature') and self.state.is_current('boss'):
+            logger.info("Boosted creature and boss already posted this cycle, skipping check")
+            BOOSTED_CHECKS.inc(result='skipped')
+            return result
+        
+        started = time.monotonic()
+        
         try:
-            # Fetch current boosted data
-            boosted_data = await self.tibia_api.get_boosted_creatures()
-            
-            if not boosted_data:
-                result['errors'].append("Failed to fetch boosted data")
-                return result
+            # Fetch creature and boss concurrently and post each half as soon as it arrives,
+            # so a slow endpoint doesn't hold back the other channel's post
+            snapshot = BoostedSnapshot()
+            post_tasks = []
             
-            creature_name = boosted_data.get('boosted_creature')
-            boss_name = boosted_data.get('boosted_boss')
+            # Always bypass the cache here: change detection needs the live API state
+            async for kind, name, timestamp in self.tibia_api.iter_boosted_creatures(fresh=True):
+                snapshot = snapshot.with_kind(kind, name, timestamp)
+                
+                if kind == 'creature':
+                    # Check if creature changed or force update
+                    if name and (force_update or name != self.last_posted_creature):
+                        post_tasks.append(asyncio.create_task(self._post_and_track('creature', name, snapshot, result, force_update)))
+                else:
+                    # Check if boss changed or force update
+                    if name and (force_update or name != self.last_posted_boss):
+                        post_tasks.append(asyncio.create_task(self._post_and_track('boss', name, snapshot, result, force_update)))
             
-            # Check if creature changed or force update
-            if creature_name and (force_update or creature_name != self.last_posted_creature):
-                await self._post_creature_update(creature_name, boosted_data)
-                self.last_posted_creature = creature_name
-                result['creature_posted'] = True
-                logger.info(f"Posted boosted creature update: {creature_name}")
+            if snapshot.empty:
+                result['errors'].append("Failed to fetch boosted data")
             
-            # Check if boss changed or force update
-            if boss_name and (force_update or boss_name != self.last_posted_boss):
-                await self._post_boss_update(boss_name, boosted_data)
-                self.last_posted_boss = boss_name
-                result['boss_posted'] = True
-                logger.info(f"Posted boosted boss update: {boss_name}")
+            for outcome in await asyncio.gather(*post_tasks, return_exceptions=True):
+                if isinstance(outcome, Exception):
+                    error_msg = f"Error posting boosted updates: {outcome}"
+                    logger.error(error_msg)
+                    result['errors'].append(error_msg)
                 
         except Exception as e:
             error_msg = f"Error posting boosted updates: {e}"
             logger.error(error_msg)
             result['errors'].append(error_msg)
         
+        BOOSTED_CHECK_SECONDS.observe(time.monotonic() - started)
+        if result['errors']:
+            BOOSTED_CHECKS.inc(result='error')
+        else:
+            BOOSTED_CHECKS.inc(result='posted' if result['creature_posted'] or result['boss_posted'] else 'unchanged')
         return result
 
-    async def _post_creature_update(self, creature_name: str, boosted_data: dict):
-        """Post boosted creature update to configured channel"""
-        if not self.creature_channel_id:
-            logger.warning("Creature channel ID not configured")
-            return
+    async def publish_boosted(self, kind: str, name: str, snapshot: BoostedSnapshot) -> dict:
+        """
+        Post one half of the boosted update as soon as it is detected
         
-        channel = self.get_channel(self.creature_channel_id)
-        if not channel:
-            logger.error(f"Could not find creature channel with ID: {self.creature_channel_id}")
-            return
+        Args:
+            kind: Either 'creature' or 'boss'
+            name: Name of the boosted creature/boss
+            snapshot: Boosted creature/boss snapshot
+            
+        Returns:
+            dict: Status of the update operation
+        """
+        result = {
+            'creature_posted': False,
+            'boss_posted': False,
+            'errors': []
+        }
         
-        # Get detailed creature information
-        creature_details = await self.tibia_api.get_creature_details(creature_name)
+        try:
+            await self._post_and_track(kind, name, snapshot, result)
+        except Exception as e:
+            error_msg = f"Error posting boosted {kind} update: {e}"
+            logger.error(error_msg)
+            result['errors'].append(error_msg)
         
-        # Build embed
-        embed = self.embed_builder.create_creature_embed(creature_name, creature_details, boosted_data)
+        return result
+
+    async def _post_and_track(self, kind: str, name: str, snapshot: BoostedSnapshot, result: dict, force_update: bool = False):
+        """Post one half of the boosted update and record it as posted"""
+        # Serialize per kind so the change poller and the cron checks can't double post
+        async with self._post_locks[kind]:
+            last_posted = self.last_posted_creature if kind == 'creature' else self.last_posted_boss
+            if not force_update and name == last_posted:
+                return
+            
+            with POST_SECONDS.time(kind=kind):
+                if kind == 'creature':
+                    messages = await self._post_creature_update(name, snapshot)
+                else:
+                    messages = await self._post_boss_update(name, snapshot)
+            
+            self.state.record_post(kind, name, snapshot.timestamp, [message.id for message in messages])
+            # Data generated before the rotation (a stale upstream copy) belongs to the previous day
+            api_time = parse_api_timestamp(snapshot.timestamp)
+            save_day = last_server_save(datetime.fromtimestamp(api_time, timezone.utc) if api_time else None).date()
+            if self.history.record(kind, name, save_day, snapshot.timestamp):
+                self.forecaster.update(self.history, kind, save_day)
+                # First post of this rotation: ping watchers in the background, it may take a while
+                task = asyncio.create_task(self.notify_watchers(kind, name))
+                self._notify_tasks.add(task)
+                task.add_done_callback(self._notify_tasks.discard)
+            result[f'{kind}_posted'] = True
+            POSTS.inc(kind=kind)
+            if not force_update:
+                POST_DELAY_SECONDS.observe(time.time() - last_server_save().timestamp(), kind=kind)
+            logger.info(f"Posted boosted {kind} update: {name}")
+
+    async def within_deadline(self, fetch: Awaitable[T], fallback: Callable[[], T], command: str) -> T:
+        """
+        Await a slash command's fetch for at most command_deadline seconds
+        
+        Retries, Retry-After and circuit breaker waits can hold a fetch well past
+        what a user should wait for an answer. The fetch is shielded, so on expiry it
+        keeps running (and fills the cache for the next call) while the command
+        answers from fallback() instead.
         
+        Args:
+            fetch: Awaitable doing the network calls for the command
+            fallback: Builds the answer from data already at hand
+            command: Command name, for logging
+            
+        Returns:
+            The fetch's result, or fallback()'s when the deadline expires
+        """
+        task = asyncio.ensure_future(fetch)
+        self._command_fetches.add(task)
+        task.add_done_callback(self._command_fetches.discard)
         try:
-            await channel.send(embed=embed)
-        except discord.Forbidden:
-            logger.error(f"No permission to send messages in creature channel: {channel.name}")
-        except discord.HTTPException as e:
-            logger.error(f"Failed to send creature embed: {e}")
-
-    async def _post_boss_update(self, boss_name: str, boosted_data: dict):
-        """Post boosted boss update to configured channel"""
-        if not self.boss_channel_id:
-            logger.warning("Boss channel ID not configured")
+            return await asyncio.wait_for(asyncio.shield(task), self.command_deadline)
+        except asyncio.TimeoutError:
+            logger.warning(f"/{command} exceeded its {self.command_deadline}s deadline, answering with last known data")
+            return fallback()
+    
+    def last_known_boosted(self) -> Optional[BoostedSnapshot]:
+        """The boosted creature and boss from the catalog, else the last posted names"""
+        snapshot = self.tibia_api.last_known_boosted()
+        if snapshot is None and (self.state.get_name('creature') or self.state.get_name('boss')):
+            snapshot = BoostedSnapshot(creature=self.state.get_name('creature'), boss=self.state.get_name('boss'))
+        return snapshot
+    
+    def refresh_catalog_soon(self) -> None:
+        """Start refreshing the creature/boss catalog in the background if it's out of date"""
+        if self.tibia_api.catalog.is_current() or (self._catalog_task and not self._catalog_task.done()):
             return
         
-        channel = self.get_channel(self.boss_channel_id)
-        if not channel:
-            logger.error(f"Could not find boss channel with ID: {self.boss_channel_id}")
-            return
+        async def refresh():
+            try:
+                catalog = await self.tibia_api.refresh_catalog()
+                logger.info(f"Creature catalog ready: {len(catalog)} creatures and bosses")
+            except Exception as e:
+                logger.error(f"Error refreshing creature catalog: {e}")
         
-        # Get detailed boss information
-        boss_details = await self.tibia_api.get_creature_details(boss_name)
+        self._catalog_task = asyncio.create_task(refresh())
+
+    async def notify_watchers(self, kind: str, name: str):
+        """
+        Mention or DM everyone watching a newly boosted creature/boss
         
-        # Build embed
-        embed = self.embed_builder.create_boss_embed(boss_name, boss_details, boosted_data)
+        Watchers are looked up through the watchlist's name index, mentions are
+        batched into as few messages per channel as fit, and every send goes
+        through the same rate-limited fan-out as the boosted posts.
         
+        Args:
+            kind: Either 'creature' or 'boss'
+            name: Name of the boosted creature/boss
+        """
         try:
-            await channel.send(embed=embed)
-        except discord.Forbidden:
-            logger.error(f"No permission to send messages in boss channel: {channel.name}")
-        except discord.HTTPException as e:
-            logger.error(f"Failed to send boss embed: {e}")
+            matches = self.watchlist.matches([name])
+            if not matches:
+                return
+            
+            dm_users = matches.pop(None, {})
+            batches = {channel_id: mention_batches(name, kind, users) for channel_id, users in matches.items()}
+            mentions = discord.AllowedMentions(everyone=False, roles=False, users=True)
+            
+            async def send_mentions(channel_id: int) -> discord.Message:
+                channel = self.get_partial_messageable(channel_id)
+                message = None
+                for content in batches[channel_id]:
+                    message = await channel.send(content, allowed_mentions=mentions)
+                return message
+            
+            async def send_dm(user_id: int) -> discord.Message:
+                user = self.get_user(user_id) or await self.fetch_user(user_id)
+                return await user.send(f"🔔 **{name}** is today's boosted {kind}! (You asked to be notified with /watch)")
+            
+            channel_result = await self.fanout.send(batches, send_mentions)
+            for channel_id in channel_result.gone:
+                self.watchlist.remove_channel(channel_id)
+            
+            dm_result = await self.fanout.send(dm_users, send_dm)
+            for user_id in dm_result.gone:
+                self.watchlist.remove(user_id, name)
+            
+            for delivery, result in (('channel', channel_result), ('dm', dm_result)):
+                WATCH_NOTIFICATIONS.inc(result.sent, delivery=delivery, result='sent')
+                WATCH_NOTIFICATIONS.inc(len(result.failed), delivery=delivery, result='failed')
+                WATCH_NOTIFICATIONS.inc(len(result.gone), delivery=delivery, result='gone')
+            
+            watchers = sum(len(users) for users in matches.values()) + len(dm_users)
+            logger.info(f"Notified {watchers} watchers of boosted {kind} {name}")
+            
+        except Exception as e:
+            logger.error(f"Error notifying watchers of {name}: {e}")
+
+    def _channels_for(self, kind: str) -> List[int]:
+        """Channel IDs to post a kind of update in: the configured channel plus guild subscriptions"""
+        configured = self.creature_channel_id if kind == 'creature' else self.boss_channel_id
+        return ([configured] if configured else []) + self.subscriptions.channels_for(kind)
+
+    async def _fan_out(self, kind: str, channel_ids: List[int], embed: discord.Embed) -> List[discord.Message]:
+        """Send one embed to many channels concurrently, pruning channels that no longer exist"""
+        result = await self.fanout.send(
+            channel_ids,
+            lambda channel_id: self.get_partial_messageable(channel_id).send(embed=embed)
+        )
+        
+        DISCORD_SENDS.inc(len(result.messages), kind=kind, result='sent')
+        DISCORD_SENDS.inc(len(result.failed), kind=kind, result='failed')
+        DISCORD_SENDS.inc(len(result.gone), kind=kind, result='gone')
+        
+        for channel_id in result.gone:
+            self.subscriptions.remove_channel(channel_id)
+        for channel_id, error in result.failed.items():
+            logger.error(f"Failed to send {kind} embed to channel {channel_id}: {error}")
+        
+        return list(result.messages.values())
+
+    async def _post_creature_update(self, creature_name: str, snapshot: BoostedSnapshot) -> List[discord.Message]:
+        """Post boosted creature update to all creature channels, returning the sent messages"""
+        channel_ids = self._channels_for('creature')
+        if not channel_ids:
+            logger.warning("Creature channel ID not configured")
+            return []
+        
+        # Fetch details and build the embed once for every channel
+        creature_details = await self.tibia_api.get_creature_details(creature_name)
+        embed = self.embed_builder.get_creature_embed(creature_name, creature_details, snapshot)
+        
+        return await self._fan_out('creature', channel_ids, embed)
+
+    async def _post_boss_update(self, boss_name: str, snapshot: BoostedSnapshot) -> List[discord.Message]:
+        """Post boosted boss update to all boss channels, returning the sent messages"""
+        channel_ids = self._channels_for('boss')
+        if not channel_ids:
+            logger.warning("Boss channel ID not configured")
+            return []
+        
+        # Fetch details and build the embed once for every channel
+        boss_details = await self.tibia_api.get_creature_details(boss_name)
+        embed = self.embed_builder.get_boss_embed(boss_name, boss_details, snapshot)
+        
+        return await self._fan_out('boss', channel_ids, embed)
 
 # Slash command definitions
 @discord.app_commands.command(name="update", description="Force update boosted creature and boss posts")
@@ -216,6 +543,14 @@ async def update_command(interaction: discord.Interaction):
         logger.error(f"Error in update command: {e}")
         await interaction.followup.send(f"❌ Command failed: {str(e)}", ephemeral=True)
 
+def _note_if_degraded(bot: TibiaBot, embed: discord.Embed) -> None:
+    """Mark an embed as possibly outdated while TibiaData's circuit breaker is not closed"""
+    if bot.tibia_api.is_degraded():
+        embed.set_footer(
+            text=f"{embed.footer.text} | ⚠️ TibiaData unreachable, showing last known data",
+            icon_url=embed.footer.icon_url
+        )
+
 @discord.app_commands.command(name="creature", description="Check current boosted creature details")
 async def creature_status_command(interaction: discord.Interaction):
     """Slash command to check current boosted creature status"""
@@ -223,25 +558,35 @@ async def creature_status_command(interaction: discord.Interaction):
     
     try:
         bot = interaction.client
-        boosted_data = await bot.tibia_api.get_boosted_creatures()
         
-        if not boosted_data:
+        async def fetch():
+            snapshot = await bot.tibia_api.get_boosted_creatures()
+            name = snapshot.creature if snapshot else None
+            return snapshot, await bot.tibia_api.get_creature_details(name) if name else None
+        
+        def last_known():
+            snapshot = bot.last_known_boosted()
+            name = snapshot.creature if snapshot else None
+            return snapshot, bot.tibia_api.last_known_creature_details(name) if name else None
+        
+        snapshot, creature_details = await bot.within_deadline(fetch(), last_known, 'creature')
+        
+        if not snapshot:
             await interaction.followup.send("❌ Failed to fetch boosted data", ephemeral=True)
             return
         
-        creature_name = boosted_data.get('boosted_creature', 'Unknown')
+        creature_name = snapshot.creature
         
-        if creature_name == 'Unknown':
+        if not creature_name:
             await interaction.followup.send("❌ No boosted creature found", ephemeral=True)
             return
-            
-        # Get detailed creature information
-        creature_details = await bot.tibia_api.get_creature_details(creature_name)
         
         # Build embed
-        embed = bot.embed_builder.create_creature_embed(creature_name, creature_details, boosted_data)
-        embed.title = f"📊 Current Boosted Creature Status"
+        embed = bot.embed_builder.get_creature_embed(
+            creature_name, creature_details, snapshot, title="📊 Current Boosted Creature Status"
+        )
         
+        _note_if_degraded(bot, embed)
         await interaction.followup.send(embed=embed, ephemeral=True)
         
     except Exception as e:
@@ -255,53 +600,293 @@ async def boss_status_command(interaction: discord.Interaction):
     
     try:
         bot = interaction.client
-        boosted_data = await bot.tibia_api.get_boosted_creatures()
         
-        if not boosted_data:
+        async def fetch():
+            snapshot = await bot.tibia_api.get_boosted_creatures()
+            name = snapshot.boss if snapshot else None
+            return snapshot, await bot.tibia_api.get_creature_details(name) if name else None
+        
+        def last_known():
+            snapshot = bot.last_known_boosted()
+            name = snapshot.boss if snapshot else None
+            return snapshot, bot.tibia_api.last_known_creature_details(name) if name else None
+        
+        snapshot, boss_details = await bot.within_deadline(fetch(), last_known, 'boss')
+        
+        if not snapshot:
             await interaction.followup.send("❌ Failed to fetch boosted data", ephemeral=True)
             return
         
-        boss_name = boosted_data.get('boosted_boss', 'Unknown')
+        boss_name = snapshot.boss
         
-        if boss_name == 'Unknown':
+        if not boss_name:
             await interaction.followup.send("❌ No boosted boss found", ephemeral=True)
             return
-            
-        # Get detailed boss information
-        boss_details = await bot.tibia_api.get_creature_details(boss_name)
         
         # Build embed
-        embed = bot.embed_builder.create_boss_embed(boss_name, boss_details, boosted_data)
-        embed.title = f"📊 Current Boosted Boss Status"
+        embed = bot.embed_builder.get_boss_embed(
+            boss_name, boss_details, snapshot, title="📊 Current Boosted Boss Status"
+        )
         
+        _note_if_degraded(bot, embed)
         await interaction.followup.send(embed=embed, ephemeral=True)
         
     except Exception as e:
         logger.error(f"Error in boss status command: {e}")
         await interaction.followup.send(f"❌ Command failed: {str(e)}", ephemeral=True)
 
+async def creature_name_autocomplete(interaction: discord.Interaction, current: str) -> List[discord.app_commands.Choice[str]]:
+    """Suggest creature/boss names from the in-memory catalog index, without a network call per keystroke"""
+    bot = interaction.client
+    bot.refresh_catalog_soon()
+    # A boss can share its name with a creature; offer the name once
+    names = dict.fromkeys(entry.name[:100] for entry in bot.tibia_api.catalog.search(current, 25))
+    return [discord.app_commands.Choice(name=name, value=name) for name in names]
+
+@discord.app_commands.command(name="lookup", description="Show details of any creature or boss")
+@discord.app_commands.describe(name="Creature or boss name")
+@discord.app_commands.autocomplete(name=creature_name_autocomplete)
+async def lookup_command(interaction: discord.Interaction, name: str):
+    """Slash command to look up a creature/boss by (partial or misspelled) name"""
+    await interaction.response.defer(ephemeral=True)
+    
+    try:
+        bot = interaction.client
+        
+        catalog = bot.tibia_api.catalog
+        
+        # Resolve typos against the catalog first, so they never reach the detail sources
+        def closest(exact):
+            if exact is not None:
+                return exact
+            matches = catalog.search(name, 1)
+            return matches[0] if matches else None
+        
+        async def fetch():
+            entry = closest(await bot.tibia_api.lookup_creature(name))
+            return entry, await bot.tibia_api.get_creature_details(entry.name) if entry else None
+        
+        def last_known():
+            entry = closest(catalog.lookup(name))
+            return entry, bot.tibia_api.last_known_creature_details(entry.name) if entry else None
+        
+        entry, details = await bot.within_deadline(fetch(), last_known, 'lookup')
+        
+        if entry is None:
+            embed = bot.embed_builder.create_error_embed("Unknown Creature", f"No creature or boss matches **{name}**")
+            await interaction.followup.send(embed=embed, ephemeral=True)
+            return
+        
+        note = None
+        if catalog.lookup(name) is None:
+            note = f"🔎 No exact match for **{name}**, showing **{entry.name}**"
+        
+        kind = 'boss' if entry.is_boss else 'creature'
+        boosted = catalog.boosted_boss if entry.is_boss else catalog.boosted_creature
+        
+        embed = bot.embed_builder.create_lookup_embed(
+            entry.name, details, entry.is_boss,
+            boosted_today=bool(boosted) and normalize_name(boosted) == normalize_name(entry.name),
+            last_boosted=bot.history.last_boosted(entry.name, kind)
+        )
+        
+        _note_if_degraded(bot, embed)
+        await interaction.followup.send(content=note, embed=embed, ephemeral=True)
+        
+    except Exception as e:
+        logger.error(f"Error in lookup command: {e}")
+        await interaction.followup.send(f"❌ Command failed: {str(e)}", ephemeral=True)
+
+@discord.app_commands.command(name="history", description="When and how often a creature or boss was boosted")
+@discord.app_commands.describe(name="Creature or boss name")
+@discord.app_commands.autocomplete(name=creature_name_autocomplete)
+async def history_command(interaction: discord.Interaction, name: str):
+    """Slash command to show a creature/boss's boosted history"""
+    try:
+        bot = interaction.client
+        stats = bot.history.stats(name)
+        
+        if stats is None:
+            embed = bot.embed_builder.create_info_embed(
+                "No History",
+                f"**{name}** hasn't been boosted since the history started ({len(bot.history)} days recorded)"
+            )
+        else:
+            embed = bot.embed_builder.create_history_embed(stats)
+        
+        # Answered from the in-memory index, no need to defer
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        
+    except Exception as e:
+        logger.error(f"Error in history command: {e}")
+        await interaction.response.send_message(f"❌ Command failed: {str(e)}", ephemeral=True)
+
+@discord.app_commands.command(name="forecast", description="Which creatures or bosses are most likely to be boosted soon")
+@discord.app_commands.describe(kind="Creatures or bosses", days="How many days ahead", name="Forecast for one creature/boss instead")
+@discord.app_commands.choices(
+    kind=[
+        discord.app_commands.Choice(name="Boosted creature", value="creature"),
+        discord.app_commands.Choice(name="Boosted boss", value="boss")
+    ],
+    days=[discord.app_commands.Choice(name=f"{horizon} day{'s' if horizon != 1 else ''}", value=horizon) for horizon in FORECAST_HORIZONS]
+)
+async def forecast_command(
+    interaction: discord.Interaction,
+    kind: Optional[discord.app_commands.Choice[str]] = None,
+    days: Optional[discord.app_commands.Choice[int]] = None,
+    name: Optional[str] = None
+):
+    """Slash command to show precomputed boost forecasts"""
+    try:
+        bot = interaction.client
+        horizon = days.value if days else 7
+        
+        if name:
+            found = bot.forecaster.lookup(name, horizon)
+            if found is None:
+                embed = bot.embed_builder.create_info_embed("No Forecast", f"**{name}** hasn't been boosted since the history started")
+            else:
+                found_kind, forecast = found
+                embed = bot.embed_builder.create_forecast_embed(found_kind, horizon, [forecast], bot.forecaster.days_observed(found_kind))
+        else:
+            selected = kind.value if kind else 'creature'
+            embed = bot.embed_builder.create_forecast_embed(
+                selected, horizon, bot.forecaster.top(selected, horizon), bot.forecaster.days_observed(selected)
+            )
+        
+        # Served from the tables precomputed after the daily post
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        
+    except Exception as e:
+        logger.error(f"Error in forecast command: {e}")
+        await interaction.response.send_message(f"❌ Command failed: {str(e)}", ephemeral=True)
+
+@discord.app_commands.command(name="watch", description="Get pinged when a creature or boss becomes boosted")
+@discord.app_commands.describe(name="Creature or boss name", dm="Notify by direct message instead of mentioning you in this channel")
+@discord.app_commands.autocomplete(name=creature_name_autocomplete)
+async def watch_command(interaction: discord.Interaction, name: str, dm: bool = False):
+    """Slash command to add a creature/boss to the user's watchlist"""
+    await interaction.response.defer(ephemeral=True)
+    
+    try:
+        bot = interaction.client
+        
+        # Use the catalog's spelling when the name is known
+        entry = await bot.within_deadline(
+            bot.tibia_api.lookup_creature(name), lambda: bot.tibia_api.catalog.lookup(name), 'watch'
+        )
+        watched = entry.name if entry else name
+        target = None if dm or interaction.guild_id is None else interaction.channel_id
+        
+        try:
+            added = bot.watchlist.add(interaction.user.id, watched, target)
+        except ValueError as e:
+            await interaction.followup.send(f"❌ {e}", ephemeral=True)
+            return
+        
+        where = "by direct message" if target is None else f"in <#{target}>"
+        if not added:
+            message = f"👀 You're already watching **{watched}** {where}"
+        else:
+            message = f"✅ You'll be notified {where} when **{watched}** is boosted"
+            if entry is None:
+                message += "\n⚠️ This name isn't in the creature/boss list, check the spelling"
+            logger.info(f"User {interaction.user.id} is watching {watched}")
+        await interaction.followup.send(message, ephemeral=True)
+        
+    except Exception as e:
+        logger.error(f"Error in watch command: {e}")
+        await interaction.followup.send(f"❌ Command failed: {str(e)}", ephemeral=True)
+
+@discord.app_commands.command(name="unwatch", description="Stop getting pinged for a creature or boss")
+@discord.app_commands.describe(name="Creature or boss name")
+async def unwatch_command(interaction: discord.Interaction, name: str):
+    """Slash command to remove a creature/boss from the user's watchlist"""
+    try:
+        bot = interaction.client
+        removed = bot.watchlist.remove(interaction.user.id, name)
+        
+        if removed:
+            await interaction.response.send_message(f"✅ No longer watching **{name}**", ephemeral=True)
+        else:
+            await interaction.response.send_message(f"ℹ️ You weren't watching **{name}**", ephemeral=True)
+        
+    except Exception as e:
+        logger.error(f"Error in unwatch command: {e}")
+        await interaction.response.send_message(f"❌ Command failed: {str(e)}", ephemeral=True)
+
+@discord.app_commands.command(name="watchlist", description="Show the creatures and bosses you're watching")
+async def watchlist_command(interaction: discord.Interaction):
+    """Slash command to list the user's watchlist"""
+    try:
+        bot = interaction.client
+        watches = bot.watchlist.watches_of(interaction.user.id)
+        
+        if not watches:
+            description = "You aren't watching anything yet. Use /watch to get pinged when a creature or boss is boosted."
+        else:
+            description = "\n".join(
+                f"• **{name}** — {'direct message' if target is None else f'<#{target}>'}" for name, target in watches
+            )
+        
+        embed = bot.embed_builder.create_info_embed("Your Watchlist", description)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        
+    except Exception as e:
+        logger.error(f"Error in watchlist command: {e}")
+        await interaction.response.send_message(f"❌ Command failed: {str(e)}", ephemeral=True)
+
+@discord.app_commands.command(name="subscribe", description="Post boosted creature/boss updates in a channel of this server")
+@discord.app_commands.describe(kind="Which updates to post", channel="Channel to post them in")
+@discord.app_commands.choices(kind=[
+    discord.app_commands.Choice(name="Boosted creature", value="creature"),
+    discord.app_commands.Choice(name="Boosted boss", value="boss")
+])
+@discord.app_commands.default_permissions(manage_guild=True)
+@discord.app_commands.guild_only()
+async def subscribe_command(interaction: discord.Interaction, kind: discord.app_commands.Choice[str], channel: discord.TextChannel):
+    """Slash command to subscribe a channel to boosted updates"""
+    try:
+        bot = interaction.client
+        bot.subscriptions.set_channel(interaction.guild_id, kind.value, channel.id)
+        logger.info(f"Guild {interaction.guild_id} subscribed channel {channel.id} to {kind.value} updates")
+        await interaction.response.send_message(f"✅ {kind.name} updates will be posted in {channel.mention}", ephemeral=True)
+        
+    except Exception as e:
+        logger.error(f"Error in subscribe command: {e}")
+        await interaction.response.send_message(f"❌ Command failed: {str(e)}", ephemeral=True)
+
+@discord.app_commands.command(name="unsubscribe", description="Stop posting boosted creature/boss updates in this server")
+@discord.app_commands.describe(kind="Which updates to stop")
+@discord.app_commands.choices(kind=[
+    discord.app_commands.Choice(name="Boosted creature", value="creature"),
+    discord.app_commands.Choice(name="Boosted boss", value="boss")
+])
+@discord.app_commands.default_permissions(manage_guild=True)
+@discord.app_commands.guild_only()
+async def unsubscribe_command(interaction: discord.Interaction, kind: discord.app_commands.Choice[str]):
+    """Slash command to unsubscribe this server from boosted updates"""
+    try:
+        bot = interaction.client
+        bot.subscriptions.set_channel(interaction.guild_id, kind.value, None)
+        logger.info(f"Guild {interaction.guild_id} unsubscribed from {kind.value} updates")
+        await interaction.response.send_message(f"✅ {kind.name} updates will no longer be posted here", ephemeral=True)
+        
+    except Exception as e:
+        logger.error(f"Error in unsubscribe command: {e}")
+        await interaction.response.send_message(f"❌ Command failed: {str(e)}", ephemeral=True)
+
 @discord.app_commands.command(name="next", description="Show when the next server save occurs")
 async def next_save_command(interaction: discord.Interaction):
     """Slash command to show next server save time"""
     await interaction.response.defer()
     
     try:
-        from datetime import datetime, timedelta
-        import pytz
-        
-        # Central European timezone
-        cet = pytz.timezone('Europe/Berlin')
-        now = datetime.now(cet)
-        
-        # Next server save is at 10:00 CEST daily
-        next_save = now.replace(hour=10, minute=0, second=0, microsecond=0)
-        
-        # If it's already past 10:00 today, move to tomorrow
-        if now.hour >= 10:
-            next_save += timedelta(days=1)
+        # Next server save (10:00 CET/CEST, DST-aware)
+        next_save = next_server_save()
         
         # Calculate time until next save
-        time_until = next_save - now
+        time_until = next_save - datetime.now(next_save.tzinfo)
         hours = int(time_until.total_seconds() // 3600)
         minutes = int((time_until.total_seconds() % 3600) // 60)
         
@@ -345,17 +930,32 @@ async def schedule_command(interaction: discord.Interaction):
             timestamp=datetime.utcnow()
         )
         
-        embed.add_field(
-            name="🕰️ Primary Check",
-            value="**10:06 CEST** daily\n(4 minutes after server boot)",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="🔄 Backup Check", 
-            value="**10:36 CEST** daily\n(In case primary fails)",
-            inline=True
-        )
+        if bot.scheduler.mode == 'poll':
+            embed.add_field(
+                name="⚡ Change Detection",
+                value="Polls from **10:00 CEST** daily\nand posts as soon as the rotation is live",
+                inline=True
+            )
+            
+            poller_stats = bot.scheduler.poller.stats()
+            if poller_stats['detection_p50'] is not None:
+                embed.add_field(
+                    name="⏱️ Typical Detection",
+                    value=f"{poller_stats['detection_p50'] / 60:.1f} min after server save",
+                    inline=True
+                )
+        else:
+            embed.add_field(
+                name="🕰️ Primary Check",
+                value="**10:06 CEST** daily\n(4 minutes after server boot)",
+                inline=True
+            )
+            
+            embed.add_field(
+                name="🔄 Backup Check", 
+                value="**10:36 CEST** daily\n(In case primary fails)",
+                inline=True
+            )
         
         embed.add_field(
             name="🎯 Smart Detection",
@@ -363,6 +963,22 @@ async def schedule_command(interaction: discord.Interaction):
             inline=False
         )
         
+        loop_stats = bot.loop_monitor.stats()
+        if loop_stats['stalls']:
+            embed.add_field(
+                name="🩺 Event Loop",
+                value=f"{loop_stats['stalls']} stalls, worst {loop_stats['max_lag'] * 1000:.0f}ms",
+                inline=False
+            )
+        
+        pool_stats = bot.tibia_api.pool_stats()
+        if pool_stats['reuse_rate'] is not None:
+            embed.add_field(
+                name="🔌 Connections",
+                value=f"{pool_stats['reuse_rate']:.0%} reused, {pool_stats['open']} open ({pool_stats['idle']} idle)",
+                inline=False
+            )
+        
         # Show next scheduled check if scheduler is available
         if hasattr(bot, 'scheduler') and bot.scheduler:
             next_check = bot.scheduler.get_next_check_time()
@@ -381,8 +997,23 @@ async def schedule_command(interaction: discord.Interaction):
         logger.error(f"Error in schedule command: {e}")
         await interaction.followup.send(f"❌ Command failed: {str(e)}", ephemeral=True)
 
+def configure_logging():
+    """Configure logging (queued, so handlers never block the event loop); only when the bot runs, never on import"""
+    setup_logging(
+        level=os.getenv('LOG_LEVEL', 'INFO'),
+        path=os.getenv('LOG_FILE', 'bot.log'),
+        max_bytes=int(os.getenv('LOG_MAX_BYTES', str(10 * 1024 * 1024))),
+        backup_count=int(os.getenv('LOG_BACKUP_COUNT', '5')),
+        rotate_when=os.getenv('LOG_ROTATE_WHEN') or None,
+        json_format=os.getenv('LOG_FORMAT', 'text').lower() == 'json',
+        sample_burst=int(os.getenv('LOG_SAMPLE_BURST', '5')),
+        sample_window=float(os.getenv('LOG_SAMPLE_WINDOW_SECONDS', '60'))
+    )
+
 async def main():
     """Main function to run the bot"""
+    configure_logging()
+    
     # Get bot token from environment
     token = os.getenv('DISCORD_TOKEN')
     
@@ -395,7 +1026,7 @@ async def main():
     boss_channel = os.getenv('BOSS_CHANNEL_ID')
     
     if not creature_channel or not boss_channel:
-        logger.warning("Channel IDs not configured - bot will not post updates automatically")
+        logger.warning("Channel IDs not configured - bot will only post in channels added with /subscribe")
     
     # Create and run bot
     bot = TibiaBot()
@@ -406,6 +1037,14 @@ async def main():
     bot.tree.add_command(boss_status_command)
     bot.tree.add_command(next_save_command)
     bot.tree.add_command(schedule_command)
+    bot.tree.add_command(subscribe_command)
+    bot.tree.add_command(unsubscribe_command)
+    bot.tree.add_command(history_command)
+    bot.tree.add_command(lookup_command)
+    bot.tree.add_command(forecast_command)
+    bot.tree.add_command(watch_command)
+    bot.tree.add_command(unwatch_command)
+    bot.tree.add_command(watchlist_command)
     
     try:
         await bot.start(token)
@@ -2,52 +2,46 @@
 """
 Simple startup script for Railway deployment
 This ensures the bot runs properly in Railway's environment
+
+Dependencies are installed at build time (Dockerfile / pyproject.toml); startup
+never runs pip. Missing packages are reported and the process exits, so a
+broken image fails fast instead of installing packages on every cold start.
 """
 
-import os
+import importlib.util
 import sys
-import subprocess
-
-def install_dependencies():
-    """Install required dependencies"""
-    dependencies = [
-        'discord.py>=2.5.0',
-        'python-dotenv>=1.0.0', 
-        'aiohttp>=3.8.0',
-        'pytz>=2023.3',
-        'apscheduler>=3.10.0',
-        'requests>=2.31.0'
-    ]
-    
-    for dep in dependencies:
-        try:
-            subprocess.check_call([sys.executable, '-m', 'pip', 'install', dep])
-        except subprocess.CalledProcessError:
-            print(f"Failed to install {dep}")
-            continue
+
+# Import name -> distribution, for the error message
+REQUIRED_MODULES = {
+    'discord': 'discord.py',
+    'dotenv': 'python-dotenv',
+    'aiohttp': 'aiohttp',
+    'pytz': 'pytz',
+    'apscheduler': 'apscheduler'
+}
+
+
+def missing_dependencies():
+    """Distributions whose modules can't be found (checked without importing them)"""
+    return [dist for module, dist in REQUIRED_MODULES.items() if importlib.util.find_spec(module) is None]
+
 
 def main():
     """Main startup function"""
     print("Starting Tibia Discord Bot...")
-    
-    # Install dependencies if needed
-    try:
-        import discord
-        import dotenv
-        import aiohttp
-        import pytz
-        import apscheduler
-        import requests
-    except ImportError:
-        print("Installing dependencies...")
-        install_dependencies()
-    
+
+    missing = missing_dependencies()
+    if missing:
+        print(f"Missing dependencies: {', '.join(missing)}", file=sys.stderr)
+        print("Install them at build time, e.g. `pip install -e .`", file=sys.stderr)
+        sys.exit(1)
+
     # Import and run the main bot
     from main import main as bot_main
     import asyncio
-    
+
     # Run the bot
     asyncio.run(bot_main())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
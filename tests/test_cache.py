@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+
+from bot.cache import HIT, MISS, STALE, ResponseCache
+
+
+class Clock:
+    def __init__(self, when):
+        self.now = when.timestamp()
+
+    def __call__(self):
+        return self.now
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def test_entries_expire_at_next_server_save_then_go_stale():
+    # Server save is 10:00 Europe/Berlin, 08:00 UTC in October
+    clock = Clock(utc(2026, 10, 17, 12, 0))
+    cache = ResponseCache(stale_window=600, clock=clock)
+    cache.set('boosted/creatures', 'demon')
+
+    clock.now = utc(2026, 10, 18, 7, 59).timestamp()
+    assert cache.get('boosted/creatures') == ('demon', HIT)
+
+    clock.now = utc(2026, 10, 18, 8, 5).timestamp()
+    assert cache.get('boosted/creatures') == ('demon', STALE)
+
+    clock.now = utc(2026, 10, 18, 8, 11).timestamp()
+    assert cache.get('boosted/creatures') == (None, MISS)
+    # Still there as last known good
+    assert cache.peek('boosted/creatures') == 'demon'
+
+
+def test_entries_stored_right_after_server_save_get_a_short_ttl():
+    clock = Clock(utc(2026, 10, 17, 8, 5))
+    cache = ResponseCache(stale_window=0, settle_ttl=60, clock=clock)
+    cache.set('boosted/creatures', 'yesterday')
+
+    clock.now += 30
+    assert cache.get('boosted/creatures')[1] == HIT
+    clock.now += 60
+    assert cache.get('boosted/creatures')[1] == MISS
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_size=2, clock=Clock(utc(2026, 10, 17, 12, 0)))
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.peek('b') is None
+    assert cache.peek('a') == 1
+    assert cache.stats()['evictions'] == 1
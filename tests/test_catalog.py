@@ -0,0 +1,73 @@
+from bot.catalog import CreatureCatalog, normalize_name
+
+
+def creatures_payload(*names, boosted=None):
+    return {'creatures': {
+        'creature_list': [{'name': name, 'race': name.lower().replace(' ', ''), 'image_url': f'c/{name}.gif'} for name in names],
+        'boosted': {'name': boosted} if boosted else {}
+    }}
+
+
+def bosses_payload(*names, boosted=None):
+    return {'boostable_bosses': {
+        'boostable_boss_list': [{'name': name, 'image_url': f'b/{name}.gif'} for name in names],
+        'boosted': {'name': boosted} if boosted else {}
+    }}
+
+
+def test_normalize_name():
+    assert normalize_name('  Dragon_Lord ') == 'dragon lord'
+    assert normalize_name('Dragon   LORD') == 'dragon lord'
+
+
+def test_boss_named_like_a_creature_keeps_both():
+    catalog = CreatureCatalog()
+    catalog.ingest_creatures(creatures_payload('Demon', 'Dragon'))
+    catalog.ingest_bosses(bosses_payload('Demon', 'Ferumbras'))
+
+    assert not catalog.lookup('demon').is_boss
+    assert catalog.lookup('demon', is_boss=True).is_boss
+    assert len(catalog) == 4
+
+    # Re-ingesting the bosses must not drop the creature of the same name
+    catalog.ingest_bosses(bosses_payload('Ferumbras'))
+    assert catalog.lookup('Demon').image_url == 'c/Demon.gif'
+    assert catalog.lookup('Demon', is_boss=True) is None
+    assert {entry.name for entry in catalog.entries()} == {'Demon', 'Dragon', 'Ferumbras'}
+
+
+def test_lookups_by_race_and_image():
+    catalog = CreatureCatalog()
+    catalog.ingest_creatures(creatures_payload('Dragon Lord'))
+    catalog.ingest_bosses(bosses_payload('Ghazbaran'))
+
+    assert catalog.lookup_race('dragonlord').name == 'Dragon Lord'
+    assert catalog.lookup_image_url('b/Ghazbaran.gif').name == 'Ghazbaran'
+    assert catalog.image_url('dragon_lord') == 'c/Dragon Lord.gif'
+
+
+def test_search_ranks_prefix_word_prefix_then_typos():
+    catalog = CreatureCatalog()
+    catalog.ingest_creatures(creatures_payload('Dragon', 'Dragon Lord', 'Frost Dragon', 'Demon', 'Dragonling'))
+
+    assert [entry.name for entry in catalog.search('dragon')] == ['Dragon', 'Dragonling', 'Dragon Lord', 'Frost Dragon']
+    assert [entry.name for entry in catalog.search('lord')] == ['Dragon Lord']
+    assert catalog.search('frost drgon')[0].name == 'Frost Dragon'
+    assert catalog.search('demn')[0].name == 'Demon'
+    assert catalog.search('zzzzzz') == []
+
+
+def test_empty_search_puts_todays_boosted_first():
+    catalog = CreatureCatalog()
+    catalog.ingest_creatures(creatures_payload('Amazon', 'Demon', boosted='Demon'))
+    catalog.ingest_bosses(bosses_payload('Ferumbras', boosted='Ferumbras'))
+
+    assert [entry.name for entry in catalog.search('', 3)] == ['Demon', 'Ferumbras', 'Amazon']
+
+
+def test_payload_without_list_is_ignored():
+    catalog = CreatureCatalog()
+    catalog.ingest_creatures(creatures_payload('Demon'))
+
+    assert not catalog.ingest_creatures({'creatures': {'boosted': {'name': 'Demon'}}})
+    assert catalog.lookup('Demon') is not None
@@ -0,0 +1,83 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+from bot.details_store import CreatureDetailsStore
+from bot.models import CreatureDetails
+from bot.tibia_api import TibiaAPI
+from main import TibiaBot
+
+CREATURES = {
+    'creatures': {
+        'boosted': {'name': 'Demon', 'race': 'demon', 'image_url': 'https://static.example/demon.gif'},
+        'creature_list': [{'name': 'Demon', 'race': 'demon', 'image_url': 'https://static.example/demon.gif'}]
+    },
+    'information': {'timestamp': '2026-10-17T10:00:00Z'}
+}
+
+
+def deadline_bot(seconds):
+    return SimpleNamespace(command_deadline=seconds, _command_fetches=set())
+
+
+def test_slow_fetch_answers_with_fallback_and_keeps_running():
+    bot = deadline_bot(0.05)
+    finished = []
+
+    async def slow_fetch():
+        await asyncio.sleep(0.2)
+        finished.append(True)
+        return 'fresh'
+
+    async def run():
+        started = time.monotonic()
+        answer = await TibiaBot.within_deadline(bot, slow_fetch(), lambda: 'last known', 'creature')
+        waited = time.monotonic() - started
+        await asyncio.sleep(0.3)
+        return answer, waited
+
+    answer, waited = asyncio.run(run())
+    assert answer == 'last known'
+    assert waited < 0.2
+    # Not cancelled by the deadline, so its result can still be cached
+    assert finished == [True]
+    assert not bot._command_fetches
+
+
+def test_fast_fetch_is_returned():
+    async def fetch():
+        return 'fresh'
+
+    answer = asyncio.run(TibiaBot.within_deadline(deadline_bot(1), fetch(), lambda: 'last known', 'lookup'))
+    assert answer == 'fresh'
+
+
+def test_last_known_details_prefers_cache_then_store_then_placeholder(tmp_path):
+    api = TibiaAPI(details_store=CreatureDetailsStore(str(tmp_path / 'details.db')), community_url=None)
+    api.catalog.ingest_creatures(CREATURES)
+
+    placeholder = api.last_known_creature_details('Demon')
+    assert placeholder.is_fallback
+    assert placeholder.image_url == 'https://static.example/demon.gif'
+
+    api.details_store.put('Demon', {'name': 'Demon', 'hitpoints': 8200, 'source': 'TibiaWiki'}, 'TibiaWiki')
+    stored = api.last_known_creature_details('Demon')
+    assert stored.hitpoints == 8200
+    assert not stored.is_fallback
+
+    cached = CreatureDetails.from_dict({'name': 'Demon', 'hitpoints': 8300, 'source': 'TibiaData'}, 'Demon')
+    api.cache.set('details/demon', cached)
+    assert api.last_known_creature_details(' Demon ') is cached
+    api.details_store.close()
+
+
+def test_last_known_boosted_comes_from_catalog_and_cache():
+    api = TibiaAPI(community_url=None)
+    assert api.last_known_boosted() is None
+
+    api.catalog.ingest_creatures(CREATURES)
+    api.cache.set('boosted/creatures', CREATURES)
+    snapshot = api.last_known_boosted()
+    assert snapshot.creature == 'Demon'
+    assert snapshot.boss is None
+    assert snapshot.timestamp == '2026-10-17T10:00:00Z'
@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from bot.embed_builder import EmbedBuilder
+from bot.models import BoostedSnapshot, CreatureDetails
+
+
+def test_memoized_embed_is_reused_but_restamped():
+    builder = EmbedBuilder()
+    details = CreatureDetails(name='Demon', hitpoints=8200, experience_points=6000)
+    snapshot = BoostedSnapshot(creature='Demon')
+
+    first = builder.get_creature_embed('Demon', details, snapshot)
+    later = datetime.now(timezone.utc) + timedelta(hours=3)
+    with mock.patch('bot.embed_builder.datetime') as fake_datetime:
+        fake_datetime.now.return_value = later
+        second = builder.get_creature_embed('Demon', details, snapshot)
+
+    assert builder.embed_cache_hits == 1
+    assert second.timestamp == later
+    assert first.timestamp != second.timestamp
+
+
+def test_copies_do_not_share_fields_or_title():
+    builder = EmbedBuilder()
+    details = CreatureDetails(name='Demon', hitpoints=8200, experience_points=6000)
+
+    first = builder.get_creature_embed('Demon', details, None, title='Custom')
+    first.add_field(name='Extra', value='only here')
+    second = builder.get_creature_embed('Demon', details, None)
+
+    assert first.title == 'Custom'
+    assert second.title != 'Custom'
+    assert 'Extra' not in [field.name for field in second.fields]
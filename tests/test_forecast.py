@@ -0,0 +1,76 @@
+from datetime import date, timedelta
+
+import pytest
+
+from bot.forecast import KindForecaster, RotationForecaster
+from bot.history import BoostedHistory
+
+START = date(2026, 1, 1)
+
+
+def rotation(names, days):
+    return [(START + timedelta(days=offset), names[offset % len(names)]) for offset in range(days)]
+
+
+def test_gap_statistics_are_updated_incrementally():
+    forecaster = KindForecaster('creature', min_gaps=1000)
+    for day, name in rotation(['Demon', 'Dragon', 'Rat'], 9):
+        assert forecaster.observe(day, name)
+    # Days must move forward; anything else needs a rebuild
+    assert not forecaster.observe(START, 'Demon')
+
+    rows = forecaster.forecast([1], START + timedelta(days=8))[1]
+    demon = next(row for row in rows if row.name == 'Demon')
+    assert demon.count == 3
+    assert demon.mean_gap == 3.0
+    assert demon.gap_stddev == 0.0
+
+
+def test_frequency_fallback_without_enough_gaps():
+    forecaster = KindForecaster('creature', smoothing=1.0, min_gaps=1000)
+    for day, name in rotation(['Demon', 'Dragon'], 4):
+        forecaster.observe(day, name)
+
+    rows = forecaster.forecast([1, 3], START + timedelta(days=3))
+    # (2 boosts + 1) / (4 days + 1 * 2 names)
+    assert rows[1][0].probability == pytest.approx(0.5)
+    assert rows[3][0].probability == pytest.approx(1 - 0.5 ** 3)
+
+
+def test_pooled_gaps_predict_the_next_rotation():
+    forecaster = KindForecaster('creature', min_gaps=10)
+    for day, name in rotation(['Demon', 'Dragon', 'Rat'], 30):
+        forecaster.observe(day, name)
+
+    # Every gap is 3 days: whoever was boosted 2 days ago is certain tomorrow
+    today = START + timedelta(days=29)
+    rows = forecaster.forecast([1], today)[1]
+    assert rows[0].name == 'Demon'
+    assert rows[0].probability == pytest.approx(1.0)
+    assert rows[-1].probability == pytest.approx(0.0)
+
+
+def test_update_matches_a_full_rebuild(tmp_path):
+    history = BoostedHistory(str(tmp_path / 'history.jsonl'))
+    for day, name in rotation(['Demon', 'Dragon', 'Rat'], 12):
+        history.record('creature', name, day)
+    today = START + timedelta(days=12)
+
+    incremental = RotationForecaster(horizons=(1, 7), min_gaps=5)
+    incremental.rebuild(history, today)
+    history.record('creature', 'Demon', today)
+    incremental.update(history, 'creature', today, today)
+
+    # A correction to a past day falls back to a rebuild
+    history.record('creature', 'Rat', START)
+    incremental.update(history, 'creature', START, today)
+
+    rebuilt = RotationForecaster(horizons=(1, 7), min_gaps=5)
+    rebuilt.rebuild(history, today)
+
+    assert incremental.top('creature', 7) == rebuilt.top('creature', 7)
+    assert incremental.days_observed('creature') == 13
+    kind, row = incremental.lookup('demon', 1)
+    assert kind == 'creature'
+    assert row.last == today
+    assert incremental.lookup('Ferumbras', 1) is None
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from bot.hedging import HedgedFetcher, LatencyHistogram, Origin, parse_community_boosted
+
+
+class FakeOrigin(Origin):
+    def __init__(self, name, delay, payload):
+        super().__init__()
+        self.name = name
+        self.delay = delay
+        self.payload = payload
+        self.calls = 0
+
+    async def fetch(self, api, endpoint, retries):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.payload
+
+
+def test_origin_without_fetch_cannot_be_created():
+    class Incomplete(Origin):
+        name = 'incomplete'
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_slow_primary_is_hedged_and_fast_origin_wins():
+    primary = FakeOrigin('primary', 1.0, {'from': 'primary'})
+    mirror = FakeOrigin('mirror', 0.0, {'from': 'mirror'})
+    fetcher = HedgedFetcher([primary, mirror], default_delay=0.05)
+
+    data = asyncio.run(fetcher.fetch(None, 'creatures', validate=lambda data: True))
+
+    assert data == {'from': 'mirror'}
+    assert fetcher.hedges == 1
+    assert mirror.wins == 1 and primary.wins == 0
+
+
+def test_failed_primary_falls_through_without_waiting():
+    primary = FakeOrigin('primary', 0.0, None)
+    mirror = FakeOrigin('mirror', 0.0, {'from': 'mirror'})
+    fetcher = HedgedFetcher([primary, mirror], default_delay=10)
+
+    data = asyncio.run(asyncio.wait_for(fetcher.fetch(None, 'creatures', validate=lambda data: True), 1))
+
+    assert data == {'from': 'mirror'}
+    assert fetcher.hedges == 0
+    assert primary.latency.failures == 1
+
+
+def test_non_dict_payload_fails_its_origin_only():
+    broken = FakeOrigin('broken-mirror', 0.0, ['not', 'a', 'dict'])
+    mirror = FakeOrigin('mirror', 0.0, {'creatures': {'boosted': {'name': 'Demon'}}})
+    fetcher = HedgedFetcher([broken, mirror], default_delay=10)
+
+    def validate(payload):
+        return bool(((payload.get('creatures') or {}).get('boosted') or {}).get('name'))
+
+    data = asyncio.run(asyncio.wait_for(fetcher.fetch(None, 'creatures', validate=validate), 1))
+
+    assert data == {'creatures': {'boosted': {'name': 'Demon'}}}
+    assert broken.latency.failures == 1
+
+
+def test_invalid_answers_count_as_failures():
+    only = FakeOrigin('only', 0.0, {'partial': True})
+    fetcher = HedgedFetcher([only])
+
+    assert asyncio.run(fetcher.fetch(None, 'creatures', validate=lambda data: False)) is None
+    assert only.latency.failures == 1
+
+
+def test_latency_quantiles_use_bucket_bounds():
+    histogram = LatencyHistogram(buckets=(0.1, 0.5, 1.0))
+    for seconds in (0.05, 0.05, 0.3, 0.7, 5.0):
+        histogram.record(seconds)
+
+    assert histogram.quantile(0.4) == 0.1
+    assert histogram.quantile(0.6) == 0.5
+    assert histogram.quantile(1.0) == float('inf')
+
+
+def test_parse_community_boosted_names():
+    page = (
+        '<img title="Today\'s boosted creature: Dragon Lord" src="a.gif">'
+        '<img title=\'Today&#39;s boosted boss: Ghazbar&aacute;n\' src="b.gif">'
+    )
+
+    assert parse_community_boosted(page) == {'creature': 'Dragon Lord', 'boss': 'Ghazbarán'}
+    assert parse_community_boosted('<html></html>') == {}
@@ -0,0 +1,73 @@
+import json
+from datetime import date
+
+from bot.history import BoostedHistory
+
+
+def test_recorded_days_survive_a_reload_and_later_lines_win(tmp_path):
+    path = str(tmp_path / 'history.jsonl')
+    history = BoostedHistory(path)
+    assert history.record('creature', 'Demon', date(2026, 10, 15))
+    assert history.record('boss', 'Ferumbras', date(2026, 10, 15))
+    assert not history.record('creature', 'Demon', date(2026, 10, 15))
+    # A corrected post replaces the day's name in every index
+    assert history.record('creature', 'Dragon', date(2026, 10, 15))
+
+    reloaded = BoostedHistory(path)
+    entry = reloaded.entry(date(2026, 10, 15))
+    assert (entry.creature, entry.boss) == ('Dragon', 'Ferumbras')
+    assert reloaded.last_boosted('demon') is None
+    assert reloaded.last_boosted('DRAGON') == date(2026, 10, 15)
+
+
+def test_stats_count_streaks_and_gaps(tmp_path):
+    history = BoostedHistory(str(tmp_path / 'history.jsonl'))
+    for day, name in ((1, 'Demon'), (2, 'Demon'), (3, 'Dragon'), (7, 'Demon'), (8, 'Demon'), (9, 'Demon')):
+        history.record('creature', name, date(2026, 10, day))
+
+    stats = history.stats('demon', today=date(2026, 10, 9))
+    assert stats.name == 'Demon'
+    assert stats.kind == 'creature'
+    assert stats.count == 5
+    assert (stats.first, stats.last) == (date(2026, 10, 1), date(2026, 10, 9))
+    assert stats.longest_streak == 3
+    assert stats.current_streak == 3
+    assert stats.average_gap == 2.0
+    assert history.stats('Dragon').current_streak == 0
+    assert history.times_boosted('Demon', since=date(2026, 10, 7)) == 3
+    assert history.stats('Ferumbras') is None
+
+
+def test_unreadable_lines_are_skipped(tmp_path):
+    path = tmp_path / 'history.jsonl'
+    path.write_text(
+        json.dumps({'date': '2026-10-15', 'creature': 'Demon', 'boss': None}) + '\n{"date": "garbage"\n\n',
+        encoding='utf-8'
+    )
+    history = BoostedHistory(str(path))
+    assert len(history) == 1
+    assert history.entry(date(2026, 10, 15)).creature == 'Demon'
+
+
+def test_backfill_from_text_and_json_logs(tmp_path):
+    (tmp_path / 'bot.log').write_text(
+        "2026-10-15 09:00:00,001 - bot.tibia_api - INFO - Fetched boosted data: creature=Old, boss=None\n"
+        "2026-10-16 09:00:00,001 - bot.tibia_api - INFO - Fetched boosted data: creature=Old, boss=None\n"
+        "2026-10-16 12:00:00,001 - bot.tibia_api - INFO - Fetched boosted data: creature=Demon, boss=Ferumbras\n",
+        encoding='utf-8'
+    )
+    (tmp_path / 'bot.log.1').write_text(
+        json.dumps({'time': '2026-10-17T12:00:00+00:00', 'message': 'Fetched boosted data: creature=Dragon, boss=Morgaroth'}) + '\n',
+        encoding='utf-8'
+    )
+    history = BoostedHistory(str(tmp_path / 'history.jsonl'))
+    history.record('boss', 'Ghazbaran', date(2026, 10, 17))
+
+    added = history.backfill_from_logs([str(tmp_path / 'bot.log*')])
+
+    # The last fetch of each server-save day wins; recorded halves are kept
+    assert history.entry(date(2026, 10, 16)).creature == 'Demon'
+    assert history.entry(date(2026, 10, 16)).boss == 'Ferumbras'
+    assert history.entry(date(2026, 10, 17)).creature == 'Dragon'
+    assert history.entry(date(2026, 10, 17)).boss == 'Ghazbaran'
+    assert added == 4
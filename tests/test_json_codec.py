@@ -0,0 +1,32 @@
+import json
+
+import pytest
+
+from bot.json_codec import JSONCodec, msgspec, orjson
+
+BODY = json.dumps({
+    'creatures': {
+        'boosted': {'name': 'Demon', 'race': 'demon', 'featured': True},
+        'creature_list': [{'name': 'Dragön', 'race': 'dragon', 'image_url': 'x.gif', 'featured': False}]
+    },
+    'information': {'timestamp': '2025-07-18T08:00:03Z', 'status': {'http_code': 200}}
+}, ensure_ascii=False).encode('utf-8')
+
+INSTALLED = ['json'] + [name for name, module in (('orjson', orjson), ('msgspec', msgspec)) if module is not None]
+
+
+@pytest.mark.parametrize('backend', INSTALLED)
+def test_every_backend_decodes_the_same(backend):
+    codec = JSONCodec(backend)
+
+    assert codec.backend == backend
+    assert codec.decode(BODY) == json.loads(BODY)
+
+
+def test_unknown_backend_falls_back_to_an_available_one():
+    assert JSONCodec('simdjson').backend in INSTALLED
+
+
+def test_invalid_body_raises():
+    with pytest.raises(Exception):
+        JSONCodec().decode(b'{"creatures": ')
@@ -0,0 +1,109 @@
+import asyncio
+import json
+import logging
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from bot.history import BoostedHistory
+from bot.logging_setup import LOG_FORMAT, UNSAMPLED, JsonFormatter, SamplingFilter
+from bot.tibia_api import TibiaAPI
+
+
+def make_record(name='bot.tibia_api', level=logging.INFO, msg='Retrying request', lineno=10, **extra):
+    record = logging.LogRecord(name, level, '/bot/tibia_api.py', lineno, msg, (), None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_repeated_lines_are_sampled_and_counted():
+    sampler = SamplingFilter(burst=2, window=60)
+
+    passed = [sampler.filter(make_record()) for _ in range(5)]
+
+    assert passed == [True, True, False, False, False]
+    assert sampler.suppressed == 3
+
+
+def test_errors_other_loggers_and_unsampled_records_always_pass():
+    sampler = SamplingFilter(burst=1, window=60)
+
+    assert all(sampler.filter(make_record(level=logging.ERROR)) for _ in range(3))
+    assert all(sampler.filter(make_record(name='bot.scheduler')) for _ in range(3))
+    assert all(sampler.filter(make_record(lineno=20, **UNSAMPLED)) for _ in range(3))
+    assert sampler.suppressed == 0
+
+
+def test_json_formatter_includes_extras_but_not_private_flags():
+    record = make_record(endpoint='creatures', **UNSAMPLED)
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry['endpoint'] == 'creatures'
+    assert '_unsampled' not in entry
+
+
+def test_backfill_sees_every_fetched_line_despite_sampling(tmp_path):
+    log_path = tmp_path / 'bot.log'
+    handler = logging.FileHandler(log_path, encoding='utf-8')
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    handler.addFilter(SamplingFilter(burst=1, window=3600))
+    logger = logging.getLogger('bot.tibia_api.test_backfill')
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    try:
+        for creature in ('Demon', 'Dragon', 'Hydra', 'Wyrm'):
+            logger.info(f"Fetched boosted data: creature={creature}, boss=Ferumbras", extra=UNSAMPLED)
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+    lines = log_path.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 4
+
+    history = BoostedHistory(str(tmp_path / 'history.jsonl'))
+    assert history.backfill_from_logs([str(log_path)]) == 2
+    assert history.latest().creature == 'Wyrm'
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_burst_of_retry_warnings_is_sampled_but_final_errors_pass():
+    async def unavailable(request):
+        return web.Response(status=503, headers={'Retry-After': '0'})
+
+    async def run():
+        app = web.Application()
+        app.router.add_get('/v4/{endpoint}', unavailable)
+        async with TestServer(app) as server:
+            api = TibiaAPI(base_url=str(server.make_url('/v4')), breaker_threshold=1000, host_rate=1000, host_burst=1000, community_url=None)
+            try:
+                for _ in range(4):
+                    await api._fetch(str(server.make_url('/v4/creatures')), retries=3)
+            finally:
+                await api.close()
+
+    handler = CollectingHandler()
+    sampler = SamplingFilter(burst=2, window=3600)
+    handler.addFilter(sampler)
+    logger = logging.getLogger('bot.tibia_api')
+    logger.addHandler(handler)
+    try:
+        asyncio.run(run())
+    finally:
+        logger.removeHandler(handler)
+
+    retries = [record for record in handler.records if record.levelno == logging.WARNING]
+    failures = [record for record in handler.records if record.levelno == logging.ERROR]
+    # 4 fetches x 4 attempts: only the first 2 per-attempt warnings get through
+    assert len(retries) == 2
+    assert sampler.suppressed == 14
+    assert len(failures) == 4
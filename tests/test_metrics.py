@@ -0,0 +1,86 @@
+import asyncio
+import socket
+
+import aiohttp
+import pytest
+
+from bot.metrics import CONTENT_TYPE, Metric, MetricsRegistry, MetricsServer, register_stats_gauges
+
+
+def test_metric_without_samples_cannot_be_created():
+    class Incomplete(Metric):
+        type = 'untyped'
+
+    with pytest.raises(TypeError):
+        Incomplete('incomplete', 'No samples')
+
+
+def test_counter_and_histogram_render_in_exposition_format():
+    registry = MetricsRegistry()
+    requests = registry.counter('requests_total', 'Requests by host', ('host', 'outcome'))
+    latency = registry.histogram('request_seconds', 'Request latency', ('host',), buckets=(0.1, 1.0))
+
+    requests.inc(host='api.tibiadata.com', outcome='200')
+    requests.inc(2, host='api.tibiadata.com', outcome='200')
+    requests.inc(host='say "hi"', outcome='timeout')
+    latency.observe(0.05, host='api.tibiadata.com')
+    latency.observe(0.5, host='api.tibiadata.com')
+    latency.observe(5, host='api.tibiadata.com')
+
+    assert registry.render().splitlines() == [
+        '# HELP requests_total Requests by host',
+        '# TYPE requests_total counter',
+        'requests_total{host="api.tibiadata.com",outcome="200"} 3',
+        'requests_total{host="say \\"hi\\"",outcome="timeout"} 1',
+        '# HELP request_seconds Request latency',
+        '# TYPE request_seconds histogram',
+        'request_seconds_bucket{host="api.tibiadata.com",le="0.1"} 1',
+        'request_seconds_bucket{host="api.tibiadata.com",le="1.0"} 2',
+        'request_seconds_bucket{host="api.tibiadata.com",le="+Inf"} 3',
+        'request_seconds_sum{host="api.tibiadata.com"} 5.55',
+        'request_seconds_count{host="api.tibiadata.com"} 3',
+    ]
+
+
+def test_wrong_labels_are_rejected():
+    counter = MetricsRegistry().counter('posts_total', 'Posts', ('kind',))
+
+    with pytest.raises(ValueError):
+        counter.inc(channel='1')
+
+
+def test_stats_gauges_export_numeric_fields_per_label():
+    registry = MetricsRegistry()
+    stats = {'api.tibiadata.com': {'state': 'closed', 'failures': 2}, 'tibia.fandom.com': {'failures': 0}}
+    register_stats_gauges(registry, 'breaker', lambda: stats, ('failures', 'state'), 'Breaker', label='host')
+
+    assert registry.render().splitlines()[2:] == [
+        'breaker_failures{host="api.tibiadata.com"} 2.0',
+        'breaker_failures{host="tibia.fandom.com"} 0.0',
+        '# HELP breaker_state Breaker: state',
+        '# TYPE breaker_state gauge',
+    ]
+
+
+def test_metrics_endpoint_serves_the_registry():
+    registry = MetricsRegistry()
+    registry.counter('posts_total', 'Posts', ('kind',)).inc(kind='creature')
+
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+
+    async def scrape():
+        server = MetricsServer(registry, port=port)
+        await server.start()
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(f'http://127.0.0.1:{port}/metrics') as response:
+                    return response.status, response.headers['Content-Type'], await response.text()
+        finally:
+            await server.stop()
+
+    status, content_type, body = asyncio.run(scrape())
+    assert status == 200
+    assert content_type == CONTENT_TYPE
+    assert 'posts_total{kind="creature"} 1' in body.splitlines()
@@ -0,0 +1,37 @@
+import asyncio
+
+from bot.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_load():
+    flight = SingleFlight()
+    loads = []
+
+    async def load():
+        loads.append(True)
+        await asyncio.sleep(0.01)
+        return 'payload'
+
+    async def run():
+        return await asyncio.gather(*(flight.do('creatures', load) for _ in range(5)))
+
+    assert asyncio.run(run()) == ['payload'] * 5
+    assert len(loads) == 1
+    assert flight.stats() == {'calls': 1, 'deduplicated': 4, 'in_flight': 0}
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_load():
+    flight = SingleFlight()
+
+    async def load():
+        await asyncio.sleep(0.05)
+        return 'payload'
+
+    async def run():
+        impatient = asyncio.ensure_future(flight.do('creatures', load))
+        patient = asyncio.ensure_future(flight.do('creatures', load))
+        await asyncio.sleep(0.01)
+        impatient.cancel()
+        return await patient
+
+    assert asyncio.run(run()) == 'payload'
@@ -0,0 +1,248 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from bot.sources import DetailsSource, WikiRawSource, build_sources
+from bot.tibia_api import TibiaAPI
+
+DEMON_TIBIADATA = {
+    'creature': {
+        'name': 'Demon',
+        'race': 'demon',
+        'hitpoints': 8200,
+        'experience_points': 6000,
+        'description': 'Demons are among the most feared creatures.',
+        'loot_list': []
+    }
+}
+
+DEMON_WIKITEXT = """{{Infobox Creature|List={{{1|}}}|GetValue={{{GetValue|}}}
+| name         = Demon
+| hp           = 8200
+| exp          = 6000
+| armor        = 44
+| speed        = 280
+| notes        = [[Demon]]s are one of the most powerful creatures.
+}}
+{{Loot Item|0-6|Gold Coin}}
+{{Loot Item|Fire Axe}}
+"""
+
+DEMON_HTML = """<html><head><script>var x = "<aside class='portable-infobox'>";</script></head><body>
+<aside class="portable-infobox">
+  <div data-source="hp"><h3>Health</h3><div>8,200</div></div>
+  <div data-source="exp"><h3>Experience</h3><div>6,000</div></div>
+  <div data-source="loot"><h3>Loot</h3><div><a href="/wiki/Gold_Coin">Gold Coin</a></div></div>
+</aside>
+<p>Demons are one of the most feared creatures in all of Tibia, with powerful fire attacks.</p>
+</body></html>"""
+
+
+class StubUpstream:
+    """TibiaData, the MediaWiki API and rendered wiki pages on one local server"""
+
+    def __init__(self):
+        self.hits = []
+        self.tibiadata = {}
+        self.wikitext = {}
+        self.redirects = {}
+        self.pages = {}
+        self.raw_api_body = None
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get('/v4/creature/{race}', self.creature)
+        app.router.add_get('/api.php', self.api_php)
+        app.router.add_get('/wiki/{title}', self.wiki_page)
+        return app
+
+    async def creature(self, request):
+        self.hits.append(('tibiadata', request.match_info['race']))
+        payload = self.tibiadata.get(request.match_info['race'])
+        if payload is None:
+            return web.json_response({'information': {}}, status=404)
+        return web.json_response(payload)
+
+    async def api_php(self, request):
+        titles = request.query['titles'].split('|')
+        self.hits.append(('wiki-raw', tuple(titles)))
+        if self.raw_api_body is not None:
+            return web.Response(text=self.raw_api_body, content_type='application/json')
+
+        pages = []
+        redirects = []
+        for title in titles:
+            target = self.redirects.get(title, title)
+            if target != title:
+                redirects.append({'from': title, 'to': target})
+            if target in self.wikitext:
+                pages.append({'title': target, 'revisions': [{'slots': {'main': {'content': self.wikitext[target]}}}]})
+            else:
+                pages.append({'title': target, 'missing': True})
+        return web.json_response({'query': {'redirects': redirects, 'pages': pages}})
+
+    async def wiki_page(self, request):
+        title = request.match_info['title']
+        self.hits.append(('wiki-html', title))
+        if title not in self.pages:
+            return web.Response(status=404, text='Not found')
+        return web.Response(text=self.pages[title], content_type='text/html')
+
+
+def run_against(stub, sources, call):
+    """Run call(api) with a TibiaAPI pointed at the stub server"""
+    async def scenario():
+        server = TestServer(stub.app())
+        await server.start_server()
+        base = str(server.make_url('/')).rstrip('/')
+        api = TibiaAPI(base_url=f"{base}/v4", wiki_base_url=base, sources=sources, community_url=None)
+        # The catalog lists are out of scope here
+        api.catalog.is_current = lambda: True
+        try:
+            return await call(api)
+        finally:
+            await api.close()
+            api.offloader.shutdown()
+            await server.close()
+
+    return asyncio.run(scenario())
+
+
+def test_source_without_fetch_cannot_be_created():
+    class Incomplete(DetailsSource):
+        name = 'incomplete'
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_build_sources_keeps_order_and_skips_unknown():
+    sources = build_sources(['wiki-html', 'nope', ' TibiaData '])
+
+    assert [source.name for source in sources] == ['wiki-html', 'tibiadata']
+    assert [source.name for source in build_sources(['nope'])] == ['tibiadata', 'wiki-raw', 'wiki-html']
+
+
+def test_tibiadata_answer_stops_the_chain():
+    stub = StubUpstream()
+    stub.tibiadata['demon'] = DEMON_TIBIADATA
+
+    details = run_against(stub, None, lambda api: api.get_creature_details('Demon'))
+
+    assert details.source == 'TibiaData'
+    assert details.hitpoints == 8200
+    assert stub.hits == [('tibiadata', 'demon')]
+
+
+def test_missing_creature_falls_back_to_wikitext():
+    stub = StubUpstream()
+    stub.wikitext['Demon'] = DEMON_WIKITEXT
+
+    details = run_against(stub, None, lambda api: api.get_creature_details('Demon'))
+
+    assert stub.hits == [('tibiadata', 'demon'), ('wiki-raw', ('Demon',))]
+    assert details.source == 'TibiaWiki'
+    assert (details.hitpoints, details.experience_points, details.armor, details.speed) == (8200, 6000, 44, 280)
+    assert details.loot_names(5) == ['Gold Coin', 'Fire Axe']
+
+
+def test_missing_wiki_page_falls_back_to_rendered_html():
+    stub = StubUpstream()
+    stub.pages['Demon'] = DEMON_HTML
+
+    details = run_against(stub, None, lambda api: api.get_creature_details('Demon'))
+
+    assert stub.hits == [('tibiadata', 'demon'), ('wiki-raw', ('Demon',)), ('wiki-html', 'Demon')]
+    assert details.source == 'TibiaWiki'
+    assert details.hitpoints == 8200
+    assert details.description.startswith('Demons are one of the most feared')
+
+
+def test_every_source_failing_gives_placeholder_details():
+    stub = StubUpstream()
+
+    details = run_against(stub, None, lambda api: api.get_creature_details('Demon'))
+
+    assert details.is_fallback
+    assert [source for source, _ in stub.hits] == ['tibiadata', 'wiki-raw', 'wiki-html']
+
+
+def test_configured_order_is_respected():
+    stub = StubUpstream()
+    stub.tibiadata['demon'] = DEMON_TIBIADATA
+    stub.pages['Demon'] = DEMON_HTML
+
+    details = run_against(stub, ['wiki-html', 'tibiadata'], lambda api: api.get_creature_details('Demon'))
+
+    assert stub.hits == [('wiki-html', 'Demon')]
+    assert details.source == 'TibiaWiki'
+
+
+def test_wikitext_without_infobox_is_skipped():
+    stub = StubUpstream()
+    stub.wikitext['Demon'] = "'''Demon''' may refer to:\n* [[Demon (Creature)]]\n* [[Demon Outfit]]"
+    stub.pages['Demon'] = DEMON_HTML
+
+    details = run_against(stub, ['wiki-raw', 'wiki-html'], lambda api: api.get_creature_details('Demon'))
+
+    assert [source for source, _ in stub.hits] == ['wiki-raw', 'wiki-html']
+    assert details.hitpoints == 8200
+
+
+def test_malformed_api_json_is_skipped():
+    stub = StubUpstream()
+    stub.raw_api_body = '{"query": {"pages": [{"title": "Demon", "revisions": ['
+    stub.pages['Demon'] = DEMON_HTML
+
+    details = run_against(stub, ['wiki-raw', 'wiki-html'], lambda api: api.get_creature_details('Demon'))
+
+    assert stub.hits[-1] == ('wiki-html', 'Demon')
+    assert details.hitpoints == 8200
+
+
+def test_page_without_infobox_or_description_gives_placeholder():
+    stub = StubUpstream()
+    stub.pages['Demon'] = '<html><body><p>Stub.</p></body></html>'
+
+    details = run_against(stub, ['wiki-html'], lambda api: api.get_creature_details('Demon'))
+
+    assert details.is_fallback
+
+
+def test_truncated_infobox_keeps_the_fields_that_closed():
+    stub = StubUpstream()
+    stub.pages['Demon'] = DEMON_HTML.split('<div data-source="loot">')[0]
+
+    details = run_against(stub, ['wiki-html'], lambda api: api.get_creature_details('Demon'))
+
+    assert details.hitpoints == 8200
+    assert details.loot == ()
+
+
+def test_wikitext_batches_and_follows_redirects():
+    stub = StubUpstream()
+    stub.wikitext['Demon'] = DEMON_WIKITEXT
+    stub.wikitext['Dragon Lord'] = DEMON_WIKITEXT.replace('Demon', 'Dragon Lord').replace('8200', '1900')
+    stub.redirects['Dragon_Lord'] = 'Dragon Lord'
+
+    found = run_against(stub, None, lambda api: WikiRawSource().fetch_many(api, ['Demon', 'Dragon_Lord', 'Nobody']))
+
+    assert len([hit for hit in stub.hits if hit[0] == 'wiki-raw']) == 1
+    assert set(found) == {'Demon', 'Dragon_Lord'}
+    assert found['Dragon_Lord']['hitpoints'] == 1900
+
+
+def test_wikitext_requests_are_split_at_the_title_limit(monkeypatch):
+    stub = StubUpstream()
+    monkeypatch.setattr(WikiRawSource, 'MAX_TITLES', 2)
+    names = [f'Creature {index}' for index in range(5)]
+    for name in names:
+        stub.wikitext[name] = DEMON_WIKITEXT
+
+    found = run_against(stub, None, lambda api: WikiRawSource().fetch_many(api, names))
+
+    assert [len(titles) for source, titles in stub.hits] == [2, 2, 1]
+    assert set(found) == set(names)
@@ -0,0 +1,48 @@
+from datetime import timedelta
+
+from bot.server_save import last_server_save
+from bot.state_store import BotStateStore
+
+
+def _iso(moment):
+    return moment.astimezone().strftime('%Y-%m-%dT%H:%M:%S%z')
+
+
+def test_post_of_pre_rotation_data_is_not_current(tmp_path):
+    store = BotStateStore(str(tmp_path / 'state.json'))
+    before_save = last_server_save() - timedelta(minutes=1)
+
+    # Posted now, but from a response generated before server save
+    store.record_post('creature', 'Demon', _iso(before_save), [1])
+
+    assert not store.is_current('creature')
+
+
+def test_post_of_post_rotation_data_is_current(tmp_path):
+    store = BotStateStore(str(tmp_path / 'state.json'))
+    after_save = last_server_save() + timedelta(minutes=1)
+
+    store.record_post('boss', 'Ferumbras', _iso(after_save), [2])
+
+    assert store.is_current('boss')
+    assert not store.is_current('creature')
+
+
+def test_post_without_api_timestamp_is_not_current(tmp_path):
+    store = BotStateStore(str(tmp_path / 'state.json'))
+
+    store.record_post('creature', 'Demon', None, [1])
+
+    assert not store.is_current('creature')
+
+
+def test_state_survives_reload(tmp_path):
+    path = str(tmp_path / 'state.json')
+    after_save = last_server_save() + timedelta(minutes=1)
+    BotStateStore(path).record_post('creature', 'Demon', _iso(after_save), [1, 2])
+
+    reloaded = BotStateStore(path)
+
+    assert reloaded.get_name('creature') == 'Demon'
+    assert reloaded.get_message_ids('creature') == [1, 2]
+    assert reloaded.is_current('creature')
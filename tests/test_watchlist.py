@@ -0,0 +1,88 @@
+import os
+
+import pytest
+
+from bot.watchlist import WatchlistStore, mention_batches
+
+
+def test_matches_group_watchers_by_target(tmp_path):
+    store = WatchlistStore(str(tmp_path / 'watchlist.jsonl'))
+    store.add(1, 'Dragon Lord', 100)
+    store.add(2, 'dragon_lord', 100)
+    store.add(3, 'Dragon Lord', None)
+    store.add(4, 'Demon', 100)
+
+    assert store.matches(['DRAGON LORD']) == {
+        100: {1: ['DRAGON LORD'], 2: ['DRAGON LORD']},
+        None: {3: ['DRAGON LORD']}
+    }
+    assert store.matches(['Hydra']) == {}
+
+
+def test_duplicates_and_limit(tmp_path):
+    store = WatchlistStore(str(tmp_path / 'watchlist.jsonl'), max_per_user=2)
+
+    assert store.add(1, 'Demon', None)
+    assert not store.add(1, ' demon ', None)
+    assert store.add(1, 'Demon', 100)
+    with pytest.raises(ValueError):
+        store.add(1, 'Hydra', None)
+    assert len(store) == 2
+
+
+def test_remove_everywhere_and_by_channel(tmp_path):
+    store = WatchlistStore(str(tmp_path / 'watchlist.jsonl'))
+    store.add(1, 'Demon', None)
+    store.add(1, 'Demon', 100)
+    store.add(2, 'Hydra', 100)
+    store.add(3, 'Hydra', 200)
+
+    assert store.remove(1, 'DEMON') == 2
+    assert store.remove_channel(100) == 1
+    assert store.watches_of(2) == []
+    assert store.watches_of(3) == [('Hydra', 200)]
+    assert store.watched_names() == 1
+
+
+def test_log_replays_on_reload(tmp_path):
+    path = str(tmp_path / 'watchlist.jsonl')
+    store = WatchlistStore(path)
+    store.add(1, 'Demon', None)
+    store.add(1, 'Hydra', 100)
+    store.remove(1, 'Demon')
+
+    reloaded = WatchlistStore(path)
+
+    assert reloaded.watches_of(1) == [('Hydra', 100)]
+    assert len(reloaded) == 1
+
+
+def test_log_is_compacted_once_mostly_dead(tmp_path):
+    path = str(tmp_path / 'watchlist.jsonl')
+    store = WatchlistStore(path)
+    store.add(1, 'Demon', None)
+    for _ in range(600):
+        store.add(2, 'Hydra', 100)
+        store.remove(2, 'Hydra')
+
+    with open(path, encoding='utf-8') as f:
+        lines = f.readlines()
+    assert len(lines) < 300
+    assert not [name for name in os.listdir(tmp_path) if name.startswith('.')]
+    assert WatchlistStore(path).watches_of(1) == [('Demon', None)]
+
+
+def test_unreadable_lines_are_skipped(tmp_path):
+    path = tmp_path / 'watchlist.jsonl'
+    path.write_text('{"op": "add", "user": 1, "name": "Demon", "channel": null}\nnot json\n{"op": "add"}\n', encoding='utf-8')
+
+    assert WatchlistStore(str(path)).watches_of(1) == [('Demon', None)]
+
+
+def test_mention_batches_fit_the_message_limit():
+    batches = mention_batches('Demon', 'creature', range(10 ** 17, 10 ** 17 + 300), limit=2000)
+
+    assert len(batches) > 1
+    assert all(len(batch) <= 2000 for batch in batches)
+    assert sum(batch.count('<@') for batch in batches) == 300
+    assert batches[1].startswith('🔔 **Demon** is today\'s boosted creature! (cont.)')
@@ -0,0 +1,86 @@
+import pytest
+
+from bot.wiki_parser import (
+    StreamingInfoboxReader, parse_infobox_html, parse_infobox_params, parse_infobox_wikitext, parse_number,
+    strip_wiki_markup
+)
+
+PAGE = """<html><head>
+<script>window.templates = "<aside class='portable-infobox'></aside>";</script>
+<style>.portable-infobox { float: right; }</style>
+</head><body>
+<p>Short note.</p>
+<aside class="portable-infobox pi-theme-creature">
+  <div data-source="hp"><h3>Health</h3><div>1,900</div></div>
+  <div data-source="exp"><h3>Experience</h3><div>2.100 (+/-)</div></div>
+  <div data-source="speed"><h3>Speed</h3><div>180</div></div>
+  <div data-source="loot"><h3>Loot</h3><div><a href="/wiki/Gold_Coin">Gold Coin</a>, <a href="/wiki/Dragon_Ham">Dragon Ham</a></div></div>
+</aside>
+<p>Dragon Lords are the more powerful relatives of dragons, breathing fire at anything near them.</p>
+<p>This paragraph should never be needed.</p>
+</body></html>"""
+
+
+@pytest.mark.parametrize('step', [1, 5, 64, 100000])
+def test_streaming_reader_handles_any_chunk_split(step):
+    reader = StreamingInfoboxReader()
+    raw = PAGE.encode('utf-8')
+    for start in range(0, len(raw), step):
+        if reader.feed(raw[start:start + step]):
+            break
+
+    result = reader.parser.result('Dragon Lord')
+    assert (result['hitpoints'], result['experience_points'], result['speed']) == (1900, 2100, 180)
+    assert [item['name'] for item in result['loot']] == ['Gold Coin', 'Dragon Ham']
+    assert result['description'].startswith('Dragon Lords are the more powerful')
+
+
+def test_reader_stops_once_everything_is_found():
+    reader = StreamingInfoboxReader()
+    page = PAGE.replace('</body>', '<p>' + 'x' * 100000 + '</p></body>').encode('utf-8')
+
+    finished_at = None
+    for start in range(0, len(page), 1024):
+        if reader.feed(page[start:start + 1024]):
+            finished_at = start
+            break
+
+    assert finished_at is not None and finished_at < 4096
+
+
+def test_multibyte_characters_split_across_chunks():
+    page = PAGE.replace('breathing fire', 'breathing fire — and ice').encode('utf-8')
+    reader = StreamingInfoboxReader()
+    for start in range(len(page)):
+        reader.feed(page[start:start + 1])
+
+    assert '— and ice' in reader.parser.result('Dragon Lord')['description']
+
+
+def test_page_without_infobox_gives_nothing():
+    assert parse_infobox_html('<html><body><p>Short.</p></body></html>', 'Nobody') is None
+
+
+def test_parse_number():
+    assert parse_number('1,900') == 1900
+    assert parse_number('2.500 (+/-)') == 2500
+    assert parse_number('unknown') is None
+
+
+def test_wikitext_params_survive_nested_templates_and_links():
+    wikitext = """{{Infobox Creature|List={{{1|}}}
+| name = Dragon Lord
+| hp = {{Hitpoints|1900}}
+| notes = Lives in [[Dragon Lair|lairs]].<ref>Source</ref>
+}}"""
+
+    params = parse_infobox_params(wikitext)
+    result = parse_infobox_wikitext(wikitext, 'Dragon Lord')
+
+    assert params['name'] == 'Dragon Lord'
+    assert result['description'] == 'Lives in lairs.'
+    assert strip_wiki_markup("'''[[Demon]]'''") == 'Demon'
+
+
+def test_wikitext_without_infobox_gives_nothing():
+    assert parse_infobox_wikitext("'''Demon''' may refer to:\n* [[Demon (Creature)]]", 'Demon') is None